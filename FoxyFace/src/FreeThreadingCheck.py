@@ -0,0 +1,49 @@
+import logging
+import sys
+import sysconfig
+
+_logger = logging.getLogger(__name__)
+
+
+class FreeThreadingCheck:
+    """
+    FoxyFace can run on a free-threaded (no-GIL) build of Python, the state shared between the stream threads is
+    guarded by locks or published as a single reference. An extension module that isn't marked as free-threading
+    safe enables the GIL again when it is imported, start Python with -X gil=0 or PYTHON_GIL=0 to keep it disabled.
+    """
+
+    @staticmethod
+    def is_free_threaded_build() -> bool:
+        return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+    @staticmethod
+    def is_gil_enabled() -> bool:
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)  # Python 3.13+
+        if is_gil_enabled is None:
+            return True
+
+        return is_gil_enabled()
+
+    @staticmethod
+    def get_state() -> str:
+        if not FreeThreadingCheck.is_free_threaded_build():
+            return "gil"
+
+        return "free-threaded, gil enabled" if FreeThreadingCheck.is_gil_enabled() else "free-threaded"
+
+    @staticmethod
+    def log_state() -> None:
+        """
+        Call after the stream modules have been imported, the GIL can only be enabled again by an import.
+        """
+
+        if not FreeThreadingCheck.is_free_threaded_build():
+            _logger.info("Python is built with the GIL")
+            return
+
+        if FreeThreadingCheck.is_gil_enabled():
+            _logger.warning("Python is free-threaded, but the GIL has been enabled, probably by an extension module "
+                            "that doesn't support free threading. Start with -X gil=0 or PYTHON_GIL=0 to disable it")
+            return
+
+        _logger.info("Python is free-threaded, the GIL is disabled")
@@ -1,6 +1,7 @@
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Lock
 from typing import Any, Callable
 
 from src.config.ConfigMigrationManager import ConfigMigrationManager
@@ -21,6 +22,8 @@ class ConfigManager:
 
         self.config: Config = Config()
 
+        # Listeners are created and removed by the UI and pipeline threads while the config thread calls them
+        self.__update_listeners_lock: Lock = Lock()
         self.__update_listeners: set[ConfigUpdateListener] = set[ConfigUpdateListener]()
 
     def load(self, wait: bool = False):
@@ -59,15 +62,14 @@ class ConfigManager:
                                call_on_create: bool = False) -> ConfigUpdateListener:
         listener = ConfigUpdateListener(self, update_callback, call_on_create, watched_elements)
 
-        self.__update_listeners.add(listener)
+        with self.__update_listeners_lock:
+            self.__update_listeners.add(listener)
 
         return listener
 
     def unregister_update_listener(self, listener: ConfigUpdateListener):
-        try:
-            self.__update_listeners.remove(listener)
-        except Exception:
-            pass
+        with self.__update_listeners_lock:
+            self.__update_listeners.discard(listener)
 
     def __enter__(self):
         return self
@@ -75,8 +77,12 @@ class ConfigManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    def __get_update_listeners(self) -> list[ConfigUpdateListener]:
+        with self.__update_listeners_lock:
+            return list(self.__update_listeners)
+
     def __read_task(self):
-        for listener in self.__update_listeners:
+        for listener in self.__get_update_listeners():
             listener.call_update()
 
         try:
@@ -113,7 +119,7 @@ class ConfigManager:
             self.__last_hash = hash(json_text)
 
             count = 0
-            for listener in self.__update_listeners:
+            for listener in self.__get_update_listeners():
                 if listener.call_update():
                     count += 1
 
@@ -7,7 +7,9 @@ from src.config.schemas.core.AutoRunConfig import AutoRunConfig
 from src.config.schemas.core.BabbleConfig import BabbleConfig
 from src.config.schemas.core.CameraConfig import CameraConfig
 from src.config.schemas.core.MediaPipeConfig import MediaPipeConfig
+from src.config.schemas.core.MetricsConfig import MetricsConfig
 from src.config.schemas.core.ProcessingConfig import ProcessingConfig
+from src.config.schemas.core.RecordingConfig import RecordingConfig
 from src.config.schemas.core.SocketConfig import SocketConfig
 from src.config.schemas.gui.GuiConfig import GuiConfig
 
@@ -24,3 +26,5 @@ class Config(JSONWizard):
     babble: BabbleConfig = field(default_factory=BabbleConfig)
     processing: ProcessingConfig = field(default_factory=ProcessingConfig)
     socket: SocketConfig = field(default_factory=SocketConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
+    recording: RecordingConfig = field(default_factory=RecordingConfig)
@@ -11,6 +11,11 @@ class BabbleConfig:
     device_id: int = 0
     intra_op_num_threads: int = 1
     allow_spinning: bool = False
+    # Runs the model in a separate process, the frames are exchanged through shared memory
+    use_worker_process: bool = False
+    # Frames processed by one inference, trades latency for throughput
+    max_batch_size: int = 1
+    batch_time_budget_ms: float = 10.0
 
     max_head_rotation_x: float = 30
     max_head_rotation_y: float = 50
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 
+from src.config.schemas.core.enums.FramePacingEnumConfig import FramePacingEnumConfig
+from src.config.schemas.core.enums.FrameSourceEnumConfig import FrameSourceEnumConfig
+
 
 @dataclass(slots=True)
 class CameraConfig:
@@ -10,3 +13,17 @@ class CameraConfig:
     mirror_x: bool = False
     mirror_y: bool = False
     rotate_ninety: bool = False
+
+    # Longest side of the frame given to MediaPipe, 0 keeps the camera resolution. Babble still crops the face from
+    # the frame of the camera resolution.
+    processing_size: int = 0
+
+    # Keep the JPEG data of MJPEG cameras and decode it only when needed, at a reduced scale for processing_size
+    mjpeg_passthrough: bool = False
+
+    # Offline sources for benchmarks and reproducing issues without a webcam
+    source: FrameSourceEnumConfig = FrameSourceEnumConfig.Camera
+    source_path: str = ""  # Video file, or a directory or glob of PNG/JPEG images
+    source_fps: float = 30.0  # Image sequence and synthetic sources, video files use their own frame rate
+    source_pacing: FramePacingEnumConfig = FramePacingEnumConfig.RealTime
+    source_loop: bool = True
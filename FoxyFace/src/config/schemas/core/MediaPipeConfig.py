@@ -14,3 +14,13 @@ class MediaPipeConfig:
     min_face_presence_confidence: float = 0.5
     min_tracking_confidence: float = 0.5
     frame_lost_timeout: float = 1.0
+    max_in_flight: int = 1
+
+    # Give MediaPipe only the region around the face of the previous frame
+    roi_tracking: bool = False
+    roi_scale: float = 2.0
+
+    enable_filter: bool = False
+    mincutoff: float = 3.0
+    beta: float = 0.9
+    dcutoff: float = 1.0
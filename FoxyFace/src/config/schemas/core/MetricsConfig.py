@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class MetricsConfig:
+    # Served on http://127.0.0.1:<port>/metrics
+    prometheus_enabled: bool = False
+    prometheus_port: int = 9464
+
+    # Appends the metrics to a CSV file, useful for long sessions
+    csv_enabled: bool = False
+    csv_path: str = "metrics.csv"
+    csv_interval: float = 5.0
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from src.config.schemas.core.enums.FramePacingEnumConfig import FramePacingEnumConfig
+
+
+@dataclass(slots=True)
+class RecordingConfig:
+    # Records the MediaPipe and Babble output to a new session directory in record_path
+    record_enabled: bool = False
+    record_path: str = "recordings"
+    record_landmarks: bool = False  # Also the face landmarks and the transformation matrix, about 6 KB per frame
+
+    # Replays a recorded session directory through the post-processing and the UDP output. The camera and Babble
+    # keep running but their frames are not used until the replay is stopped.
+    replay_path: str = ""
+    replay_pacing: FramePacingEnumConfig = FramePacingEnumConfig.RealTime
+    replay_loop: bool = False
+
+    # Saves the frames of every auto calibration to a time series file in this directory, empty to disable
+    calibration_capture_path: str = ""
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from src.config.schemas.core.enums.VrcftPacketFormatEnumConfig import VrcftPacketFormatEnumConfig
+
 
 @dataclass(slots=True)
 class SocketConfig:
@@ -8,3 +10,13 @@ class SocketConfig:
     auto_connect: bool = True
     udp_read_timeout: int = 2_500
     bypass_other_modules_block: bool = False
+
+    packet_format: VrcftPacketFormatEnumConfig = VrcftPacketFormatEnumConfig.Auto
+    quantize_values: bool = False
+    # Sends only changed expressions, requires the binary packet format
+    delta_encoding: bool = False
+    delta_epsilon: float = 0.001
+    keyframe_interval_ms: int = 1_000
+    static_packet_interval_ms: int = 100
+    # Announced by the VRCFT interface through auto connect, 0 if the interface supports only JSON
+    interface_binary_protocol_version: int = 0
@@ -0,0 +1,16 @@
+from enum import StrEnum, unique
+
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+
+
+@unique
+class FramePacingEnumConfig(StrEnum):
+    RealTime = FramePacingEnum.RealTime.name
+    AsFastAsPossible = FramePacingEnum.AsFastAsPossible.name
+
+    def to_original(self) -> FramePacingEnum:
+        return FramePacingEnum[self.name]
+
+    @staticmethod
+    def from_original(original: FramePacingEnum) -> 'FramePacingEnumConfig':
+        return FramePacingEnumConfig(original.name)
@@ -0,0 +1,18 @@
+from enum import StrEnum, unique
+
+from src.stream.camera.source.FrameSourceEnum import FrameSourceEnum
+
+
+@unique
+class FrameSourceEnumConfig(StrEnum):
+    Camera = FrameSourceEnum.Camera.name
+    VideoFile = FrameSourceEnum.VideoFile.name
+    ImageSequence = FrameSourceEnum.ImageSequence.name
+    Synthetic = FrameSourceEnum.Synthetic.name
+
+    def to_original(self) -> FrameSourceEnum:
+        return FrameSourceEnum[self.name]
+
+    @staticmethod
+    def from_original(original: FrameSourceEnum) -> 'FrameSourceEnumConfig':
+        return FrameSourceEnumConfig(original.name)
@@ -0,0 +1,17 @@
+from enum import StrEnum, unique
+
+from src.stream.vrcft.VrcftPacketFormatEnum import VrcftPacketFormatEnum
+
+
+@unique
+class VrcftPacketFormatEnumConfig(StrEnum):
+    Auto = VrcftPacketFormatEnum.Auto.name
+    Json = VrcftPacketFormatEnum.Json.name
+    Binary = VrcftPacketFormatEnum.Binary.name
+
+    def to_original(self) -> VrcftPacketFormatEnum:
+        return VrcftPacketFormatEnum[self.name]
+
+    @staticmethod
+    def from_original(original: VrcftPacketFormatEnum) -> 'VrcftPacketFormatEnumConfig':
+        return VrcftPacketFormatEnumConfig(original.name)
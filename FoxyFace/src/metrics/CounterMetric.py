@@ -0,0 +1,22 @@
+from src.metrics.CounterMetricSnapshot import CounterMetricSnapshot
+
+
+class CounterMetric:
+    """
+    Count of events since the start, e.g. dropped frames.
+
+    Must be written by a single thread, the count is a single reference that readers see without a lock.
+    """
+
+    def __init__(self):
+        self.__total_count: int = 0
+
+    @property
+    def total_count(self) -> int:
+        return self.__total_count
+
+    def increment(self, count: int = 1) -> None:
+        self.__total_count += count
+
+    def snapshot(self) -> CounterMetricSnapshot:
+        return CounterMetricSnapshot(self.__total_count)
@@ -0,0 +1,81 @@
+import csv
+import logging
+import time
+from pathlib import Path
+from threading import Event, Thread
+
+from src.metrics.CounterMetricSnapshot import CounterMetricSnapshot
+from src.metrics.FrameRateMetricSnapshot import FrameRateMetricSnapshot
+from src.metrics.MetricsRegistry import MetricsRegistry
+
+_logger = logging.getLogger(__name__)
+
+
+class CsvMetricsExporter:
+    """
+    Appends a row per metric to a CSV file every interval seconds. Frame rate metrics write the rate, jitter and
+    the interval distribution, latency metrics leave the rate and jitter columns empty, counters write only the
+    total.
+    """
+
+    HEADER: tuple[str, ...] = ("time", "metric", "total", "rate", "jitter_ms", "count", "mean_ms", "p50_ms", "p95_ms",
+                               "p99_ms", "max_ms")
+
+    def __init__(self, registry: MetricsRegistry, path: Path, interval: float):
+        self.__registry: MetricsRegistry = registry
+        self.__path: Path = path
+        self.__interval: float = interval
+
+        self.__close_event: Event = Event()
+        self.__thread: Thread = Thread(target=self.__loop, daemon=True, name="CSV Metrics Exporter")
+        self.__thread.start()
+
+    def close(self) -> None:
+        self.__close_event.set()
+
+        self.__thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def create_rows(registry: MetricsRegistry, timestamp: float) -> list[list]:
+        rows = []
+
+        for name, _, snapshot in registry.snapshot():
+            if isinstance(snapshot, CounterMetricSnapshot):
+                rows.append([timestamp, name, snapshot.total_count] + [""] * (len(CsvMetricsExporter.HEADER) - 3))
+                continue
+
+            if isinstance(snapshot, FrameRateMetricSnapshot):
+                window = snapshot.interval
+                row = [timestamp, name, snapshot.total_count, round(snapshot.rate, 3), round(snapshot.jitter_ms, 3)]
+            else:
+                window = snapshot.window
+                row = [timestamp, name, snapshot.total_count, "", ""]
+
+            row.extend([window.count, round(window.mean_ms, 3), round(window.p50_ms, 3), round(window.p95_ms, 3),
+                        round(window.p99_ms, 3), round(window.max_ms, 3)])
+            rows.append(row)
+
+        return rows
+
+    def __loop(self):
+        _logger.info(f"Writing metrics to {self.__path}")
+
+        while not self.__close_event.wait(self.__interval):
+            try:
+                write_header = not self.__path.exists() or self.__path.stat().st_size == 0
+
+                with self.__path.open("a", newline="", encoding="utf-8") as file:
+                    writer = csv.writer(file)
+
+                    if write_header:
+                        writer.writerow(CsvMetricsExporter.HEADER)
+
+                    writer.writerows(CsvMetricsExporter.create_rows(self.__registry, round(time.time(), 3)))
+            except Exception:
+                _logger.warning("Failed to write metrics", exc_info=True, stack_info=True)
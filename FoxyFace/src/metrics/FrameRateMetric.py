@@ -0,0 +1,87 @@
+import time
+
+from src.metrics.FrameRateMetricSnapshot import FrameRateMetricSnapshot
+from src.metrics.LatencyHistogram import LatencyHistogram
+from src.metrics.LatencySnapshot import LatencySnapshot
+
+
+class FrameRateMetric:
+    """
+    Frame rate as an exponentially weighted moving average of the frame intervals, the interval jitter as in
+    RFC 3550 and the interval distribution over tumbling windows.
+
+    Must be written by a single thread. Every mark publishes the rate state as one tuple and every window
+    publishes the interval distribution, so neither the writer nor the readers take a lock.
+    """
+
+    __RATE_GAIN: float = 1.0 / 8.0
+    __JITTER_GAIN: float = 1.0 / 16.0
+
+    def __init__(self, window: float = 1.0):
+        self.__window_ns: int = int(window * 1_000_000_000)
+
+        self.__histogram: LatencyHistogram = LatencyHistogram()
+        self.__window_start_ns: int | None = None
+
+        self.__total_count: int = 0
+        self.__last_time_ns: int | None = None
+        self.__last_interval_ns: int | None = None
+        self.__interval_ns: float = 0.0
+        self.__jitter_ns: float = 0.0
+
+        # (time of the last frame, mean interval, jitter, total count)
+        self.__published_rate: tuple[int | None, float, float, int] = (None, 0.0, 0.0, 0)
+        self.__published_interval: tuple[int | None, LatencySnapshot] = (None, LatencySnapshot.empty())
+
+    def mark(self, time_ns: int | None = None) -> None:
+        if time_ns is None:
+            time_ns = time.perf_counter_ns()
+
+        if self.__window_start_ns is None:
+            self.__window_start_ns = time_ns
+
+        self.__total_count += 1
+
+        if self.__last_time_ns is not None:
+            interval_ns = time_ns - self.__last_time_ns
+
+            if self.__last_interval_ns is None:
+                self.__interval_ns = float(interval_ns)
+            else:
+                self.__interval_ns += (interval_ns - self.__interval_ns) * FrameRateMetric.__RATE_GAIN
+                self.__jitter_ns += ((abs(interval_ns - self.__last_interval_ns) - self.__jitter_ns) *
+                                     FrameRateMetric.__JITTER_GAIN)
+
+            self.__histogram.add(interval_ns)
+            self.__last_interval_ns = interval_ns
+
+        self.__last_time_ns = time_ns
+        self.__published_rate = (time_ns, self.__interval_ns, self.__jitter_ns, self.__total_count)
+
+        if time_ns - self.__window_start_ns >= self.__window_ns:
+            self.__published_interval = (time_ns, LatencySnapshot.from_histogram(self.__histogram))
+            self.__histogram.clear()
+            self.__window_start_ns = time_ns
+
+    def snapshot(self, time_ns: int | None = None) -> FrameRateMetricSnapshot:
+        """
+        Returns:
+            The current state, the rate decays when the frames stop.
+        """
+
+        if time_ns is None:
+            time_ns = time.perf_counter_ns()
+
+        last_time_ns, interval_ns, jitter_ns, total_count = self.__published_rate
+        published_time_ns, interval = self.__published_interval
+
+        if published_time_ns is not None and time_ns - published_time_ns >= 2 * self.__window_ns:
+            interval = LatencySnapshot.empty()
+
+        if last_time_ns is None or interval_ns <= 0.0:
+            return FrameRateMetricSnapshot(total_count, 0.0, jitter_ns / 1_000_000, interval)
+
+        # Without new frames the time since the last frame is a lower bound of the current interval
+        interval_ns = max(interval_ns, float(time_ns - last_time_ns))
+
+        return FrameRateMetricSnapshot(total_count, 1_000_000_000 / interval_ns, jitter_ns / 1_000_000, interval)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from src.metrics.LatencySnapshot import LatencySnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class FrameRateMetricSnapshot:
+    total_count: int
+    rate: float  # Frames per second
+    jitter_ms: float  # Mean deviation of consecutive frame intervals
+    interval: LatencySnapshot  # Distribution of the frame intervals of the last complete window
@@ -0,0 +1,70 @@
+import math
+
+import numpy
+
+
+class LatencyHistogram:
+    """
+    Histogram with logarithmic buckets from 10 µs to 10 s, 8 buckets per power of two. Percentiles are accurate
+    to about 5%.
+
+    Not thread-safe.
+    """
+
+    __MIN_NS: int = 10_000
+    __BUCKETS_PER_OCTAVE: int = 8
+    __BUCKET_COUNT: int = 20 * __BUCKETS_PER_OCTAVE + 1  # 10 µs * 2^20 ~= 10 s, the last bucket is open
+
+    def __init__(self):
+        self.__counts = numpy.zeros(LatencyHistogram.__BUCKET_COUNT, dtype=numpy.int64)
+        self.__count: int = 0
+        self.__sum_ns: int = 0
+        self.__max_ns: int = 0
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    def add(self, value_ns: int) -> None:
+        if value_ns <= LatencyHistogram.__MIN_NS:
+            index = 0
+        else:
+            index = min(int(math.log2(value_ns / LatencyHistogram.__MIN_NS) * LatencyHistogram.__BUCKETS_PER_OCTAVE),
+                        LatencyHistogram.__BUCKET_COUNT - 1)
+
+        self.__counts[index] += 1
+        self.__count += 1
+        self.__sum_ns += value_ns
+        self.__max_ns = max(self.__max_ns, value_ns)
+
+    @property
+    def sum_ns(self) -> int:
+        return self.__sum_ns
+
+    def mean_ns(self) -> float:
+        return self.__sum_ns / self.__count if self.__count > 0 else 0.0
+
+    def max_ns(self) -> int:
+        return self.__max_ns
+
+    def percentile_ns(self, percentile: float) -> float:
+        """
+        Returns:
+            Upper bound of the bucket that contains the percentile, 0 if the histogram is empty.
+        """
+
+        if self.__count == 0:
+            return 0.0
+
+        rank = math.ceil(self.__count * percentile / 100.0)
+        index = int(numpy.searchsorted(numpy.cumsum(self.__counts), max(rank, 1)))
+
+        upper_bound = LatencyHistogram.__MIN_NS * 2.0 ** ((index + 1) / LatencyHistogram.__BUCKETS_PER_OCTAVE)
+
+        return min(upper_bound, float(self.__max_ns))
+
+    def clear(self) -> None:
+        self.__counts[:] = 0
+        self.__count = 0
+        self.__sum_ns = 0
+        self.__max_ns = 0
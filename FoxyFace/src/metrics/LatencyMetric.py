@@ -0,0 +1,58 @@
+import time
+
+from src.metrics.LatencyHistogram import LatencyHistogram
+from src.metrics.LatencyMetricSnapshot import LatencyMetricSnapshot
+from src.metrics.LatencySnapshot import LatencySnapshot
+
+
+class LatencyMetric:
+    """
+    Latency distribution over tumbling windows.
+
+    Must be written by a single thread. The writer publishes an immutable snapshot at the end of every window, so
+    neither the writer nor the readers take a lock.
+    """
+
+    def __init__(self, window: float = 1.0):
+        self.__window_ns: int = int(window * 1_000_000_000)
+
+        self.__histogram: LatencyHistogram = LatencyHistogram()
+        self.__window_start_ns: int | None = None
+        self.__total_count: int = 0
+        self.__total_ns: int = 0
+
+        self.__published: tuple[int | None, LatencyMetricSnapshot] = (
+            None, LatencyMetricSnapshot(0, 0.0, LatencySnapshot.empty()))
+
+    def record(self, value_ns: int, time_ns: int | None = None) -> None:
+        if time_ns is None:
+            time_ns = time.perf_counter_ns()
+
+        if self.__window_start_ns is None:
+            self.__window_start_ns = time_ns
+
+        self.__histogram.add(value_ns)
+        self.__total_count += 1
+        self.__total_ns += value_ns
+
+        if time_ns - self.__window_start_ns >= self.__window_ns:
+            self.__published = (time_ns, LatencyMetricSnapshot(self.__total_count, self.__total_ns / 1_000_000_000,
+                                                               LatencySnapshot.from_histogram(self.__histogram)))
+            self.__histogram.clear()
+            self.__window_start_ns = time_ns
+
+    def snapshot(self, time_ns: int | None = None) -> LatencyMetricSnapshot:
+        """
+        Returns:
+            The last published snapshot, the window is empty if nothing was recorded for two windows.
+        """
+
+        if time_ns is None:
+            time_ns = time.perf_counter_ns()
+
+        published_time_ns, snapshot = self.__published
+
+        if published_time_ns is not None and time_ns - published_time_ns >= 2 * self.__window_ns:
+            return LatencyMetricSnapshot(snapshot.total_count, snapshot.total_seconds, LatencySnapshot.empty())
+
+        return snapshot
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from src.metrics.LatencySnapshot import LatencySnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyMetricSnapshot:
+    total_count: int
+    total_seconds: float
+    window: LatencySnapshot  # Distribution of the last complete window
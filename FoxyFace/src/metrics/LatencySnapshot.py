@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from src.metrics.LatencyHistogram import LatencyHistogram
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySnapshot:
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @staticmethod
+    def empty() -> "LatencySnapshot":
+        return LatencySnapshot(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    @staticmethod
+    def from_histogram(histogram: LatencyHistogram) -> "LatencySnapshot":
+        return LatencySnapshot(histogram.count, histogram.mean_ns() / 1_000_000,
+                               histogram.percentile_ns(50.0) / 1_000_000, histogram.percentile_ns(95.0) / 1_000_000,
+                               histogram.percentile_ns(99.0) / 1_000_000, histogram.max_ns() / 1_000_000)
@@ -0,0 +1,45 @@
+from threading import Lock
+
+from src.metrics.CounterMetric import CounterMetric
+from src.metrics.CounterMetricSnapshot import CounterMetricSnapshot
+from src.metrics.FrameRateMetric import FrameRateMetric
+from src.metrics.FrameRateMetricSnapshot import FrameRateMetricSnapshot
+from src.metrics.LatencyMetric import LatencyMetric
+from src.metrics.LatencyMetricSnapshot import LatencyMetricSnapshot
+
+
+class MetricsRegistry:
+    """
+    Named metrics of all pipelines. Registration replaces the whole dict, so reading the metrics doesn't take a lock.
+    """
+
+    def __init__(self):
+        self.__metrics: dict[str, tuple[str, LatencyMetric | FrameRateMetric | CounterMetric]] = dict[
+            str, tuple[str, LatencyMetric | FrameRateMetric | CounterMetric]]()
+        self.__lock: Lock = Lock()
+
+    def register(self, name: str, description: str, metric: LatencyMetric | FrameRateMetric | CounterMetric) -> None:
+        """
+        Args:
+            name: Lowercase snake case, used as a part of the exported names.
+        """
+
+        with self.__lock:
+            metrics = dict(self.__metrics)
+            metrics[name] = (description, metric)
+            self.__metrics = metrics
+
+    def unregister(self, name: str) -> None:
+        with self.__lock:
+            metrics = dict(self.__metrics)
+            metrics.pop(name, None)
+            self.__metrics = metrics
+
+    def snapshot(self) -> list[
+        tuple[str, str, LatencyMetricSnapshot | FrameRateMetricSnapshot | CounterMetricSnapshot]]:
+        """
+        Returns:
+            Name, description and snapshot of every metric in registration order.
+        """
+
+        return [(name, description, metric.snapshot()) for name, (description, metric) in self.__metrics.items()]
@@ -0,0 +1,113 @@
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from src.metrics.CounterMetricSnapshot import CounterMetricSnapshot
+from src.metrics.FrameRateMetricSnapshot import FrameRateMetricSnapshot
+from src.metrics.LatencySnapshot import LatencySnapshot
+from src.metrics.MetricsRegistry import MetricsRegistry
+
+_logger = logging.getLogger(__name__)
+
+
+class PrometheusMetricsExporter:
+    """
+    Serves the metrics of the registry in the Prometheus text format on http://127.0.0.1:<port>/metrics.
+
+    Latencies and frame intervals are exported as summaries, the quantiles are taken from the last window.
+    """
+
+    PREFIX: str = "foxyface_"
+
+    def __init__(self, registry: MetricsRegistry, port: int):
+        self.__registry: MetricsRegistry = registry
+
+        self.__server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", port), self.__create_handler())
+        self.__server.daemon_threads = True
+
+        self.__thread: Thread = Thread(target=self.__server.serve_forever, daemon=True,
+                                       name="Prometheus Metrics Exporter")
+        self.__thread.start()
+
+        _logger.info(f"Serving metrics on http://127.0.0.1:{port}/metrics")
+
+    def close(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+        self.__thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def format(registry: MetricsRegistry) -> str:
+        lines = []
+
+        for name, description, snapshot in registry.snapshot():
+            metric_name = PrometheusMetricsExporter.PREFIX + name
+
+            if isinstance(snapshot, CounterMetricSnapshot):
+                PrometheusMetricsExporter.__append(lines, f"{metric_name}_total", "counter", description,
+                                                   snapshot.total_count)
+            elif isinstance(snapshot, FrameRateMetricSnapshot):
+                PrometheusMetricsExporter.__append(lines, f"{metric_name}_total", "counter", description,
+                                                   snapshot.total_count)
+                PrometheusMetricsExporter.__append(lines, f"{metric_name}_per_second", "gauge",
+                                                   f"{description}, moving average rate", snapshot.rate)
+                PrometheusMetricsExporter.__append(lines, f"{metric_name}_jitter_seconds", "gauge",
+                                                   f"{description}, interval jitter", snapshot.jitter_ms / 1_000)
+                PrometheusMetricsExporter.__append_summary(lines, f"{metric_name}_interval_seconds",
+                                                           f"{description}, interval between frames",
+                                                           snapshot.interval, None)
+            else:
+                PrometheusMetricsExporter.__append_summary(lines, f"{metric_name}_seconds", description,
+                                                           snapshot.window,
+                                                           (snapshot.total_count, snapshot.total_seconds))
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __append(lines: list[str], name: str, metric_type: str, description: str, value: float) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.append(f"{name} {value}")
+
+    @staticmethod
+    def __append_summary(lines: list[str], name: str, description: str, window: LatencySnapshot,
+                         totals: tuple[int, float] | None) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} summary")
+
+        for quantile, value_ms in (("0.5", window.p50_ms), ("0.95", window.p95_ms), ("0.99", window.p99_ms),
+                                   ("1", window.max_ms)):
+            lines.append(f'{name}{{quantile="{quantile}"}} {value_ms / 1_000}')
+
+        if totals is not None:
+            lines.append(f"{name}_count {totals[0]}")
+            lines.append(f"{name}_sum {totals[1]}")
+
+    def __create_handler(self) -> type[BaseHTTPRequestHandler]:
+        registry = self.__registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = PrometheusMetricsExporter.format(registry).encode("utf-8")
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                _logger.debug(format % args)
+
+        return Handler
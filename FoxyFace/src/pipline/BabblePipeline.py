@@ -4,18 +4,21 @@ from typing import Any, Callable
 from src.config.ConfigManager import ConfigManager
 from src.config.ConfigUpdateListener import ConfigUpdateListener
 from src.config.schemas.Config import Config
+from src.metrics.FrameRateMetric import FrameRateMetric
+from src.metrics.LatencyMetric import LatencyMetric
 from src.pipline.MediaPipePipeline import MediaPipePipeline
 from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
 from src.stream.babble.BabbleModelLoader import BabbleModelLoader
 from src.stream.babble.BabbleStream import BabbleStream
+from src.stream.babble.BabbleStreamOptions import BabbleStreamOptions
 from src.stream.babble.imageprocessing.BabbleImageProcessing import BabbleImageProcessing
 from src.stream.babble.imageprocessing.BabbleImageProcessingOptions import BabbleImageProcessingOptions
 from src.stream.babble.imageprocessing.BabblePreview import BabblePreview
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
-from src.stream.core.components.SingleBufferStream import SingleBufferStream
+from src.stream.core.components.EventBufferStream import EventBufferStream
 from src.stream.core.components.WriteCpsCounter import WriteCpsCounter
 from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.filter.BlendShapesOneEuroFilterOptions import BlendShapesOneEuroFilterOptions
 from src.stream.ui.BlendShapesFrameLatency import BlendShapesFrameLatency
 
@@ -28,7 +31,7 @@ class BabblePipeline:
         self.__processing_options = BabbleImageProcessingOptions()
         self.__processing_options_listener: ConfigUpdateListener = self.__register_change_processing_options()
 
-        self.__buffer = SingleBufferStream[MediaPipeFrame]()
+        self.__buffer = EventBufferStream[MediaPipeFrame]()
         self.__media_pipe_pipeline.register_stream(self.__buffer)
 
         self.__enabled_listener: ConfigUpdateListener = self.__register_change_enabled()
@@ -36,8 +39,11 @@ class BabblePipeline:
         self.__babble_loader = BabbleModelLoader()
         self.__babble_loader_options_listener: ConfigUpdateListener = self.__register_change_babble_loader_options()
 
+        self.__stream_options = BabbleStreamOptions()
+        self.__stream_options_listener: ConfigUpdateListener = self.__register_change_stream_options()
+
         processed_stream = BabbleImageProcessing(self.__buffer, self.__processing_options, self.__babble_loader)
-        self.__stream = BabbleStream(processed_stream, 1.0, self.__babble_loader)
+        self.__stream = BabbleStream(processed_stream, 1.0, self.__babble_loader, self.__stream_options)
 
         self.__filter_processing_options = BlendShapesOneEuroFilterOptions()
         self.__filter_processing_options_listener: ConfigUpdateListener = self.__register_change_filter_processing_options()
@@ -50,10 +56,10 @@ class BabblePipeline:
 
         self.__preview_window: BabblePreview | None = None
 
-    def register_stream(self, stream: StreamWriteOnly[BlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
+    def register_stream(self, stream: StreamWriteOnly[DenseBlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
         self.__stream.register_stream(stream)
 
-    def unregister_stream(self, stream: StreamWriteOnly[BlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
+    def unregister_stream(self, stream: StreamWriteOnly[DenseBlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
         self.__stream.unregister_stream(stream)
 
     def trigger_view_preview(self):
@@ -72,6 +78,12 @@ class BabblePipeline:
     def get_latency(self):
         return self.__latency_counter.get_latency()
 
+    def get_fps_metric(self) -> FrameRateMetric:
+        return self.__fps_counter.metric
+
+    def get_latency_metric(self) -> LatencyMetric:
+        return self.__latency_counter.metric
+
     def get_model_loader(self) -> BabbleModelLoader:
         return self.__babble_loader
 
@@ -87,9 +99,11 @@ class BabblePipeline:
 
         self.__processing_options_listener.unregister()
         self.__babble_loader_options_listener.unregister()
+        self.__stream_options_listener.unregister()
         self.__filter_processing_options_listener.unregister()
 
         self.__stream.close()
+        self.__babble_loader.close()
 
     def __enter__(self):
         return self
@@ -107,6 +121,16 @@ class BabblePipeline:
         self.__processing_options.max_head_rotation_x = math.radians(config_manager.config.babble.max_head_rotation_x)
         self.__processing_options.max_head_rotation_y = math.radians(config_manager.config.babble.max_head_rotation_y)
 
+    def __register_change_stream_options(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.babble.max_batch_size,
+                                                      lambda config: config.babble.batch_time_budget_ms]
+
+        return self.__config_manager.create_update_listener(self.__update_stream_options, watch_array, True)
+
+    def __update_stream_options(self, config_manager: ConfigManager):
+        self.__stream_options.max_batch_size = max(config_manager.config.babble.max_batch_size, 1)
+        self.__stream_options.batch_time_budget = config_manager.config.babble.batch_time_budget_ms / 1000.0
+
     def __register_change_filter_processing_options(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.babble.mincutoff,
                                                       lambda config: config.babble.beta,
@@ -135,7 +159,8 @@ class BabblePipeline:
                                                       lambda config: config.babble.try_use_gpu,
                                                       lambda config: config.babble.intra_op_num_threads,
                                                       lambda config: config.babble.allow_spinning,
-                                                      lambda config: config.babble.device_id]
+                                                      lambda config: config.babble.device_id,
+                                                      lambda config: config.babble.use_worker_process]
 
         return self.__config_manager.create_update_listener(self.__update_babble_loader_options, watch_array, True)
 
@@ -144,4 +169,5 @@ class BabblePipeline:
                                                config_manager.config.babble.try_use_gpu,
                                                config_manager.config.babble.intra_op_num_threads,
                                                config_manager.config.babble.allow_spinning,
-                                               config_manager.config.babble.device_id)
+                                               config_manager.config.babble.device_id,
+                                               config_manager.config.babble.use_worker_process)
@@ -4,10 +4,17 @@ from typing import Any, Callable
 from src.config.ConfigManager import ConfigManager
 from src.config.ConfigUpdateListener import ConfigUpdateListener
 from src.config.schemas.Config import Config
+from src.metrics.CounterMetric import CounterMetric
+from src.metrics.FrameRateMetric import FrameRateMetric
 from src.stream.camera.CameraFrame import CameraFrame
 from src.stream.camera.CameraPreview import CameraPreview
 from src.stream.camera.CameraProcessingOption import CameraProcessingOption
 from src.stream.camera.CameraStream import CameraStream
+from src.stream.camera.source.FrameSource import FrameSource
+from src.stream.camera.source.FrameSourceEnum import FrameSourceEnum
+from src.stream.camera.source.ImageSequenceFrameSource import ImageSequenceFrameSource
+from src.stream.camera.source.SyntheticFrameSource import SyntheticFrameSource
+from src.stream.camera.source.VideoFileFrameSource import VideoFileFrameSource
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
 from src.stream.core.components.WriteCpsCounter import WriteCpsCounter
 
@@ -47,6 +54,18 @@ class CameraPipeline:
     def get_fps(self):
         return self.__fps_counter.get_cps()
 
+    def get_fps_metric(self) -> FrameRateMetric:
+        return self.__fps_counter.metric
+
+    def get_dropped_frames_metric(self) -> CounterMetric:
+        return self.__stream.capture_monitor.dropped
+
+    def get_duplicated_frames_metric(self) -> CounterMetric:
+        return self.__stream.capture_monitor.duplicated
+
+    def get_late_frames_metric(self) -> CounterMetric:
+        return self.__stream.capture_monitor.late
+
     def close(self):
         if self.__preview_window is not None:
             self.__preview_window.close()
@@ -67,7 +86,8 @@ class CameraPipeline:
     def __register_change_processing_options(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.camera.mirror_x,
                                                       lambda config: config.camera.mirror_y,
-                                                      lambda config: config.camera.rotate_ninety]
+                                                      lambda config: config.camera.rotate_ninety,
+                                                      lambda config: config.camera.processing_size]
 
         return self.__config_manager.create_update_listener(self.__update_processing_options, watch_array, True)
 
@@ -75,20 +95,50 @@ class CameraPipeline:
         self.__processing_options.mirror_x = config_manager.config.camera.mirror_x
         self.__processing_options.mirror_y = config_manager.config.camera.mirror_y
         self.__processing_options.rotate_ninety = config_manager.config.camera.rotate_ninety
+        self.__processing_options.max_size = max(0, config_manager.config.camera.processing_size)
 
     def __register_change_camera_options(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.camera.width,
                                                       lambda config: config.camera.height,
                                                       lambda config: config.camera.camera_id,
-                                                      lambda config: config.camera.camera_name]
+                                                      lambda config: config.camera.camera_name,
+                                                      lambda config: config.camera.mjpeg_passthrough,
+                                                      lambda config: config.camera.source,
+                                                      lambda config: config.camera.source_path,
+                                                      lambda config: config.camera.source_fps,
+                                                      lambda config: config.camera.source_pacing,
+                                                      lambda config: config.camera.source_loop]
 
         return self.__config_manager.create_update_listener(self.__update_camera_options, watch_array, True)
 
     def __update_camera_options(self, config_manager: ConfigManager):
         try:
-            self.__stream.start_new_camera(config_manager.config.camera.camera_id,
-                                           (config_manager.config.camera.width // 2) * 2,
-                                           (config_manager.config.camera.height // 2) * 2,
-                                           config_manager.config.camera.camera_name)
+            if config_manager.config.camera.source.to_original() == FrameSourceEnum.Camera:
+                self.__stream.start_new_camera(config_manager.config.camera.camera_id,
+                                               (config_manager.config.camera.width // 2) * 2,
+                                               (config_manager.config.camera.height // 2) * 2,
+                                               config_manager.config.camera.camera_name,
+                                               config_manager.config.camera.mjpeg_passthrough)
+            else:
+                self.__stream.start_new_source(CameraPipeline.__create_offline_source(config_manager))
         except Exception:
             _logger.warning("Failed to recreate camera", exc_info=True, stack_info=True)
+
+    @staticmethod
+    def __create_offline_source(config_manager: ConfigManager) -> FrameSource:
+        camera_config = config_manager.config.camera
+        pacing = camera_config.source_pacing.to_original()
+
+        source = camera_config.source.to_original()
+
+        if source == FrameSourceEnum.VideoFile:
+            return VideoFileFrameSource(camera_config.source_path, pacing, camera_config.source_loop,
+                                        camera_config.source_fps)
+        if source == FrameSourceEnum.ImageSequence:
+            return ImageSequenceFrameSource(camera_config.source_path, camera_config.source_fps, pacing,
+                                            camera_config.source_loop)
+        if source == FrameSourceEnum.Synthetic:
+            return SyntheticFrameSource((camera_config.width // 2) * 2, (camera_config.height // 2) * 2,
+                                        camera_config.source_fps, pacing)
+
+        raise ValueError(f"Unsupported frame source: {camera_config.source}")
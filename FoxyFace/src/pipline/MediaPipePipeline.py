@@ -7,16 +7,19 @@ from AppConstants import AppConstants
 from src.config.ConfigManager import ConfigManager
 from src.config.ConfigUpdateListener import ConfigUpdateListener
 from src.config.schemas.Config import Config
+from src.metrics.FrameRateMetric import FrameRateMetric
+from src.metrics.LatencyMetric import LatencyMetric
 from src.pipline.CameraPipeline import CameraPipeline
 from src.stream.camera.CameraFrame import CameraFrame
 from src.stream.camera.CameraProcessing import CameraProcessing
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
-from src.stream.core.components.SingleBufferStream import SingleBufferStream
+from src.stream.core.components.EventBufferStream import EventBufferStream
 from src.stream.core.components.WriteCpsCounter import WriteCpsCounter
 from src.stream.mediapipe.MediaPipeProcessingOptions import MediaPipeProcessingOptions
 from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
 from src.stream.mediapipe.core.MediaPipePreview import MediaPipePreview
 from src.stream.mediapipe.core.MediaPipeStream import MediaPipeStream
+from src.stream.postprocessing.filter.BlendShapesOneEuroFilterOptions import BlendShapesOneEuroFilterOptions
 from src.stream.ui.BlendShapesFrameLatency import BlendShapesFrameLatency
 
 _logger = logging.getLogger(__name__)
@@ -27,7 +30,7 @@ class MediaPipePipeline:
         self.__config_manager = config_manager
         self.__camera_pipeline = camera_pipeline
 
-        self.__buffer = SingleBufferStream[CameraFrame]()
+        self.__buffer = EventBufferStream[CameraFrame]()
         self.__camera_pipeline.register_stream(self.__buffer)
         processed_stream = CameraProcessing(self.__buffer, self.__camera_pipeline.get_processing_options())
 
@@ -36,11 +39,17 @@ class MediaPipePipeline:
                                                          min_face_presence_confidence=self.__config_manager.config.media_pipe.min_face_presence_confidence,
                                                          min_tracking_confidence=self.__config_manager.config.media_pipe.min_tracking_confidence,
                                                          frame_lost_timeout=self.__config_manager.config.media_pipe.frame_lost_timeout,
-                                                         try_use_gpu=self.__config_manager.config.media_pipe.try_use_gpu)
+                                                         try_use_gpu=self.__config_manager.config.media_pipe.try_use_gpu,
+                                                         max_in_flight=max(1, self.__config_manager.config.media_pipe.max_in_flight))
 
         self.__processing_options = MediaPipeProcessingOptions()
         self.__processing_options_listener: ConfigUpdateListener = self.__register_change_processing_options()
         self.__fps_limit_listener: ConfigUpdateListener = self.__register_change_fps_limit()
+        self.__max_in_flight_listener: ConfigUpdateListener = self.__register_change_max_in_flight()
+        self.__roi_tracking_listener: ConfigUpdateListener = self.__register_change_roi_tracking()
+
+        self.__filter_processing_options = BlendShapesOneEuroFilterOptions()
+        self.__filter_processing_options_listener: ConfigUpdateListener = self.__register_change_filter_processing_options()
 
         self.__fps_counter = WriteCpsCounter()
         self.__stream.register_stream(self.__fps_counter)
@@ -65,12 +74,21 @@ class MediaPipePipeline:
     def get_processing_options(self) -> MediaPipeProcessingOptions:
         return self.__processing_options
 
+    def get_filter_processing_options(self) -> BlendShapesOneEuroFilterOptions:
+        return self.__filter_processing_options
+
     def get_fps(self):
         return self.__fps_counter.get_cps()
 
     def get_latency(self):
         return self.__latency_counter.get_latency()
 
+    def get_fps_metric(self) -> FrameRateMetric:
+        return self.__fps_counter.metric
+
+    def get_latency_metric(self) -> LatencyMetric:
+        return self.__latency_counter.metric
+
     def close(self):
         if self.__preview_window is not None:
             self.__preview_window.close()
@@ -81,6 +99,9 @@ class MediaPipePipeline:
         self.__stream.unregister_stream(self.__latency_counter)
 
         self.__fps_limit_listener.unregister()
+        self.__max_in_flight_listener.unregister()
+        self.__roi_tracking_listener.unregister()
+        self.__filter_processing_options_listener.unregister()
         self.__processing_options_listener.unregister()
 
         self.__stream.close()
@@ -119,6 +140,41 @@ class MediaPipePipeline:
         else:
             self.__stream.set_fps_limit(None)
 
+    def __register_change_max_in_flight(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.media_pipe.max_in_flight]
+
+        return self.__config_manager.create_update_listener(self.__update_max_in_flight, watch_array, False)
+
+    def __update_max_in_flight(self, config_manager: ConfigManager):
+        self.__stream.set_max_in_flight(max(1, config_manager.config.media_pipe.max_in_flight))
+
+    def __register_change_roi_tracking(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.media_pipe.roi_tracking,
+                                                      lambda config: config.media_pipe.roi_scale]
+
+        return self.__config_manager.create_update_listener(self.__update_roi_tracking, watch_array, True)
+
+    def __update_roi_tracking(self, config_manager: ConfigManager):
+        try:
+            self.__stream.set_roi_tracking(config_manager.config.media_pipe.roi_tracking,
+                                           config_manager.config.media_pipe.roi_scale)
+        except Exception:
+            _logger.warning("Failed to update ROI tracking", exc_info=True, stack_info=True)
+
+    def __register_change_filter_processing_options(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.media_pipe.enable_filter,
+                                                      lambda config: config.media_pipe.mincutoff,
+                                                      lambda config: config.media_pipe.beta,
+                                                      lambda config: config.media_pipe.dcutoff]
+
+        return self.__config_manager.create_update_listener(self.__update_filter_processing_options, watch_array, True)
+
+    def __update_filter_processing_options(self, config_manager: ConfigManager):
+        self.__filter_processing_options.mincutoff = config_manager.config.media_pipe.mincutoff
+        self.__filter_processing_options.beta = config_manager.config.media_pipe.beta
+        self.__filter_processing_options.dcutoff = config_manager.config.media_pipe.dcutoff
+        self.__filter_processing_options.enabled = config_manager.config.media_pipe.enable_filter
+
     @staticmethod
     def __read_media_pipe_model() -> bytes:
         return (AppConstants.get_application_root() / 'Assets' / 'face_landmarker.task').read_bytes()
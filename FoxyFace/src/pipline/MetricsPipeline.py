@@ -0,0 +1,104 @@
+import logging
+from pathlib import Path
+from typing import Any, Callable
+
+from src.config.ConfigManager import ConfigManager
+from src.config.ConfigUpdateListener import ConfigUpdateListener
+from src.config.schemas.Config import Config
+from src.metrics.CsvMetricsExporter import CsvMetricsExporter
+from src.metrics.MetricsRegistry import MetricsRegistry
+from src.metrics.PrometheusMetricsExporter import PrometheusMetricsExporter
+from src.pipline.BabblePipeline import BabblePipeline
+from src.pipline.CameraPipeline import CameraPipeline
+from src.pipline.MediaPipePipeline import MediaPipePipeline
+from src.pipline.UdpPipeline import UdpPipeline
+
+_logger = logging.getLogger(__name__)
+
+
+class MetricsPipeline:
+    def __init__(self, config_manager: ConfigManager, camera_pipeline: CameraPipeline,
+                 media_pipe_pipeline: MediaPipePipeline, babble_pipeline: BabblePipeline, udp_pipeline: UdpPipeline):
+        self.__config_manager = config_manager
+
+        self.__registry = MetricsRegistry()
+        self.__registry.register("camera_frames", "Camera frames", camera_pipeline.get_fps_metric())
+        self.__registry.register("camera_dropped_frames", "Old camera frames skipped to get a fresher frame",
+                                 camera_pipeline.get_dropped_frames_metric())
+        self.__registry.register("camera_duplicated_frames", "Camera frames equal to the previous frame",
+                                 camera_pipeline.get_duplicated_frames_metric())
+        self.__registry.register("camera_late_frames", "Camera frames that came later than expected",
+                                 camera_pipeline.get_late_frames_metric())
+        self.__registry.register("mediapipe_frames", "MediaPipe frames", media_pipe_pipeline.get_fps_metric())
+        self.__registry.register("mediapipe_latency", "Latency from the camera frame to the MediaPipe result",
+                                 media_pipe_pipeline.get_latency_metric())
+        self.__registry.register("babble_frames", "Babble frames", babble_pipeline.get_fps_metric())
+        self.__registry.register("babble_latency", "Latency from the camera frame to the Babble result",
+                                 babble_pipeline.get_latency_metric())
+        self.__registry.register("udp_packets", "UDP packets sent to VRCFT", udp_pipeline.get_packet_metric())
+
+        self.__prometheus_exporter: PrometheusMetricsExporter | None = None
+        self.__csv_exporter: CsvMetricsExporter | None = None
+
+        self.__prometheus_listener: ConfigUpdateListener = self.__register_change_prometheus()
+        self.__csv_listener: ConfigUpdateListener = self.__register_change_csv()
+
+    def get_registry(self) -> MetricsRegistry:
+        return self.__registry
+
+    def close(self):
+        self.__prometheus_listener.unregister()
+        self.__csv_listener.unregister()
+
+        self.__stop_prometheus()
+        self.__stop_csv()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __register_change_prometheus(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.metrics.prometheus_enabled,
+                                                      lambda config: config.metrics.prometheus_port]
+
+        return self.__config_manager.create_update_listener(self.__update_prometheus, watch_array, True)
+
+    def __update_prometheus(self, config_manager: ConfigManager):
+        self.__stop_prometheus()
+
+        if not config_manager.config.metrics.prometheus_enabled:
+            return
+
+        try:
+            self.__prometheus_exporter = PrometheusMetricsExporter(self.__registry,
+                                                                   config_manager.config.metrics.prometheus_port)
+        except Exception:
+            _logger.warning("Failed to start Prometheus metrics exporter", exc_info=True, stack_info=True)
+
+    def __stop_prometheus(self):
+        if self.__prometheus_exporter is not None:
+            self.__prometheus_exporter.close()
+            self.__prometheus_exporter = None
+
+    def __register_change_csv(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.metrics.csv_enabled,
+                                                      lambda config: config.metrics.csv_path,
+                                                      lambda config: config.metrics.csv_interval]
+
+        return self.__config_manager.create_update_listener(self.__update_csv, watch_array, True)
+
+    def __update_csv(self, config_manager: ConfigManager):
+        self.__stop_csv()
+
+        if not config_manager.config.metrics.csv_enabled:
+            return
+
+        self.__csv_exporter = CsvMetricsExporter(self.__registry, Path(config_manager.config.metrics.csv_path),
+                                                 max(0.1, config_manager.config.metrics.csv_interval))
+
+    def __stop_csv(self):
+        if self.__csv_exporter is not None:
+            self.__csv_exporter.close()
+            self.__csv_exporter = None
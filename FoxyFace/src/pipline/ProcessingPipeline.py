@@ -1,3 +1,4 @@
+from threading import Lock
 from typing import Any, Callable
 
 from src.config.ConfigManager import ConfigManager
@@ -7,12 +8,14 @@ from src.pipline.BabblePipeline import BabblePipeline
 from src.pipline.MediaPipePipeline import MediaPipePipeline
 from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
 from src.stream.core.StreamReadOnly import StreamReadOnly
-from src.stream.core.components.BufferStream import BufferStream
+from src.stream.core.StreamWriteOnly import StreamWriteOnly
+from src.stream.core.components.EventBufferStream import EventBufferStream
 from src.stream.core.components.SingleReadStreamSplitter import SingleReadStreamSplitter
 from src.stream.mediapipe.MediaPipeBlendShapeEnum import MediaPipeBlendShapeEnum
 from src.stream.mediapipe.MediaPipeProcessing import MediaPipeProcessing
+from src.stream.postprocessing.BlendShapeFreshness import BlendShapeFreshness
 from src.stream.postprocessing.BlendShapeTimedBuffer import BlendShapeTimedBuffer
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
 from src.stream.postprocessing.ValidateGeneralBlendShapes import ValidateGeneralBlendShapes
 from src.stream.postprocessing.calibration.CalibrateProcessing import CalibrateProcessing
@@ -29,9 +32,11 @@ class ProcessingPipeline:
         self.__media_pipe_pipeline = media_pipe_pipeline
         self.__babble_pipeline = babble_pipeline
 
-        self.__buffer = BufferStream[BlendShapesFrame[MediaPipeBlendShapeEnum | BabbleBlendShapeEnum]](16)
+        self.__buffer = EventBufferStream[DenseBlendShapesFrame[MediaPipeBlendShapeEnum | BabbleBlendShapeEnum]](16)
 
-        self.__media_pipe_stream = MediaPipeProcessing(self.__buffer,
+        self.__media_pipe_filter = BlendShapesOneEuroFilter[MediaPipeBlendShapeEnum](self.__buffer,
+                                                                                     self.__media_pipe_pipeline.get_filter_processing_options())
+        self.__media_pipe_stream = MediaPipeProcessing(self.__media_pipe_filter,
                                                        self.__media_pipe_pipeline.get_processing_options())
         self.__media_pipe_pipeline.register_stream(self.__media_pipe_stream)
 
@@ -39,7 +44,8 @@ class ProcessingPipeline:
                                                                               self.__babble_pipeline.get_filter_processing_options())
         self.__babble_pipeline.register_stream(self.__babble_stream)
 
-        self.__restart_filter_listener: ConfigUpdateListener = self.__register_restart_filter()
+        self.__replay_lock: Lock = Lock()
+        self.__replay_attached: bool = False
 
         self.__mixer_options = MixerProcessingOptions()
         self.__mixer_options_listener: ConfigUpdateListener = self.__register_change_mixer_options()
@@ -56,28 +62,88 @@ class ProcessingPipeline:
 
         processing_line = CalibrateProcessing(stream_without_calibration_second, self.__calibration_options)
         processing_line = ValidateGeneralBlendShapes(processing_line)
-        processing_line = BlendShapeTimedBuffer(processing_line, ttl=1.0)
-        self.__stream_with_calibration = SingleReadStreamSplitter(processing_line)
+        self.__stream_with_calibration_cached = BlendShapeTimedBuffer(processing_line, ttl=1.0)
+        self.__stream_with_calibration = SingleReadStreamSplitter(self.__stream_with_calibration_cached)
 
-    def get_auto_calibration_stream(self) -> StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]:
+    def attach_replay(self) -> tuple[StreamWriteOnly[DenseBlendShapesFrame[MediaPipeBlendShapeEnum]],
+                                     StreamWriteOnly[DenseBlendShapesFrame[BabbleBlendShapeEnum]]]:
+        """
+        Disconnects the MediaPipe and Babble pipelines, so the replay is the only timeline in the post-processing.
+        Call detach_replay after the replay has stopped writing to connect them again.
+
+        Returns:
+            MediaPipe and Babble inputs with their own filters, the frames of MediaPipe are after MediaPipeProcessing.
+        """
+
+        with self.__replay_lock:
+            if self.__replay_attached:
+                raise ValueError("Replay is already attached")
+
+            self.__media_pipe_pipeline.unregister_stream(self.__media_pipe_stream)
+            self.__babble_pipeline.unregister_stream(self.__babble_stream)
+
+            self.__replay_attached = True
+
+        return (BlendShapesOneEuroFilter[MediaPipeBlendShapeEnum](
+            self.__buffer, self.__media_pipe_pipeline.get_filter_processing_options()),
+                BlendShapesOneEuroFilter[BabbleBlendShapeEnum](
+                    self.__buffer, self.__babble_pipeline.get_filter_processing_options()))
+
+    def detach_replay(self) -> None:
+        with self.__replay_lock:
+            if not self.__replay_attached:
+                return
+
+            # Reset, the last live frames are from before the replay
+            self.__media_pipe_filter.recreate()
+            self.__babble_stream.recreate()
+
+            self.__media_pipe_pipeline.register_stream(self.__media_pipe_stream)
+            self.__babble_pipeline.register_stream(self.__babble_stream)
+
+            self.__replay_attached = False
+
+    def invalidate_calibration(self) -> None:
+        """
+        Call after a BlendShapeOption of the config is changed in place without writing the config.
+        """
+
+        self.__calibration_options.invalidate()
+
+    def get_auto_calibration_stream(self) -> StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]:
         return self.__stream_without_calibration_first.get_slave_stream()
 
-    def get_udp_stream(self) -> StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]:
+    def get_udp_stream(self) -> StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]:
         return self.__stream_with_calibration
 
-    def get_ui_stream_input(self) -> StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]:
+    def get_ui_stream_input(self) -> StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]:
         return self.__stream_without_calibration_cached
 
-    def get_ui_stream_output(self) -> StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]:
+    def get_ui_stream_output(self) -> StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]:
         return self.__stream_with_calibration.get_slave_stream()
 
+    def get_ui_input_freshness(self) -> BlendShapeFreshness[GeneralBlendShapeEnum] | None:
+        """
+        Returns:
+            Which values of the last frame without calibration were held or dropped, None before the first frame.
+        """
+
+        return self.__stream_without_calibration_cached.get_freshness()
+
+    def get_output_freshness(self) -> BlendShapeFreshness[GeneralBlendShapeEnum] | None:
+        """
+        Returns:
+            Which values of the last calibrated frame were held or dropped, None before the first frame.
+        """
+
+        return self.__stream_with_calibration_cached.get_freshness()
+
     def close(self):
         self.__buffer.close()
 
         self.__media_pipe_pipeline.unregister_stream(self.__media_pipe_stream)
         self.__babble_pipeline.unregister_stream(self.__babble_stream)
 
-        self.__restart_filter_listener.unregister()
         self.__mixer_options_listener.unregister()
         self.__calibration_options_listener.unregister()
 
@@ -90,17 +156,6 @@ class ProcessingPipeline:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def __register_restart_filter(self) -> ConfigUpdateListener:
-        watch_array: list[Callable[[Config], Any]] = [lambda config: config.babble.mincutoff,
-                                                      lambda config: config.babble.beta,
-                                                      lambda config: config.babble.dcutoff]
-
-        return self.__config_manager.create_update_listener(self.__update_filter, watch_array, False)
-
-    # noinspection PyUnusedLocal
-    def __update_filter(self, config_manager: ConfigManager):
-        self.__babble_stream.recreate()
-
     def __register_change_mixer_options(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.processing.source]
 
@@ -0,0 +1,149 @@
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from src.config.ConfigManager import ConfigManager
+from src.config.ConfigUpdateListener import ConfigUpdateListener
+from src.config.schemas.Config import Config
+from src.pipline.BabblePipeline import BabblePipeline
+from src.pipline.MediaPipePipeline import MediaPipePipeline
+from src.pipline.ProcessingPipeline import ProcessingPipeline
+from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
+from src.stream.mediapipe.MediaPipeBlendShapeEnum import MediaPipeBlendShapeEnum
+from src.stream.mediapipe.MediaPipeProcessing import MediaPipeProcessing
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.recording.BlendShapesRecorderStream import BlendShapesRecorderStream
+from src.stream.recording.LandmarksRecorderStream import LandmarksRecorderStream
+from src.stream.recording.SessionReader import SessionReader
+from src.stream.recording.SessionReplay import SessionReplay
+from src.stream.recording.SessionTrackEnum import SessionTrackEnum
+from src.stream.recording.SessionWriter import SessionWriter
+
+_logger = logging.getLogger(__name__)
+
+
+class RecordingPipeline:
+    def __init__(self, config_manager: ConfigManager, media_pipe_pipeline: MediaPipePipeline,
+                 babble_pipeline: BabblePipeline, processing_pipeline: ProcessingPipeline):
+        self.__config_manager = config_manager
+        self.__media_pipe_pipeline = media_pipe_pipeline
+        self.__babble_pipeline = babble_pipeline
+        self.__processing_pipeline = processing_pipeline
+
+        self.__writer: SessionWriter | None = None
+        self.__media_pipe_recorder: MediaPipeProcessing | None = None
+        self.__babble_recorder: BlendShapesRecorderStream[BabbleBlendShapeEnum] | None = None
+        self.__landmarks_recorder: LandmarksRecorderStream | None = None
+
+        self.__replay: SessionReplay | None = None
+
+        self.__record_listener: ConfigUpdateListener = self.__register_change_record()
+        self.__replay_listener: ConfigUpdateListener = self.__register_change_replay()
+
+    def close(self):
+        self.__record_listener.unregister()
+        self.__replay_listener.unregister()
+
+        self.__stop_record()
+        self.__stop_replay()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __register_change_record(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.recording.record_enabled,
+                                                      lambda config: config.recording.record_path,
+                                                      lambda config: config.recording.record_landmarks]
+
+        return self.__config_manager.create_update_listener(self.__update_record, watch_array, True)
+
+    def __update_record(self, config_manager: ConfigManager):
+        self.__stop_record()
+
+        if not config_manager.config.recording.record_enabled:
+            return
+
+        try:
+            path = Path(config_manager.config.recording.record_path) / datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            self.__writer = SessionWriter(path)
+
+            # Recorded after MediaPipeProcessing, the same frames that go into the post-processing
+            self.__media_pipe_recorder = MediaPipeProcessing(
+                BlendShapesRecorderStream(self.__writer, SessionTrackEnum.MediaPipe.value,
+                                          BlendShapeSlots.of(MediaPipeBlendShapeEnum)),
+                self.__media_pipe_pipeline.get_processing_options())
+            self.__media_pipe_pipeline.register_stream(self.__media_pipe_recorder)
+
+            self.__babble_recorder = BlendShapesRecorderStream(self.__writer, SessionTrackEnum.Babble.value,
+                                                               BlendShapeSlots.of(BabbleBlendShapeEnum))
+            self.__babble_pipeline.register_stream(self.__babble_recorder)
+
+            if config_manager.config.recording.record_landmarks:
+                self.__landmarks_recorder = LandmarksRecorderStream(self.__writer,
+                                                                    SessionTrackEnum.MediaPipeLandmarks.value)
+                self.__media_pipe_pipeline.register_stream(self.__landmarks_recorder)
+
+            _logger.info(f"Recording session to {path}")
+        except Exception:
+            _logger.warning("Failed to start recording", exc_info=True, stack_info=True)
+            self.__stop_record()
+
+    def __stop_record(self):
+        if self.__media_pipe_recorder is not None:
+            self.__media_pipe_pipeline.unregister_stream(self.__media_pipe_recorder)
+            self.__media_pipe_recorder = None
+
+        if self.__babble_recorder is not None:
+            self.__babble_pipeline.unregister_stream(self.__babble_recorder)
+            self.__babble_recorder = None
+
+        if self.__landmarks_recorder is not None:
+            self.__media_pipe_pipeline.unregister_stream(self.__landmarks_recorder)
+            self.__landmarks_recorder = None
+
+        # The queued rows are written by close, frames that come after it are dropped
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+
+    def __register_change_replay(self) -> ConfigUpdateListener:
+        watch_array: list[Callable[[Config], Any]] = [lambda config: config.recording.replay_path,
+                                                      lambda config: config.recording.replay_pacing,
+                                                      lambda config: config.recording.replay_loop]
+
+        return self.__config_manager.create_update_listener(self.__update_replay, watch_array, True)
+
+    def __update_replay(self, config_manager: ConfigManager):
+        self.__stop_replay()
+
+        if not config_manager.config.recording.replay_path:
+            return
+
+        try:
+            session = SessionReader(Path(config_manager.config.recording.replay_path))
+
+            media_pipe_input, babble_input = self.__processing_pipeline.attach_replay()
+
+            streams = {SessionTrackEnum.MediaPipe.value: (BlendShapeSlots.of(MediaPipeBlendShapeEnum),
+                                                          media_pipe_input),
+                       SessionTrackEnum.Babble.value: (BlendShapeSlots.of(BabbleBlendShapeEnum), babble_input)}
+
+            self.__replay = SessionReplay(session, streams, config_manager.config.recording.replay_pacing.to_original(),
+                                          config_manager.config.recording.replay_loop)
+
+            _logger.info(f"Replaying session {session.path}")
+        except Exception:
+            _logger.warning("Failed to start replay", exc_info=True, stack_info=True)
+            self.__stop_replay()
+
+    def __stop_replay(self):
+        if self.__replay is not None:
+            self.__replay.close()
+            self.__replay = None
+
+        # After the replay thread has stopped, nothing writes to the replay inputs anymore
+        self.__processing_pipeline.detach_replay()
@@ -3,11 +3,16 @@ from typing import Any, Callable
 from src.config.ConfigManager import ConfigManager
 from src.config.ConfigUpdateListener import ConfigUpdateListener
 from src.config.schemas.Config import Config
+from src.metrics.FrameRateMetric import FrameRateMetric
+from src.metrics.LatencySnapshot import LatencySnapshot
 from src.pipline.ProcessingPipeline import ProcessingPipeline
+from src.stream.trace.FrameTraceCollector import FrameTraceCollector
 from src.stream.vrcft.VRCFTUdpSocket import VRCFTUdpSocket
+from src.stream.vrcft.VrcftBinaryPacket import VrcftBinaryPacket
 from src.stream.vrcft.VrcftAutoConnect import VrcftAutoConnect
 from src.stream.vrcft.VrcftInterfaceOptions import VrcftInterfaceOptions
 from src.stream.vrcft.VrcftPacketEncoderStream import VrcftPacketEncoderStream
+from src.stream.vrcft.VrcftPacketFormatEnum import VrcftPacketFormatEnum
 
 
 class UdpPipeline:
@@ -19,7 +24,9 @@ class UdpPipeline:
 
         encoder_stream = VrcftPacketEncoderStream(self.__processing_pipeline.get_udp_stream(), self.__options)
 
-        self.__stream = VRCFTUdpSocket(encoder_stream)
+        self.__trace_collector = FrameTraceCollector()
+
+        self.__stream = VRCFTUdpSocket(encoder_stream, trace_collector=self.__trace_collector)
         self.__options_listener = self.__register_change_options()
         self.__auto_connect = VrcftAutoConnect(self.__config_manager)
         self.__auto_connect_listener = self.__register_auto_connect_change()
@@ -30,6 +37,12 @@ class UdpPipeline:
     def get_pps(self) -> float:
         return self.__stream.get_pps()
 
+    def get_packet_metric(self) -> FrameRateMetric:
+        return self.__stream.get_packet_metric()
+
+    def get_trace_report(self) -> dict[str, LatencySnapshot]:
+        return self.__trace_collector.get_report()
+
     def close(self):
         self.__stream.close()
 
@@ -48,17 +61,42 @@ class UdpPipeline:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.socket.ip,
                                                       lambda config: config.socket.port,
                                                       lambda config: config.socket.udp_read_timeout,
-                                                      lambda config: config.socket.bypass_other_modules_block]
+                                                      lambda config: config.socket.bypass_other_modules_block,
+                                                      lambda config: config.socket.packet_format,
+                                                      lambda config: config.socket.quantize_values,
+                                                      lambda config: config.socket.delta_encoding,
+                                                      lambda config: config.socket.delta_epsilon,
+                                                      lambda config: config.socket.keyframe_interval_ms,
+                                                      lambda config: config.socket.static_packet_interval_ms,
+                                                      lambda config: config.socket.interface_binary_protocol_version]
 
         return self.__config_manager.create_update_listener(self.__update_options, watch_array, True)
 
     def __update_options(self, config_manager: ConfigManager):
         self.__options.udp_read_timeout_ms = config_manager.config.socket.udp_read_timeout
         self.__options.bypass_other_modules_block = config_manager.config.socket.bypass_other_modules_block
+        self.__options.quantize_values = config_manager.config.socket.quantize_values
+        self.__options.delta_encoding = config_manager.config.socket.delta_encoding
+        self.__options.delta_epsilon = config_manager.config.socket.delta_epsilon
+        self.__options.keyframe_interval_ms = config_manager.config.socket.keyframe_interval_ms
+        self.__options.static_packet_interval_ms = config_manager.config.socket.static_packet_interval_ms
+        self.__options.binary_protocol_version = UdpPipeline.__get_binary_protocol_version(config_manager)
 
         self.__stream.ping_connection_time = config_manager.config.socket.udp_read_timeout / 4000.0
         self.__stream.target_address = (config_manager.config.socket.ip, config_manager.config.socket.port)
 
+    @staticmethod
+    def __get_binary_protocol_version(config_manager: ConfigManager) -> int:
+        packet_format = config_manager.config.socket.packet_format.to_original()
+        interface_version = config_manager.config.socket.interface_binary_protocol_version
+
+        if packet_format == VrcftPacketFormatEnum.Binary:
+            return VrcftBinaryPacket.VERSION
+        if packet_format == VrcftPacketFormatEnum.Auto and interface_version > 0:
+            return min(interface_version, VrcftBinaryPacket.VERSION)
+
+        return 0
+
     def __register_auto_connect_change(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.socket.auto_connect]
 
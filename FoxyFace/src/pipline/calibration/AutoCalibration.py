@@ -1,25 +1,36 @@
+import logging
 import time
 from concurrent.futures import Future
 from concurrent.futures.thread import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
 from statistics import median
 from threading import Event
 
+import numpy
+
 from src.config.ConfigManager import ConfigManager
 from src.config.schemas.core.enums.GeneralBlendShapeEnumConfig import GeneralBlendShapeEnumConfig
+from src.pipline.ProcessingPipeline import ProcessingPipeline
 from src.stream.core.StreamReadOnly import StreamReadOnly
 from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
 from src.stream.postprocessing.calibration.BlendShapeOption import BlendShapeOption
+from src.timeseries.TimeSeriesFormat import TimeSeriesFormat
+from src.timeseries.TimeSeriesWriter import TimeSeriesWriter
+
+_logger = logging.getLogger(__name__)
 
 
 class AutoCalibration:
-    def __init__(self, config_manager: ConfigManager,
-                 general_blend_shapes_stream: StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]],
+    def __init__(self, config_manager: ConfigManager, processing_pipeline: ProcessingPipeline,
                  media_pipe_stream: StreamReadOnly[MediaPipeFrame]):
         self.__config_manager: ConfigManager = config_manager
+        self.__processing_pipeline: ProcessingPipeline = processing_pipeline
         self.__general_blend_shapes_stream: StreamReadOnly[
-            BlendShapesFrame[GeneralBlendShapeEnum]] = general_blend_shapes_stream
+            DenseBlendShapesFrame[GeneralBlendShapeEnum]] = processing_pipeline.get_auto_calibration_stream()
         self.__media_pipe_stream: StreamReadOnly[MediaPipeFrame] = media_pipe_stream
 
         self.__thread_pool = ThreadPoolExecutor(max_workers=1)
@@ -46,6 +57,7 @@ class AutoCalibration:
         start_time = time.perf_counter_ns()
 
         record_list: dict[GeneralBlendShapeEnum, list[float]] = {}
+        capture = self.__create_capture("neutral", calibration_list)
         try:
             self.__general_blend_shapes_stream.poll(average_time)  # Drop first frame
 
@@ -53,6 +65,8 @@ class AutoCalibration:
                 frame = self.__general_blend_shapes_stream.poll(
                     average_time - (time.perf_counter_ns() - start_time) / 1_000_000_000)
 
+                AutoCalibration.__capture_frame(capture, frame)
+
                 for key, value in frame.blend_shapes.items():
                     if not key.value.disable_calibration and key in calibration_list:
                         record_list.setdefault(key, []).append(value)
@@ -60,6 +74,9 @@ class AutoCalibration:
             pass
         except InterruptedError:
             return False
+        finally:
+            if capture is not None:
+                capture.close()
 
         if calibrate_rotation:
             try:
@@ -82,6 +99,7 @@ class AutoCalibration:
                 GeneralBlendShapeEnumConfig.from_original(key), BlendShapeOption())
             option.neutral_pose = median(value)  # 50% cumulative probability
 
+        self.__processing_pipeline.invalidate_calibration()
         self.__config_manager.write()
 
         return True
@@ -89,12 +107,15 @@ class AutoCalibration:
     def __max_pose(self, calibration_list: list[GeneralBlendShapeEnum], cancel_event: Event,
                    timeout: float = 1.0) -> bool:
         record_list: dict[GeneralBlendShapeEnum, list[float]] = {}
+        capture = self.__create_capture("max", calibration_list)
         try:
             self.__general_blend_shapes_stream.poll(timeout)  # Drop first frame
 
             while not cancel_event.is_set():
                 frame = self.__general_blend_shapes_stream.poll(timeout)
 
+                AutoCalibration.__capture_frame(capture, frame)
+
                 for key, value in frame.blend_shapes.items():
                     if key in calibration_list:
                         record_list.setdefault(key, []).append(value)
@@ -102,6 +123,9 @@ class AutoCalibration:
             return False
         except InterruptedError:
             return False
+        finally:
+            if capture is not None:
+                capture.close()
 
         for key, value in record_list.items():
             option = self.__config_manager.config.processing.calibration.setdefault(
@@ -110,6 +134,38 @@ class AutoCalibration:
             option.max_pose_negative = min(value)
             option.max_pose_positive = max(value)
 
+        self.__processing_pipeline.invalidate_calibration()
         self.__config_manager.write()
 
         return True
+
+    def __create_capture(self, pose: str, calibration_list: list[GeneralBlendShapeEnum]) -> TimeSeriesWriter | None:
+        """
+        Returns:
+            Writer for the frames of the calibration, None if the captures are disabled.
+        """
+
+        capture_path = self.__config_manager.config.recording.calibration_capture_path
+        if not capture_path:
+            return None
+
+        try:
+            directory = Path(capture_path)
+            directory.mkdir(parents=True, exist_ok=True)
+
+            name = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{pose}{TimeSeriesFormat.EXTENSION}"
+
+            return TimeSeriesWriter(directory / name,
+                                    [member.name for member in BlendShapeSlots.of(GeneralBlendShapeEnum).members],
+                                    GeneralBlendShapeEnum.__name__,
+                                    {"pose": pose, "calibration": [member.name for member in calibration_list]})
+        except Exception:
+            _logger.warning("Failed to create calibration capture", exc_info=True, stack_info=True)
+
+            return None
+
+    @staticmethod
+    def __capture_frame(capture: TimeSeriesWriter | None,
+                        frame: DenseBlendShapesFrame[GeneralBlendShapeEnum]) -> None:
+        if capture is not None:
+            capture.append(frame.timestamp_ns, numpy.where(frame.mask, frame.values, numpy.nan))
@@ -16,8 +16,7 @@ class AutoCalibrationEndpoint:
         self.__buffer = SingleBufferStream[MediaPipeFrame]()
         self.__media_pipe_pipeline.register_stream(self.__buffer)
 
-        self.auto_calibration = AutoCalibration(self.__config_manager,
-                                                self.__processing_pipeline.get_auto_calibration_stream(), self.__buffer)
+        self.auto_calibration = AutoCalibration(self.__config_manager, self.__processing_pipeline, self.__buffer)
 
     def close(self):
         self.__buffer.close()
@@ -3,30 +3,64 @@ from dataclasses import dataclass
 
 import numpy
 from cv2.typing import MatLike
+from numpy import ndarray
 from onnxruntime import InferenceSession
 
 from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
+from src.stream.babble.BabbleModelBinding import BabbleModelBinding
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
 
 _logger = logging.getLogger(__name__)
 
+# Model output index of every BabbleBlendShapeEnum slot
+_output_indices = numpy.array([blend_shape.value for blend_shape in BlendShapeSlots.of(BabbleBlendShapeEnum).members],
+                              dtype=numpy.intp)
+
 
 @dataclass(slots=True, frozen=True)
 class BabbleModel:
     __session: InferenceSession
     __input_name: str
     __output_names: list[str]
+    # None if IOBinding isn't available, then every inference allocates its tensors
+    __binding: BabbleModelBinding | None
     is_default_model: bool
     input_size_x: int
     input_size_y: int
+    # False if the batch dimension of the model input is fixed
+    supports_batching: bool
+
+    def process_gray_image(self, image: MatLike) -> ndarray:
+        """
+        Returns:
+            Values in the slot order of BabbleBlendShapeEnum.
+        """
+
+        if self.__binding is not None:
+            return self.__binding.run(image, _output_indices)
 
-    def process_gray_image(self, image: MatLike) -> dict[BabbleBlendShapeEnum, float]:
         frame = (image[numpy.newaxis, numpy.newaxis, :, :] / 255.0).astype(numpy.float32)  # (1, 1, size, size)
 
         out = self.__session.run(self.__output_names, {self.__input_name: frame})
 
-        arr = out[0][0].astype(float)
+        return out[0][0][_output_indices]
+
+    def process_gray_images(self, images: list[MatLike]) -> ndarray:
+        """
+        Runs one inference for all images if the model supports batching.
+
+        Returns:
+            Values (images, slots) in the slot order of BabbleBlendShapeEnum.
+        """
+
+        if not self.supports_batching:
+            return numpy.stack([self.process_gray_image(image) for image in images])
+
+        frames = (numpy.stack(images)[:, numpy.newaxis, :, :] / 255.0).astype(numpy.float32)  # (N, 1, size, size)
+
+        out = self.__session.run(self.__output_names, {self.__input_name: frames})
 
-        return {blend_shape: arr[blend_shape.value] for blend_shape in BabbleBlendShapeEnum}
+        return out[0][:, _output_indices]
 
     def is_loaded_successfully(self) -> bool:
         try:
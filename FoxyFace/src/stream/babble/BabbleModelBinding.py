@@ -0,0 +1,41 @@
+from threading import Lock
+
+import numpy
+from cv2.typing import MatLike
+from numpy import ndarray
+from onnxruntime import InferenceSession, OrtValue
+
+
+class BabbleModelBinding:
+    """
+    Runs single image inferences through onnxruntime IOBinding. The input and output tensors are allocated once and
+    bound as CPU OrtValues, the image is normalized directly into the input tensor.
+    """
+
+    def __init__(self, session: InferenceSession, input_name: str, output_name: str, input_size_x: int,
+                 input_size_y: int):
+        self.__session: InferenceSession = session
+        self.__lock: Lock = Lock()
+
+        self.__input = numpy.zeros((1, 1, input_size_y, input_size_x), dtype=numpy.float32)
+
+        # The output shape is known only after the first inference
+        output_shape = session.run([output_name], {input_name: self.__input})[0].shape
+        self.__output = numpy.zeros(output_shape, dtype=numpy.float32)
+
+        self.__binding = session.io_binding()
+        self.__binding.bind_ortvalue_input(input_name, OrtValue.ortvalue_from_numpy(self.__input))
+        self.__binding.bind_ortvalue_output(output_name, OrtValue.ortvalue_from_numpy(self.__output))
+
+    def run(self, image: MatLike, output_indices: ndarray) -> ndarray:
+        """
+        Returns:
+            A new array with the values of output_indices from the first output row.
+        """
+
+        with self.__lock:
+            numpy.divide(image, 255.0, out=self.__input[0, 0], casting="unsafe")
+
+            self.__session.run_with_iobinding(self.__binding)
+
+            return self.__output[0][output_indices]
@@ -0,0 +1,83 @@
+import logging
+from pathlib import Path
+
+import onnxruntime
+from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
+
+from AppConstants import AppConstants
+from src.stream.babble.BabbleModel import BabbleModel
+from src.stream.babble.BabbleModelBinding import BabbleModelBinding
+
+_logger = logging.getLogger(__name__)
+
+
+class BabbleModelFactory:
+    @staticmethod
+    def create(model_path: str, use_gpu: bool, intra_op_num_threads: int, allow_spinning: bool,
+               device_id: int) -> BabbleModel | None:
+        """
+        Returns:
+            The loaded model, None if the test inference failed.
+        """
+
+        device_id_str = str(device_id)
+
+        try:
+            providers: list[str] = onnxruntime.get_available_providers()
+            if "CUDAExecutionProvider" in providers:
+                # noinspection PyUnusedImports
+                import torch
+        except Exception:
+            _logger.warning("Failed to import torch", exc_info=True, stack_info=True)
+
+        opts = SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = intra_op_num_threads
+        opts.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.add_session_config_entry("session.intra_op.allow_spinning", "1" if allow_spinning else "0")
+        opts.enable_mem_pattern = False
+
+        if use_gpu:
+            provider = [("DmlExecutionProvider", {"device_id": device_id_str}),
+                        ("CUDAExecutionProvider", {"device_id": device_id_str}),
+                        ("ROCMExecutionProvider", {"device_id": device_id_str}), "CoreMLExecutionProvider",
+                        "CPUExecutionProvider"]
+        else:
+            provider = ["CPUExecutionProvider"]
+
+        if not model_path or model_path.isspace():
+            path = BabbleModelFactory.get_base_model_path()
+        else:
+            path = Path(model_path).resolve(strict=True)
+
+        session = InferenceSession(path, opts, providers=provider)
+
+        first_input = session.get_inputs()[0]
+        input_name = first_input.name
+        input_size_x = first_input.shape[2]
+        input_size_y = first_input.shape[3]
+        # Dynamic dimensions are names or None
+        supports_batching = not isinstance(first_input.shape[0], int)
+
+        output_names = [session.get_outputs()[0].name]
+
+        is_default_model = BabbleModelFactory.get_base_model_path().samefile(path)
+
+        try:
+            binding = BabbleModelBinding(session, input_name, output_names[0], input_size_x, input_size_y)
+        except Exception:
+            _logger.warning("Failed to bind babble model buffers, IOBinding is disabled", exc_info=True,
+                            stack_info=True)
+
+            binding = None
+
+        model = BabbleModel(session, input_name, output_names, binding, is_default_model, input_size_x, input_size_y,
+                            supports_batching)
+        if not model.is_loaded_successfully():
+            return None
+
+        return model
+
+    @staticmethod
+    def get_base_model_path() -> Path:
+        return AppConstants.get_application_root() / "Baballonia" / "src" / "Baballonia" / "faceModel.onnx"
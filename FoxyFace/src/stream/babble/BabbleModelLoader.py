@@ -1,78 +1,110 @@
 import logging
 from pathlib import Path
+from threading import Lock
 
-import onnxruntime
 from cv2.typing import MatLike
-from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
+from numpy import ndarray
 
-from AppConstants import AppConstants
-from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
 from src.stream.babble.BabbleModel import BabbleModel
+from src.stream.babble.BabbleModelFactory import BabbleModelFactory
+from src.stream.babble.process.BabbleWorkerModel import BabbleWorkerModel
+from src.stream.babble.process.BabbleWorkerProcess import BabbleWorkerProcess
 
 _logger = logging.getLogger(__name__)
 
 
 class BabbleModelLoader:
     def __init__(self):
-        self.model: BabbleModel | None = None
+        # Readers take the reference once and keep using it, a new session only replaces the reference
+        self.model: BabbleModel | BabbleWorkerModel | None = None
+
+        # Serializes start_new_session and close, they replace the model and stop the worker
+        self.__session_lock: Lock = Lock()
+        self.__worker: BabbleWorkerProcess | None = None
 
     def start_new_session(self, model_path: str, use_gpu: bool, intra_op_num_threads: int, allow_spinning: bool,
-                          device_id: int):
+                          device_id: int, use_worker_process: bool = False):
+        with self.__session_lock:
+            self.__start_new_session(model_path, use_gpu, intra_op_num_threads, allow_spinning, device_id,
+                                     use_worker_process)
+
+    def __start_new_session(self, model_path: str, use_gpu: bool, intra_op_num_threads: int, allow_spinning: bool,
+                            device_id: int, use_worker_process: bool):
         self.model = None
 
-        device_id_str = str(device_id)
+        if not use_worker_process:
+            self.__stop_worker()
+
+            model = BabbleModelFactory.create(model_path, use_gpu, intra_op_num_threads, allow_spinning, device_id)
+            if model is not None:
+                self.model = model
+
+                _logger.info("Babble started")
+
+            return
 
         try:
-            providers: list[str] = onnxruntime.get_available_providers()
-            if "CUDAExecutionProvider" in providers:
-                # noinspection PyUnusedImports
-                import torch
+            if self.__worker is None or not self.__worker.is_alive():
+                self.__stop_worker()
+                self.__worker = BabbleWorkerProcess()
+
+            info = self.__worker.load(model_path, use_gpu, intra_op_num_threads, allow_spinning, device_id)
+            if info is not None:
+                self.model = BabbleWorkerModel(self.__worker, info)
+
+                _logger.info("Babble started in a worker process")
         except Exception:
-            _logger.warning("Failed to import torch", exc_info=True, stack_info=True)
+            _logger.warning("Failed to load babble model in the worker process", exc_info=True, stack_info=True)
 
-        opts = SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = intra_op_num_threads
-        opts.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
-        opts.add_session_config_entry("session.intra_op.allow_spinning", "1" if allow_spinning else "0")
-        opts.enable_mem_pattern = False
+    def process_gray_image(self, image: MatLike) -> ndarray | None:
+        model = self.__get_alive_model()
+        if model is None:
+            return None
 
-        if use_gpu:
-            provider = [("DmlExecutionProvider", {"device_id": device_id_str}),
-                        ("CUDAExecutionProvider", {"device_id": device_id_str}),
-                        ("ROCMExecutionProvider", {"device_id": device_id_str}), "CoreMLExecutionProvider",
-                        "CPUExecutionProvider"]
-        else:
-            provider = ["CPUExecutionProvider"]
+        return model.process_gray_image(image)
 
-        if not model_path or model_path.isspace():
-            path = BabbleModelLoader.get_base_model_path()
-        else:
-            path = Path(model_path).resolve(strict=True)
+    def process_gray_images(self, images: list[MatLike]) -> ndarray | None:
+        model = self.__get_alive_model()
+        if model is None:
+            return None
 
-        session = InferenceSession(path, opts, providers=provider)
+        return model.process_gray_images(images)
 
-        first_input = session.get_inputs()[0]
-        input_name = first_input.name
-        input_size_x = first_input.shape[2]
-        input_size_y = first_input.shape[3]
+    def close(self) -> None:
+        with self.__session_lock:
+            self.model = None
 
-        output_names = [session.get_outputs()[0].name]
+            self.__stop_worker()
 
-        is_default_model = BabbleModelLoader.get_base_model_path().samefile(path)
+    def __get_alive_model(self) -> BabbleModel | BabbleWorkerModel | None:
+        model = self.model
 
-        model = BabbleModel(session, input_name, output_names, is_default_model, input_size_x, input_size_y)
-        if model.is_loaded_successfully():
-            self.model = model
+        if isinstance(model, BabbleWorkerModel) and not model.is_alive():
+            _logger.warning("Babble worker process has stopped, reload the model to restart it")
 
-            _logger.info("Babble started")
+            # Skipped while a new session is being started, it replaces the model anyway
+            if self.__session_lock.acquire(blocking=False):
+                try:
+                    if self.model is model:
+                        self.model = None
+                finally:
+                    self.__session_lock.release()
 
-    def process_gray_image(self, image: MatLike) -> dict[BabbleBlendShapeEnum, float] | None:
-        if self.model is None:
             return None
 
-        return self.model.process_gray_image(image)
+        return model
+
+    def __stop_worker(self) -> None:
+        if self.__worker is None:
+            return
+
+        try:
+            self.__worker.close()
+        except Exception:
+            _logger.warning("Failed to stop Babble worker process", exc_info=True, stack_info=True)
+
+        self.__worker = None
 
     @staticmethod
     def get_base_model_path() -> Path:
-        return AppConstants.get_application_root() / "Baballonia" / "src" / "Baballonia" / "faceModel.onnx"
+        return BabbleModelFactory.get_base_model_path()
@@ -1,34 +1,42 @@
 import logging
+import time
 from threading import Event, Thread
 
 from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
 from src.stream.babble.BabbleModelLoader import BabbleModelLoader
+from src.stream.babble.BabbleStreamOptions import BabbleStreamOptions
 from src.stream.babble.imageprocessing.BabbleImageFrame import BabbleImageFrame
 from src.stream.core.StreamReadOnly import StreamReadOnly
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
 from src.stream.core.components.WriteStreamSplitter import WriteStreamSplitter
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.trace.FrameTrace import FrameTrace
 
 _logger = logging.getLogger(__name__)
 
 
 class BabbleStream:
-    def __init__(self, stream: StreamReadOnly[BabbleImageFrame], frame_timeout: float | None, model: BabbleModelLoader):
+    def __init__(self, stream: StreamReadOnly[BabbleImageFrame], frame_timeout: float | None, model: BabbleModelLoader,
+                 options: BabbleStreamOptions):
         self.__babble_image_stream: StreamReadOnly[BabbleImageFrame] = stream
         self.__frame_timeout: float | None = frame_timeout
         self.__model = model
+        self.__options: BabbleStreamOptions = options
+
+        self.__slots: BlendShapeSlots[BabbleBlendShapeEnum] = BlendShapeSlots.of(BabbleBlendShapeEnum)
 
         self.__close_event = Event()
 
-        self.__stream_root = WriteStreamSplitter[BlendShapesFrame[BabbleBlendShapeEnum]]()
+        self.__stream_root = WriteStreamSplitter[DenseBlendShapesFrame[BabbleBlendShapeEnum]]()
 
         self.__thread = Thread(target=self.__loop, daemon=True, name="Babble Thread")
         self.__thread.start()
 
-    def register_stream(self, stream: StreamWriteOnly[BlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
+    def register_stream(self, stream: StreamWriteOnly[DenseBlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
         self.__stream_root.register_stream(stream)
 
-    def unregister_stream(self, stream: StreamWriteOnly[BlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
+    def unregister_stream(self, stream: StreamWriteOnly[DenseBlendShapesFrame[BabbleBlendShapeEnum]]) -> None:
         self.__stream_root.unregister_stream(stream)
 
     def close(self):
@@ -50,11 +58,18 @@ class BabbleStream:
         while not self.__close_event.is_set():
             try:
                 last_frame = self.__babble_image_stream.poll(self.__frame_timeout)
+
+                if self.__options.max_batch_size > 1:
+                    self.__process_batch(self.__collect_batch(last_frame))
+                    continue
+
                 bend_shapes = self.__model.process_gray_image(last_frame.processed_frame)
                 if bend_shapes is None:
                     continue
 
-                self.__stream_root.put(BlendShapesFrame(bend_shapes, last_frame.timestamp_ns))
+                self.__stream_root.put(
+                    DenseBlendShapesFrame.from_values(self.__slots, bend_shapes, None, last_frame.timestamp_ns,
+                                                      FrameTrace.extend(last_frame.trace, "babble_onnx")))
             except TimeoutError:
                 continue
             except InterruptedError:
@@ -63,3 +78,29 @@ class BabbleStream:
                 _logger.warning("Exception in Babble loop", exc_info=True, stack_info=True)
 
                 self.__close_event.wait(0.001)
+
+    def __collect_batch(self, first_frame: BabbleImageFrame) -> list[BabbleImageFrame]:
+        frames = [first_frame]
+
+        deadline = time.perf_counter() + self.__options.batch_time_budget
+        while len(frames) < self.__options.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0.0:
+                break
+
+            try:
+                frames.append(self.__babble_image_stream.poll(remaining))
+            except TimeoutError:
+                break
+
+        return frames
+
+    def __process_batch(self, frames: list[BabbleImageFrame]) -> None:
+        batch_bend_shapes = self.__model.process_gray_images([frame.processed_frame for frame in frames])
+        if batch_bend_shapes is None:
+            return
+
+        for frame, bend_shapes in zip(frames, batch_bend_shapes):
+            self.__stream_root.put(
+                DenseBlendShapesFrame.from_values(self.__slots, bend_shapes, None, frame.timestamp_ns,
+                                                  FrameTrace.extend(frame.trace, "babble_onnx")))
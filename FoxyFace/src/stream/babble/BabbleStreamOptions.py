@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class BabbleStreamOptions:
+    """
+    The input of Babble is a latest-value buffer (EventBufferStream(1)) after MediaPipe, so at camera rate the next
+    frame of a batch arrives 16-33 ms after the previous one. With the default time budget of 10 ms the batches
+    rarely have more than 1-2 frames, a larger budget collects more frames but delays the first frame of the batch.
+    """
+
+    # 1 disables batching, models with a fixed batch dimension process the batch image by image
+    max_batch_size: int = 1
+    # How long to wait for more frames after the first frame of a batch, in seconds
+    batch_time_budget: float = 0.010
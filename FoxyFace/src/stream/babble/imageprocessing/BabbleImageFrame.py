@@ -2,8 +2,11 @@ from dataclasses import dataclass
 
 from cv2.typing import MatLike
 
+from src.stream.trace.FrameTrace import FrameTrace
+
 
 @dataclass(frozen=True, slots=True)
 class BabbleImageFrame:
     processed_frame: MatLike
     timestamp_ns: int
+    trace: FrameTrace | None = None
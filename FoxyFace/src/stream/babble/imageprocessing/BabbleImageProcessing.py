@@ -2,13 +2,16 @@ import time
 
 import cv2
 import numpy
+from mediapipe.tasks.python.components.containers.landmark import NormalizedLandmark
 from scipy.spatial.transform import Rotation
 
 from src.stream.babble.BabbleModelLoader import BabbleModelLoader
 from src.stream.babble.imageprocessing.BabbleImageFrame import BabbleImageFrame
 from src.stream.babble.imageprocessing.BabbleImageProcessingOptions import BabbleImageProcessingOptions
+from src.stream.camera.CameraOrientation import CameraOrientation
 from src.stream.core.StreamReadOnly import StreamReadOnly
 from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
+from src.stream.trace.FrameTrace import FrameTrace
 
 
 class BabbleImageProcessing(StreamReadOnly[BabbleImageFrame]):
@@ -32,28 +35,32 @@ class BabbleImageProcessing(StreamReadOnly[BabbleImageFrame]):
                 if model is not None:
                     break
 
-        img_gray = cv2.cvtColor(mediapipe_frame.camera_frame.frame, cv2.COLOR_RGB2GRAY)
-        height, width = img_gray.shape[:2]
+        camera_frame = mediapipe_frame.camera_frame
+        landmarks = mediapipe_frame.face_landmarker_result.face_landmarks[0]
 
-        # Center Top
-        point_5 = mediapipe_frame.face_landmarker_result.face_landmarks[0][4]  # 195 or 5 or 4
-        point_5_x = point_5.x * width
-        point_5_y = point_5.y * height
+        # The face is cut from the captured frame, it has the full resolution even if MediaPipe got a smaller frame
+        if camera_frame.source is not None and camera_frame.orientation is not None:
+            image = camera_frame.source.frame
+            orientation = camera_frame.orientation
+            color_conversion = cv2.COLOR_BGR2GRAY
+        else:
+            image = camera_frame.frame
+            orientation = None
+            color_conversion = cv2.COLOR_RGB2GRAY
 
-        # Left
-        point_234 = mediapipe_frame.face_landmarker_result.face_landmarks[0][234]  # 234 or 93
-        point_234_x = point_234.x * width
-        point_234_y = point_234.y * height
+        height, width = image.shape[:2]
 
-        # Right
-        point_454 = mediapipe_frame.face_landmarker_result.face_landmarks[0][454]  # 454 or 323
-        point_454_x = point_454.x * width
-        point_454_y = point_454.y * height
+        # Center Top, 195 or 5 or 4
+        point_5_x, point_5_y = BabbleImageProcessing.__to_pixels(landmarks[4], orientation, width, height)
+
+        # Left, 234 or 93
+        point_234_x, point_234_y = BabbleImageProcessing.__to_pixels(landmarks[234], orientation, width, height)
+
+        # Right, 454 or 323
+        point_454_x, point_454_y = BabbleImageProcessing.__to_pixels(landmarks[454], orientation, width, height)
 
         # Center Bottom
-        point_152 = mediapipe_frame.face_landmarker_result.face_landmarks[0][152]
-        point_152_x = point_152.x * width
-        point_152_y = point_152.y * height
+        point_152_x, point_152_y = BabbleImageProcessing.__to_pixels(landmarks[152], orientation, width, height)
 
         point_a, point_b = BabbleImageProcessing.__calculate_rectangle_points((point_234_x, point_234_y),
                                                                               (point_454_x, point_454_y),
@@ -69,9 +76,20 @@ class BabbleImageProcessing(StreamReadOnly[BabbleImageFrame]):
 
         matrix = cv2.getPerspectiveTransform(pts1, pts2)
 
-        img_gray = cv2.warpPerspective(img_gray, matrix, (model.input_size_x, model.input_size_y))
+        # Only the small warped image is converted to gray
+        img_gray = cv2.cvtColor(cv2.warpPerspective(image, matrix, (model.input_size_x, model.input_size_y)),
+                                color_conversion)
+
+        return BabbleImageFrame(img_gray, camera_frame.timestamp_ns,
+                                FrameTrace.extend(mediapipe_frame.trace, "babble_warp"))
+
+    @staticmethod
+    def __to_pixels(landmark: NormalizedLandmark, orientation: CameraOrientation | None, width: int,
+                    height: int) -> tuple[float, float]:
+        if orientation is not None:
+            return orientation.to_source_pixels(landmark.x, landmark.y, width, height)
 
-        return BabbleImageFrame(img_gray, mediapipe_frame.camera_frame.timestamp_ns)
+        return landmark.x * width, landmark.y * height
 
     def __validate_rotation(self, frame: MediaPipeFrame):
         rotation_matrix = frame.face_landmarker_result.facial_transformation_matrixes[0][0:3, 0:3]
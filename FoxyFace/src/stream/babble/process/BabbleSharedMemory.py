@@ -0,0 +1,68 @@
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy
+from numpy import ndarray
+
+from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+
+
+class BabbleSharedMemory:
+    """
+    Input images and output values of the Babble worker process in one shared memory block, so a frame is copied
+    once instead of being pickled. Slot i holds an (input_size_y, input_size_x) uint8 image and the values of that
+    image in the slot order of BabbleBlendShapeEnum.
+
+    The block is created by the app and attached by the worker, only the creator unlinks it.
+    """
+
+    def __init__(self, slot_count: int, input_size_x: int, input_size_y: int, name: str | None = None):
+        self.slot_count: int = slot_count
+        self.input_size_x: int = input_size_x
+        self.input_size_y: int = input_size_y
+
+        output_size = len(BlendShapeSlots.of(BabbleBlendShapeEnum))
+        images_bytes = slot_count * input_size_y * input_size_x
+        # The output values are float64 and must be aligned
+        outputs_offset = (images_bytes + 7) // 8 * 8
+        size = outputs_offset + slot_count * output_size * 8
+
+        if name is None:
+            self.__memory: SharedMemory = SharedMemory(create=True, size=size)
+            self.__owner: bool = True
+        else:
+            self.__memory: SharedMemory = BabbleSharedMemory.__attach(name)
+            self.__owner: bool = False
+
+        self.images: ndarray = numpy.ndarray((slot_count, input_size_y, input_size_x), dtype=numpy.uint8,
+                                             buffer=self.__memory.buf)
+        self.outputs: ndarray = numpy.ndarray((slot_count, output_size), dtype=numpy.float64,
+                                              buffer=self.__memory.buf, offset=outputs_offset)
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    def close(self) -> None:
+        # The views must be released before the buffer
+        del self.images
+        del self.outputs
+
+        self.__memory.close()
+
+        if self.__owner:
+            self.__memory.unlink()
+
+    @staticmethod
+    def __attach(name: str) -> SharedMemory:
+        try:
+            return SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 the attached block is registered too, the resource tracker would unlink it when
+            # the worker exits
+            memory = SharedMemory(name=name)
+            # noinspection PyProtectedMember
+            resource_tracker.unregister(memory._name, "shared_memory")
+
+            return memory
@@ -0,0 +1,85 @@
+import logging
+import traceback
+from multiprocessing.connection import Connection
+
+from src.stream.babble.BabbleModel import BabbleModel
+from src.stream.babble.BabbleModelFactory import BabbleModelFactory
+from src.stream.babble.process.BabbleSharedMemory import BabbleSharedMemory
+from src.stream.babble.process.BabbleWorkerModelInfo import BabbleWorkerModelInfo
+
+_logger = logging.getLogger(__name__)
+
+
+class BabbleWorkerMain:
+    """
+    Entry point of the Babble worker process. The app sends requests through the connection and waits for the
+    reply of every request, the images and values are exchanged through BabbleSharedMemory.
+
+    Requests and replies:
+        ("load", model_path, use_gpu, intra_op_num_threads, allow_spinning, device_id) -> ("ok", info | None)
+        ("attach", name, slot_count, input_size_x, input_size_y) -> ("ok", None)
+        ("infer", count) -> ("ok", None), the values of images[:count] are written to outputs[:count]
+        ("close",) -> no reply
+
+        Any request -> ("error", traceback) if it failed.
+    """
+
+    @staticmethod
+    def run(connection: Connection, log_level: int) -> None:
+        logging.basicConfig(level=log_level, format="[%(levelname)s] Babble worker: %(message)s")
+
+        model: BabbleModel | None = None
+        shared_memory: BabbleSharedMemory | None = None
+
+        try:
+            while True:
+                try:
+                    request = connection.recv()
+                except EOFError:
+                    return
+
+                command = request[0]
+                if command == "close":
+                    return
+
+                try:
+                    if command == "load":
+                        model = None
+                        model = BabbleModelFactory.create(*request[1:])
+
+                        connection.send(("ok", BabbleWorkerMain.__get_info(model)))
+                    elif command == "attach":
+                        if shared_memory is not None:
+                            shared_memory.close()
+                            shared_memory = None
+
+                        shared_memory = BabbleSharedMemory(request[2], request[3], request[4], request[1])
+
+                        connection.send(("ok", None))
+                    elif command == "infer":
+                        count = request[1]
+
+                        if count == 1:
+                            shared_memory.outputs[0] = model.process_gray_image(shared_memory.images[0])
+                        else:
+                            shared_memory.outputs[:count] = model.process_gray_images(
+                                list(shared_memory.images[:count]))
+
+                        connection.send(("ok", None))
+                    else:
+                        raise ValueError(f"Unknown request {command}")
+                except Exception:
+                    connection.send(("error", traceback.format_exc()))
+        finally:
+            if shared_memory is not None:
+                shared_memory.close()
+
+            connection.close()
+
+    @staticmethod
+    def __get_info(model: BabbleModel | None) -> BabbleWorkerModelInfo | None:
+        if model is None:
+            return None
+
+        return BabbleWorkerModelInfo(model.is_default_model, model.input_size_x, model.input_size_y,
+                                     model.supports_batching, model.get_provider_name())
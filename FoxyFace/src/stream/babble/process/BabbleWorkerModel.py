@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+from cv2.typing import MatLike
+from numpy import ndarray
+
+from src.stream.babble.process.BabbleWorkerModelInfo import BabbleWorkerModelInfo
+from src.stream.babble.process.BabbleWorkerProcess import BabbleWorkerProcess
+
+
+@dataclass(slots=True, frozen=True)
+class BabbleWorkerModel:
+    """
+    BabbleModel that is loaded in a BabbleWorkerProcess.
+    """
+
+    __worker: BabbleWorkerProcess
+    __info: BabbleWorkerModelInfo
+
+    @property
+    def is_default_model(self) -> bool:
+        return self.__info.is_default_model
+
+    @property
+    def input_size_x(self) -> int:
+        return self.__info.input_size_x
+
+    @property
+    def input_size_y(self) -> int:
+        return self.__info.input_size_y
+
+    @property
+    def supports_batching(self) -> bool:
+        return self.__info.supports_batching
+
+    def process_gray_image(self, image: MatLike) -> ndarray:
+        return self.__worker.infer([image])[0]
+
+    def process_gray_images(self, images: list[MatLike]) -> ndarray:
+        return self.__worker.infer(images)
+
+    def is_alive(self) -> bool:
+        return self.__worker.is_alive()
+
+    def get_provider_name(self) -> str | None:
+        return self.__info.provider_name
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class BabbleWorkerModelInfo:
+    is_default_model: bool
+    input_size_x: int
+    input_size_y: int
+    supports_batching: bool
+    provider_name: str | None
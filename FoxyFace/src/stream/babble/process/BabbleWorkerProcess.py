@@ -0,0 +1,131 @@
+import logging
+import multiprocessing
+from threading import Lock
+
+from cv2.typing import MatLike
+from numpy import ndarray
+
+from src.stream.babble.process.BabbleSharedMemory import BabbleSharedMemory
+from src.stream.babble.process.BabbleWorkerMain import BabbleWorkerMain
+from src.stream.babble.process.BabbleWorkerModelInfo import BabbleWorkerModelInfo
+
+_logger = logging.getLogger(__name__)
+
+
+class BabbleWorkerProcess:
+    """
+    Runs the Babble model in a separate process, so the inference doesn't compete with the app threads for the GIL.
+    The calling thread only copies the images into shared memory and waits for the reply without holding the GIL.
+    """
+
+    __LOAD_TIMEOUT: float = 120.0
+    __REQUEST_TIMEOUT: float = 10.0
+
+    def __init__(self):
+        context = multiprocessing.get_context("spawn")
+
+        self.__connection, worker_connection = context.Pipe()
+        self.__process = context.Process(target=BabbleWorkerMain.run,
+                                         args=(worker_connection, logging.getLogger().getEffectiveLevel()),
+                                         daemon=True, name="Babble Worker")
+        self.__process.start()
+
+        worker_connection.close()
+
+        self.__shared_memory: BabbleSharedMemory | None = None
+        self.__lock: Lock = Lock()
+
+    def is_alive(self) -> bool:
+        return self.__process.is_alive()
+
+    def load(self, model_path: str, use_gpu: bool, intra_op_num_threads: int, allow_spinning: bool,
+             device_id: int) -> BabbleWorkerModelInfo | None:
+        with self.__lock:
+            info: BabbleWorkerModelInfo | None = self.__request(
+                ("load", model_path, use_gpu, intra_op_num_threads, allow_spinning, device_id),
+                BabbleWorkerProcess.__LOAD_TIMEOUT)
+
+            if info is not None:
+                self.__attach(1, info.input_size_x, info.input_size_y)
+
+            return info
+
+    def infer(self, images: list[MatLike]) -> ndarray:
+        """
+        Returns:
+            Values (images, slots) in the slot order of BabbleBlendShapeEnum.
+        """
+
+        with self.__lock:
+            shared_memory = self.__shared_memory
+            if shared_memory is None:
+                raise RuntimeError("Babble worker has no model")
+
+            if len(images) > shared_memory.slot_count:
+                shared_memory = self.__attach(len(images), shared_memory.input_size_x, shared_memory.input_size_y)
+
+            for index, image in enumerate(images):
+                shared_memory.images[index] = image
+
+            self.__request(("infer", len(images)), BabbleWorkerProcess.__REQUEST_TIMEOUT)
+
+            return shared_memory.outputs[:len(images)].copy()
+
+    def close(self) -> None:
+        with self.__lock:
+            try:
+                self.__connection.send(("close",))
+            except Exception:
+                _logger.info("Babble worker is already closed")
+
+            self.__process.join(5.0)
+            if self.__process.is_alive():
+                _logger.warning("Babble worker didn't stop, terminating it")
+
+                self.__process.terminate()
+                self.__process.join()
+
+            self.__connection.close()
+
+            if self.__shared_memory is not None:
+                self.__shared_memory.close()
+                self.__shared_memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __attach(self, slot_count: int, input_size_x: int, input_size_y: int) -> BabbleSharedMemory:
+        shared_memory = BabbleSharedMemory(slot_count, input_size_x, input_size_y)
+
+        try:
+            self.__request(("attach", shared_memory.name, slot_count, input_size_x, input_size_y),
+                           BabbleWorkerProcess.__REQUEST_TIMEOUT)
+        except Exception:
+            shared_memory.close()
+            raise
+
+        # The worker has released the previous block
+        if self.__shared_memory is not None:
+            self.__shared_memory.close()
+
+        self.__shared_memory = shared_memory
+
+        return shared_memory
+
+    def __request(self, request: tuple, timeout: float):
+        self.__connection.send(request)
+
+        if not self.__connection.poll(timeout):
+            # A late reply would be taken as the reply of the next request
+            self.__process.terminate()
+
+            raise RuntimeError(f"Babble worker didn't answer {request[0]} in {timeout} s, the worker is stopped")
+
+        status, value = self.__connection.recv()
+        if status != "ok":
+            raise RuntimeError(f"Babble worker failed {request[0]}:\n{value}")
+
+        return value
@@ -1,9 +1,63 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Hashable
 
 from cv2.typing import MatLike
 
+from src.stream.camera.CameraOrientation import CameraOrientation
+from src.stream.camera.JpegDecoder import JpegDecoder
+from src.stream.trace.FrameTrace import FrameTrace
+
 
 @dataclass(frozen=True, slots=True)
 class CameraFrame:
-    frame: MatLike
+    """
+    The frame is shared between all consumers without copying, treat it as read-only.
+
+    Frames of MJPEG cameras can keep the JPEG data instead of the image. The image is decoded when a consumer uses
+    it for the first time, frames that no consumer takes are never decoded.
+    """
+
+    _frame: MatLike | None  # None until decoded if the frame is encoded, use frame
     timestamp_ns: int
+    trace: FrameTrace | None = None
+
+    # Captured frame this frame was processed from, in the color order, orientation and resolution of the camera.
+    # None if this is the captured frame.
+    source: "CameraFrame | None" = None
+    orientation: CameraOrientation | None = None  # Applied to the source to get this frame
+
+    encoded: MatLike | None = None  # JPEG data of the camera
+
+    __processed: dict[Hashable, MatLike] = field(default_factory=dict, init=False, repr=False, compare=False)
+    __processed_lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    @property
+    def frame(self) -> MatLike:
+        frame = self._frame
+        if frame is not None:
+            return frame
+
+        return self.get_processed(CameraFrame, lambda packet: JpegDecoder.decode(packet.encoded))
+
+    def get_processed(self, key: Hashable, process: Callable[["CameraFrame"], MatLike]) -> MatLike:
+        """
+        Returns the frame processed by the given function. The result is cached in the frame, so every consumer
+        that asks for the same key gets the same image and the processing is done only once per frame.
+
+        Args:
+            key: Identifies the processing, e.g. the processing options.
+            process: Called with this frame if there's no cached result.
+        """
+
+        processed = self.__processed.get(key)
+        if processed is not None:
+            return processed
+
+        with self.__processed_lock:
+            processed = self.__processed.get(key)
+            if processed is None:
+                processed = process(self)
+                self.__processed[key] = processed
+
+        return processed
@@ -0,0 +1,68 @@
+import sys
+
+from cv2.typing import MatLike
+
+
+class CameraFramePool:
+    """
+    A small pool of frame buffers that the camera reads into instead of allocating a new image per frame.
+
+    A buffer is handed out again only when nothing except the pool references it, so frames that are still held
+    by a consumer (or any numpy view of them) are never overwritten. The CPython reference counter is used as
+    the reference count, so consumers don't need to release frames explicitly.
+
+    Not thread-safe, the pool must be used only by one thread, e.g. the capture thread.
+    """
+
+    def __init__(self, max_buffers: int = 6):
+        if max_buffers <= 0:
+            raise ValueError("max_buffers must be positive")
+
+        self.__max_buffers: int = max_buffers
+        self.__buffers: list[MatLike] = []
+        self.__next_index: int = 0
+
+        # Calculated on the same code path as the check itself, so the interpreter's own temporary references
+        # are included in the baseline
+        self.__free_ref_count: int = CameraFramePool.__ref_count([bytearray()], 0)
+
+    def acquire(self) -> MatLike | None:
+        """
+        Returns:
+            A buffer that is not referenced by any consumer, or None if all buffers are busy or the pool is empty.
+        """
+
+        buffer_count = len(self.__buffers)
+
+        for _ in range(buffer_count):
+            index = self.__next_index
+            self.__next_index = (index + 1) % buffer_count
+
+            if CameraFramePool.__ref_count(self.__buffers, index) <= self.__free_ref_count:
+                return self.__buffers[index]
+
+        return None
+
+    def adopt(self, buffer: MatLike) -> None:
+        """
+        Adds a newly allocated buffer to the pool. Buffers with a different shape or type are dropped, this happens
+        when the camera resolution changes.
+        """
+
+        for pooled_buffer in self.__buffers:
+            if pooled_buffer is buffer:
+                return
+
+        if self.__buffers and (self.__buffers[0].shape != buffer.shape or self.__buffers[0].dtype != buffer.dtype):
+            self.clear()
+
+        if len(self.__buffers) < self.__max_buffers:
+            self.__buffers.append(buffer)
+
+    def clear(self) -> None:
+        self.__buffers.clear()
+        self.__next_index = 0
+
+    @staticmethod
+    def __ref_count(buffers: list, index: int) -> int:
+        return sys.getrefcount(buffers[index])
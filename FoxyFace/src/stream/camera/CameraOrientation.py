@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+import cv2
+from cv2.typing import MatLike
+
+
+@dataclass(frozen=True, slots=True)
+class CameraOrientation:
+    """
+    Mirroring and rotation applied to the camera frames, mirroring is applied before the rotation.
+    """
+
+    mirror_x: bool = False
+    mirror_y: bool = False
+    rotate_ninety: bool = False
+
+    def apply(self, frame: MatLike) -> MatLike:
+        if self.mirror_x and self.mirror_y:
+            frame = cv2.flip(frame, -1)
+        elif self.mirror_x:
+            frame = cv2.flip(frame, 1)
+        elif self.mirror_y:
+            frame = cv2.flip(frame, 0)
+
+        if self.rotate_ninety:
+            frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+
+        return frame
+
+    def to_source(self, x: float, y: float) -> tuple[float, float]:
+        """
+        Maps a normalized point of the oriented frame to the normalized point of the frame before apply.
+        """
+
+        if self.rotate_ninety:
+            x, y = y, 1.0 - x
+
+        if self.mirror_x:
+            x = 1.0 - x
+        if self.mirror_y:
+            y = 1.0 - y
+
+        return x, y
+
+    def to_source_pixels(self, x: float, y: float, source_width: int, source_height: int) -> tuple[float, float]:
+        """
+        Maps a normalized point of the oriented frame to pixels of the source frame. Sampling the source there gives
+        the same pixel as sampling the oriented frame at x * width, y * height.
+        """
+
+        width, height = (source_height, source_width) if self.rotate_ninety else (source_width, source_height)
+
+        # Pixel centers are at integer coordinates, move to the edges and back around the mapping
+        x, y = self.to_source(x + 0.5 / width, y + 0.5 / height)
+
+        return x * source_width - 0.5, y * source_height - 0.5
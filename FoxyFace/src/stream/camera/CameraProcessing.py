@@ -1,8 +1,15 @@
 import cv2
+import numpy
+from cv2.typing import MatLike
 
 from src.stream.camera.CameraFrame import CameraFrame
+from src.stream.camera.CameraFramePool import CameraFramePool
+from src.stream.camera.CameraOrientation import CameraOrientation
 from src.stream.camera.CameraProcessingOption import CameraProcessingOption
+from src.stream.camera.CameraTransform import CameraTransform
+from src.stream.camera.JpegDecoder import JpegDecoder
 from src.stream.core.StreamReadOnly import StreamReadOnly
+from src.stream.trace.FrameTrace import FrameTrace
 
 
 class CameraProcessing(StreamReadOnly[CameraFrame]):
@@ -10,18 +17,76 @@ class CameraProcessing(StreamReadOnly[CameraFrame]):
         self.__stream: StreamReadOnly[CameraFrame] = stream
         self.__post_processing_options: CameraProcessingOption = options
 
+        # Compiled again only when the orientation changes
+        self.__transform: tuple[CameraOrientation, CameraTransform] | None = None
+
+        # Processed frames are written into reused buffers, the frames are processed only in the thread of poll
+        self.__frame_pool: CameraFramePool = CameraFramePool()
+
     def poll(self, timeout: float | None = None) -> CameraFrame:
         packet = self.__stream.poll(timeout)
 
-        new_frame = cv2.cvtColor(packet.frame, cv2.COLOR_BGR2RGB)
+        orientation = CameraOrientation(self.__post_processing_options.mirror_x,
+                                        self.__post_processing_options.mirror_y,
+                                        self.__post_processing_options.rotate_ninety)
+        max_size = self.__post_processing_options.max_size
+
+        # The same camera frame goes to the MediaPipe and the preview, the first one converts it, others reuse it
+        new_frame = packet.get_processed((CameraProcessing, orientation, max_size),
+                                         lambda frame: self.__process(frame, orientation, max_size))
+
+        return CameraFrame(new_frame, packet.timestamp_ns, FrameTrace.extend(packet.trace, "camera_processing"),
+                           packet, orientation)
+
+    def __process(self, packet: CameraFrame, orientation: CameraOrientation, max_size: int) -> MatLike:
+        if packet.encoded is not None and max_size > 0:
+            # libjpeg decodes at 1/2, 1/4 or 1/8 of the size directly, the full image is decoded only if needed
+            frame = JpegDecoder.decode(packet.encoded, max_size)
+        else:
+            frame = packet.frame
+
+        # Downscale first, the color conversion and the orientation are done on the smaller frame
+        if max_size > 0:
+            frame = CameraProcessing.__downscale(frame, max_size)
+
+        transform = self.__get_transform(orientation)
+
+        new_frame = self.__frame_pool.acquire()
+        shape = transform.get_shape(frame.shape)
+        if new_frame is None or new_frame.shape != shape or new_frame.dtype != frame.dtype:
+            new_frame = numpy.empty(shape, dtype=frame.dtype)
+            self.__frame_pool.adopt(new_frame)
+
+        if transform.is_identity():
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=new_frame)
+
+        # The channels are swapped in place after the pixels are moved, one pass less than converting a copy first
+        new_frame = transform.apply(frame, new_frame)
+
+        return cv2.cvtColor(new_frame, cv2.COLOR_BGR2RGB, dst=new_frame)
+
+    def __get_transform(self, orientation: CameraOrientation) -> CameraTransform:
+        transform = self.__transform
+        if transform is None or transform[0] != orientation:
+            transform = (orientation, CameraTransform.compile(orientation))
+            self.__transform = transform
+
+        return transform[1]
+
+    @staticmethod
+    def __downscale(frame: MatLike, max_size: int) -> MatLike:
+        height, width = frame.shape[:2]
+
+        # Halving with linear interpolation averages 2x2 pixels like INTER_AREA, but it's a few times faster
+        while max(height, width) >= max_size * 2:
+            width //= 2
+            height //= 2
+            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_LINEAR)
 
-        # You can optimize flip and rotate to max two calls, if you need, im too lazy
+        if max(height, width) <= max_size:
+            return frame
 
-        if self.__post_processing_options.mirror_x:
-            new_frame = cv2.flip(new_frame, 1)
-        if self.__post_processing_options.mirror_y:
-            new_frame = cv2.flip(new_frame, 0)
-        if self.__post_processing_options.rotate_ninety:
-            new_frame = cv2.rotate(new_frame, cv2.ROTATE_90_CLOCKWISE)
+        scale = max_size / max(height, width)
 
-        return CameraFrame(new_frame, packet.timestamp_ns)
+        return cv2.resize(frame, (max(1, round(width * scale)), max(1, round(height * scale))),
+                          interpolation=cv2.INTER_LINEAR)
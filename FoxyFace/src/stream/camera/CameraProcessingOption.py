@@ -6,3 +6,6 @@ class CameraProcessingOption:
     mirror_x: bool = False
     mirror_y: bool = False
     rotate_ninety: bool = False
+
+    # Longest side of the processed frame in pixels, larger frames are downscaled. 0 keeps the camera resolution.
+    max_size: int = 0
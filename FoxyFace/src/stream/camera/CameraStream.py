@@ -1,30 +1,43 @@
 import logging
-import platform
 import time
-from threading import Event, Thread
-
-import cv2
+from threading import Event, Lock, Thread
 
 from src.stream.camera.CameraFrame import CameraFrame
 from src.stream.camera.CameraEnumerator import CameraEnumerator
+from src.stream.camera.CameraFramePool import CameraFramePool
+from src.stream.camera.CaptureMonitor import CaptureMonitor
+from src.stream.camera.JpegDecoder import JpegDecoder
+from src.stream.camera.source.CameraFrameSource import CameraFrameSource
+from src.stream.camera.source.FrameSource import FrameSource
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
 from src.stream.core.components.WriteStreamSplitter import WriteStreamSplitter
+from src.stream.trace.FrameTrace import FrameTrace
 
 _logger = logging.getLogger(__name__)
 
 
 class CameraStream:
+    __MAX_DRAINED_FRAMES: int = 4  # Common size of the driver queue
+
     def __init__(self):
         self.__stream_root = WriteStreamSplitter[CameraFrame]()
 
-        self.__camera: cv2.VideoCapture | None = None
+        # Serializes replacing and releasing the source, the loop only reads the reference
+        self.__source_lock: Lock = Lock()
+        self.__source: FrameSource | None = None
+        self.__frame_pool: CameraFramePool = CameraFramePool()
+
+        # Used only by the capture thread
+        self.__capture_monitor: CaptureMonitor = CaptureMonitor()
+        self.__monitored_source: FrameSource | None = None
 
         self.__close_event = Event()
 
         self.__thread = Thread(target=self.__start_loop, daemon=True, name="Camera Stream")
         self.__thread.start()
 
-    def start_new_camera(self, camera_id: int, width: int, height: int, camera_name: str = ""):
+    def start_new_camera(self, camera_id: int, width: int, height: int, camera_name: str = "",
+                         mjpeg_passthrough: bool = False):
         """
         Start a new camera stream.
         
@@ -33,6 +46,7 @@ class CameraStream:
             width: Desired frame width
             height: Desired frame height
             camera_name: Optional camera name to search for (preferred over camera_id)
+            mjpeg_passthrough: Keep the JPEG data of MJPEG cameras, frames are decoded only when they are used
         """
         if self.__close_event.is_set():
             raise RuntimeError("CameraStream is closed")
@@ -56,22 +70,37 @@ class CameraStream:
         if not isinstance(actual_camera_id, int) or actual_camera_id < 0:
             raise ValueError("Invalid camera id")
 
-        camera = self.__camera
-        if camera is not None:
-            camera.release()
-
-        if platform.system() == "Windows":
-            camera = cv2.VideoCapture(actual_camera_id, cv2.CAP_DSHOW)
-        else:
-            camera = cv2.VideoCapture(actual_camera_id)
+        with self.__source_lock:
+            if self.__close_event.is_set():
+                raise RuntimeError("CameraStream is closed")
 
-        camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self.__release_source()
 
-        self.__camera = camera
+            self.__source = CameraFrameSource(actual_camera_id, width, height, mjpeg_passthrough)
 
         _logger.info(f"Camera started (id: {actual_camera_id}, name: {camera_name or 'N/A'})")
 
+    def start_new_source(self, source: FrameSource):
+        """
+        Replaces the camera or the previous source, e.g. by a video file. Frames are timestamped when they are read,
+        the same as camera frames.
+        """
+        if self.__close_event.is_set():
+            raise RuntimeError("CameraStream is closed")
+
+        with self.__source_lock:
+            if self.__close_event.is_set():
+                raise RuntimeError("CameraStream is closed")
+
+            self.__release_source()
+
+            self.__source = source
+
+        _logger.info(f"Frame source started ({type(source).__name__})")
+
+    @property
+    def capture_monitor(self) -> CaptureMonitor:
+        return self.__capture_monitor
 
     def register_stream(self, stream: StreamWriteOnly[CameraFrame]) -> None:
         self.__stream_root.register_stream(stream)
@@ -80,10 +109,10 @@ class CameraStream:
         self.__stream_root.unregister_stream(stream)
 
     def close(self) -> None:
-        self.__close_event.set()
+        with self.__source_lock:
+            self.__close_event.set()
 
-        if self.__camera is not None:
-            self.__camera.release()
+            self.__release_source()
 
         self.__thread.join()
 
@@ -95,19 +124,90 @@ class CameraStream:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    def __release_source(self):
+        source = self.__source
+        if source is not None:
+            source.release()
+
     def __start_loop(self):
         while not self.__close_event.is_set():
             try:
-                if self.__camera is not None and self.__camera.isOpened():
-                    success, numpy_frame_from_opencv = self.__camera.read()  # fast close not guaranteed
-                    if success:
-                        current_time = time.perf_counter_ns()
+                source = self.__source
+                if source is not None and source.is_opened():
+                    if source is not self.__monitored_source:
+                        self.__monitored_source = source
+                        self.__capture_monitor.reset()
+
+                    # fast close not guaranteed
+                    grab_time = self.__grab(source)
 
-                        packet = CameraFrame(numpy_frame_from_opencv, current_time)
+                    if grab_time is not None:
+                        packet = self.__retrieve(source, grab_time)
 
-                        self.__stream_root.put(packet)
-                        continue
+                        if packet is not None:
+                            self.__stream_root.put(packet)
+                            continue
             except Exception:
                 _logger.warning("Exception", exc_info=True, stack_info=True)
 
             self.__close_event.wait(0.01)
+
+    def __retrieve(self, source: FrameSource, grab_time: int) -> CameraFrame | None:
+        if source.is_encoded():
+            # The JPEG data is new for every frame, the pool is only for decoded frames
+            encoded = source.retrieve()
+            if encoded is None:
+                return None
+
+            if encoded.ndim == 1:
+                if JpegDecoder.read_size(encoded) is None:
+                    _logger.debug("Skipped corrupted MJPEG frame")
+                    return None
+
+                self.__capture_monitor.on_retrieve(encoded)
+
+                # Decoded by the first consumer that uses the frame, the trace has no decode stage
+                return CameraFrame(None, grab_time, FrameTrace("capture", grab_time), encoded=encoded)
+
+            frame = encoded  # The source fell back to decoded frames
+        else:
+            buffer = self.__frame_pool.acquire()
+
+            frame = source.retrieve(buffer)
+            if frame is None:
+                return None
+
+            if frame is not buffer:  # New buffer or the resolution has changed
+                self.__frame_pool.adopt(frame)
+
+        self.__capture_monitor.on_retrieve(frame)
+
+        # Timestamped when it was grabbed, the decoding is a stage of the trace
+        return CameraFrame(frame, grab_time, FrameTrace("capture", grab_time).mark("decode"))
+
+    def __grab(self, source: FrameSource) -> int | None:
+        """
+        Returns:
+            Time of the grab of the freshest frame, None if no frame was grabbed.
+        """
+
+        start_time = time.perf_counter_ns()
+        if not source.grab():
+            return None
+
+        grab_time = time.perf_counter_ns()
+
+        if self.__capture_monitor.on_grab(start_time, grab_time) and source.is_live():
+            # The loop fell behind, the driver queue has old frames, keep grabbing while they come without waiting
+            for _ in range(CameraStream.__MAX_DRAINED_FRAMES):
+                start_time = time.perf_counter_ns()
+                if not source.grab():
+                    return None
+
+                grab_time = time.perf_counter_ns()
+                self.__capture_monitor.on_drained(grab_time)
+
+                if not self.__capture_monitor.is_queued(start_time, grab_time):
+                    break
+
+        return grab_time
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+
+import cv2
+from cv2.typing import MatLike
+
+from src.stream.camera.CameraOrientation import CameraOrientation
+
+
+@dataclass(frozen=True, slots=True)
+class CameraTransform:
+    """
+    CameraOrientation compiled into an optional transpose followed by an optional flip, every combination of the
+    mirroring and the rotation can be written like this. Most of them are a single OpenCV call.
+    """
+
+    transpose: bool = False
+    flip_code: int | None = None  # cv2.flip code, None if not flipped
+
+    @staticmethod
+    def compile(orientation: CameraOrientation) -> "CameraTransform":
+        flip_x = orientation.mirror_x
+        flip_y = orientation.mirror_y
+
+        if orientation.rotate_ninety:
+            # The clockwise rotation is a transpose and a horizontal flip, the transpose swaps the axes of the
+            # flips made before it
+            flip_x, flip_y = not flip_y, flip_x
+
+        if flip_x and flip_y:
+            flip_code = -1
+        elif flip_x:
+            flip_code = 1
+        elif flip_y:
+            flip_code = 0
+        else:
+            flip_code = None
+
+        return CameraTransform(orientation.rotate_ninety, flip_code)
+
+    def is_identity(self) -> bool:
+        return not self.transpose and self.flip_code is None
+
+    def get_shape(self, shape: tuple[int, ...]) -> tuple[int, ...]:
+        if self.transpose:
+            return (shape[1], shape[0]) + tuple(shape[2:])
+
+        return tuple(shape)
+
+    def apply(self, frame: MatLike, dst: MatLike) -> MatLike:
+        """
+        Args:
+            dst: Preallocated result with the shape from get_shape, must not be the frame itself.
+        """
+
+        if self.transpose:
+            if self.flip_code == 1:
+                return cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE, dst=dst)
+            if self.flip_code == 0:
+                return cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE, dst=dst)
+
+            dst = cv2.transpose(frame, dst=dst)
+            if self.flip_code is not None:
+                dst = cv2.flip(dst, self.flip_code, dst=dst)
+
+            return dst
+
+        if self.flip_code is not None:
+            return cv2.flip(frame, self.flip_code, dst=dst)
+
+        dst[...] = frame
+        return dst
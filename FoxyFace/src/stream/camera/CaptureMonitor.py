@@ -0,0 +1,114 @@
+import zlib
+
+from cv2.typing import MatLike
+
+from src.metrics.CounterMetric import CounterMetric
+
+
+class CaptureMonitor:
+    """
+    Watches the grabs of the capture loop. It learns the frame interval of the source, detects frames that were
+    waiting in the driver queue after the loop fell behind and counts dropped, duplicated and late frames.
+
+    Must be used only by the capture thread, the counters can be read from any thread.
+    """
+
+    __INTERVAL_GAIN: float = 1.0 / 8.0
+
+    def __init__(self, late_factor: float = 1.5, stall_factor: float = 2.0):
+        """
+        Args:
+            late_factor: A frame is late if it comes this many intervals after the previous one.
+            stall_factor: The driver queue is drained if the previous grab was this many intervals ago.
+        """
+
+        self.__late_factor: float = late_factor
+        self.__stall_factor: float = stall_factor
+
+        self.dropped: CounterMetric = CounterMetric()  # Grabbed but not retrieved, older than the next frame
+        self.duplicated: CounterMetric = CounterMetric()  # Same image as the previous frame
+        self.late: CounterMetric = CounterMetric()  # Came later than late_factor intervals
+
+        self.__interval_ns: float | None = None
+        self.__last_grab_ns: int | None = None
+        self.__last_signature: int | None = None
+
+    def reset(self) -> None:
+        """
+        Forgets the interval and the previous frame, e.g. when the source changes. The counters are kept.
+        """
+
+        self.__interval_ns = None
+        self.__last_grab_ns = None
+        self.__last_signature = None
+
+    def on_grab(self, start_ns: int, end_ns: int) -> bool:
+        """
+        Records a grab that took from start_ns to end_ns.
+
+        Returns:
+            True if the loop fell behind and the frame was already waiting in the driver queue, a fresher frame may
+            be waiting after it.
+        """
+
+        last_grab_ns = self.__last_grab_ns
+        self.__last_grab_ns = end_ns
+
+        interval_ns = self.__interval_ns
+
+        if last_grab_ns is None:
+            return False
+
+        elapsed_ns = end_ns - last_grab_ns
+
+        if interval_ns is None:
+            self.__interval_ns = float(elapsed_ns)
+            return False
+
+        if elapsed_ns > interval_ns * self.__late_factor:
+            self.late.increment()
+
+        # Stalls would make the interval longer than the frame rate of the source
+        if elapsed_ns < interval_ns * self.__stall_factor:
+            self.__interval_ns = interval_ns + (elapsed_ns - interval_ns) * CaptureMonitor.__INTERVAL_GAIN
+
+        return elapsed_ns >= interval_ns * self.__stall_factor and self.is_queued(start_ns, end_ns)
+
+    def is_queued(self, start_ns: int, end_ns: int) -> bool:
+        """
+        Returns:
+            True if the grab returned without waiting for the camera.
+        """
+
+        interval_ns = self.__interval_ns
+
+        return interval_ns is not None and end_ns - start_ns < interval_ns / 4.0
+
+    def on_drained(self, end_ns: int) -> None:
+        """
+        Records that the previous grabbed frame was dropped for a fresher one grabbed at end_ns.
+        """
+
+        self.dropped.increment()
+        self.__last_grab_ns = end_ns
+
+    def on_retrieve(self, frame: MatLike) -> None:
+        """
+        Args:
+            frame: The image, or the JPEG data of the frame.
+        """
+
+        if frame.ndim == 1:
+            # Compressed frames are small, the whole data is checked
+            signature = zlib.crc32(frame)
+        else:
+            height, width = frame.shape[:2]
+
+            # About 64 x 64 samples, enough to tell camera frames apart, the sensor noise changes every pixel
+            samples = frame[::max(1, height // 64), ::max(1, width // 64)]
+            signature = zlib.crc32(samples.tobytes())
+
+        if signature == self.__last_signature:
+            self.duplicated.increment()
+
+        self.__last_signature = signature
@@ -0,0 +1,73 @@
+import cv2
+import numpy
+from cv2.typing import MatLike
+
+# Start of frame markers, the other markers in 0xC0-0xCF are tables
+_sof_markers: frozenset[int] = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# libjpeg decodes directly at these scales, much faster than decoding the full image and resizing it
+_reduced_flags: tuple[tuple[int, int], ...] = ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4),
+                                               (2, cv2.IMREAD_REDUCED_COLOR_2))
+
+
+class JpegDecoder:
+    @staticmethod
+    def read_size(data: MatLike) -> tuple[int, int] | None:
+        """
+        Reads the size from the JPEG header without decoding the image.
+
+        Returns:
+            Width and height, None if the data isn't a JPEG image.
+        """
+
+        data = memoryview(numpy.ascontiguousarray(data).reshape(-1))
+
+        if len(data) < 4 or data[0] != 0xFF or data[1] != 0xD8:
+            return None
+
+        index = 2
+        while index + 9 <= len(data):
+            if data[index] != 0xFF:
+                return None
+
+            marker = data[index + 1]
+            if marker == 0xFF:  # Fill byte
+                index += 1
+                continue
+
+            if marker in _sof_markers:
+                height = (data[index + 5] << 8) | data[index + 6]
+                width = (data[index + 7] << 8) | data[index + 8]
+
+                return width, height
+
+            index += 2 + ((data[index + 2] << 8) | data[index + 3])
+
+        return None
+
+    @staticmethod
+    def decode(data: MatLike, min_size: int = 0) -> MatLike:
+        """
+        Decodes a BGR image, at a reduced scale if the longest side stays at least min_size.
+
+        Args:
+            min_size: Smallest longest side of the result in pixels, 0 decodes the full image.
+        """
+
+        flag = cv2.IMREAD_COLOR
+
+        if min_size > 0:
+            size = JpegDecoder.read_size(data)
+            if size is not None:
+                longest_side = max(size)
+
+                for scale, reduced_flag in _reduced_flags:
+                    if longest_side // scale >= min_size:
+                        flag = reduced_flag
+                        break
+
+        image = cv2.imdecode(data, flag)
+        if image is None:
+            raise ValueError("Failed to decode JPEG frame")
+
+        return image
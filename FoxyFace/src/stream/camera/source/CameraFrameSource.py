@@ -0,0 +1,80 @@
+import logging
+import platform
+
+import cv2
+from cv2.typing import MatLike
+
+_logger = logging.getLogger(__name__)
+
+
+class CameraFrameSource:
+    def __init__(self, camera_id: int, width: int, height: int, mjpeg_passthrough: bool = False):
+        """
+        Args:
+            mjpeg_passthrough: Ask the camera for MJPEG and return the JPEG data instead of decoding every frame.
+                Falls back to decoded frames if the camera or the backend doesn't support it.
+        """
+
+        if platform.system() == "Windows":
+            self.__camera = cv2.VideoCapture(camera_id, cv2.CAP_DSHOW)
+        else:
+            self.__camera = cv2.VideoCapture(camera_id)
+
+        # The format must be set before the resolution, some drivers offer high resolutions only for MJPEG
+        if mjpeg_passthrough:
+            self.__camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*"MJPG"))
+
+        self.__camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.__camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        self.__encoded: bool = mjpeg_passthrough and self.__start_passthrough()
+
+    def is_opened(self) -> bool:
+        return self.__camera.isOpened()
+
+    def is_live(self) -> bool:
+        return True
+
+    def is_encoded(self) -> bool:
+        return self.__encoded
+
+    def grab(self) -> bool:
+        return self.__camera.grab()
+
+    def retrieve(self, buffer: MatLike | None = None) -> MatLike | None:
+        if buffer is None or self.__encoded:
+            success, frame = self.__camera.retrieve()
+        else:
+            success, frame = self.__camera.retrieve(buffer)
+
+        if not success or frame is None:
+            return None
+
+        if self.__encoded:
+            if frame.ndim == 3:
+                # The backend accepted the property but still decodes the frames
+                _logger.warning("Camera doesn't pass MJPEG through, falling back to decoded frames")
+                self.__encoded = False
+                return frame
+
+            return frame.reshape(-1)
+
+        return frame
+
+    def read(self, buffer: MatLike | None = None) -> MatLike | None:
+        return self.retrieve(buffer) if self.grab() else None
+
+    def release(self) -> None:
+        self.__camera.release()
+
+    def __start_passthrough(self) -> bool:
+        fourcc = int(self.__camera.get(cv2.CAP_PROP_FOURCC))
+        if fourcc != cv2.VideoWriter.fourcc(*"MJPG"):
+            _logger.warning(f"Camera doesn't support MJPEG (format: {fourcc:#010x}), falling back to decoded frames")
+            return False
+
+        if not self.__camera.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+            _logger.warning("Camera backend doesn't support MJPEG passthrough, falling back to decoded frames")
+            return False
+
+        return True
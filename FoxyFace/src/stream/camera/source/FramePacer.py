@@ -0,0 +1,33 @@
+import time
+
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+
+
+class FramePacer:
+    """
+    Limits offline sources to their frame rate in the real-time mode. If the reader falls behind by more than
+    a frame, the schedule starts again from the current time instead of reading the missed frames at once.
+
+    Not thread-safe.
+    """
+
+    def __init__(self, fps: float, pacing: FramePacingEnum):
+        if fps <= 0.0:
+            raise ValueError("fps must be positive")
+
+        self.__period_ns: int = int(1_000_000_000 / fps)
+        self.__pacing: FramePacingEnum = pacing
+        self.__next_time_ns: int | None = None
+
+    def wait(self) -> None:
+        if self.__pacing != FramePacingEnum.RealTime:
+            return
+
+        current_time = time.perf_counter_ns()
+
+        if self.__next_time_ns is None or current_time - self.__next_time_ns > self.__period_ns:
+            self.__next_time_ns = current_time
+        elif self.__next_time_ns > current_time:
+            time.sleep((self.__next_time_ns - current_time) / 1_000_000_000)
+
+        self.__next_time_ns += self.__period_ns
@@ -0,0 +1,7 @@
+from enum import Enum, unique
+
+
+@unique
+class FramePacingEnum(Enum):
+    RealTime = 0  # Frames are read at the frame rate of the source
+    AsFastAsPossible = 1
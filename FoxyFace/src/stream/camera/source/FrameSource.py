@@ -0,0 +1,59 @@
+from typing import Protocol
+
+from cv2.typing import MatLike
+
+
+class FrameSource(Protocol):
+    def is_opened(self) -> bool:
+        ...
+
+    def is_live(self) -> bool:
+        """
+        Returns:
+            True if the frames are captured whether they are read or not, so old frames can wait in a queue.
+        """
+        ...
+
+    def is_encoded(self) -> bool:
+        """
+        Returns:
+            True if retrieve returns the JPEG data of the frame as a one-dimensional array instead of the image.
+        """
+        ...
+
+    def grab(self) -> bool:
+        """
+        Blocks until the next frame is captured, but doesn't decode it yet. The time of the grab is the time of the
+        frame.
+
+        Returns:
+            False if the frame can't be grabbed.
+        """
+        ...
+
+    def retrieve(self, buffer: MatLike | None = None) -> MatLike | None:
+        """
+        Decodes the last grabbed frame.
+
+        Args:
+            buffer: A free buffer from the previous frames, the source may read the frame into it.
+
+        Returns:
+            The frame, or None if it can't be decoded.
+        """
+        ...
+
+    def read(self, buffer: MatLike | None = None) -> MatLike | None:
+        """
+        Grabs and retrieves the next frame.
+
+        Args:
+            buffer: A free buffer from the previous frames, the source may read the frame into it.
+
+        Returns:
+            The frame, or None if it can't be read.
+        """
+        ...
+
+    def release(self) -> None:
+        ...
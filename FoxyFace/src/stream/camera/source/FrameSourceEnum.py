@@ -0,0 +1,9 @@
+from enum import Enum, unique
+
+
+@unique
+class FrameSourceEnum(Enum):
+    Camera = 0
+    VideoFile = 1
+    ImageSequence = 2  # Directory or glob of PNG/JPEG images
+    Synthetic = 3
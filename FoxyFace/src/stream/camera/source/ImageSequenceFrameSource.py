@@ -0,0 +1,71 @@
+import glob
+from pathlib import Path
+
+import cv2
+from cv2.typing import MatLike
+
+from src.stream.camera.source.FramePacer import FramePacer
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+
+_extensions: frozenset[str] = frozenset({".png", ".jpg", ".jpeg"})
+
+
+class ImageSequenceFrameSource:
+    """
+    Reads PNG/JPEG images in the order of their names.
+    """
+
+    def __init__(self, path: str, fps: float, pacing: FramePacingEnum, loop: bool = True):
+        """
+        Args:
+            path: A directory or a glob pattern.
+        """
+
+        if Path(path).is_dir():
+            files = [file for file in Path(path).iterdir() if file.is_file()]
+        else:
+            files = [Path(file) for file in glob.glob(path)]
+
+        self.__files: list[Path] = sorted(file for file in files if file.suffix.lower() in _extensions)
+        if not self.__files:
+            raise FileNotFoundError(f"No images found: {path}")
+
+        self.__pacer: FramePacer = FramePacer(fps, pacing)
+        self.__loop: bool = loop
+        self.__next_index: int = 0
+        self.__grabbed_file: Path | None = None
+
+    def is_opened(self) -> bool:
+        return self.__next_index < len(self.__files)
+
+    def is_live(self) -> bool:
+        return False
+
+    def is_encoded(self) -> bool:
+        return False
+
+    def grab(self) -> bool:
+        if not self.is_opened():
+            return False
+
+        self.__pacer.wait()
+
+        self.__grabbed_file = self.__files[self.__next_index]
+
+        self.__next_index += 1
+        if self.__loop and self.__next_index >= len(self.__files):
+            self.__next_index = 0
+
+        return True
+
+    def retrieve(self, buffer: MatLike | None = None) -> MatLike | None:
+        if self.__grabbed_file is None:
+            return None
+
+        return cv2.imread(str(self.__grabbed_file), cv2.IMREAD_COLOR)
+
+    def read(self, buffer: MatLike | None = None) -> MatLike | None:
+        return self.retrieve(buffer) if self.grab() else None
+
+    def release(self) -> None:
+        self.__next_index = len(self.__files)
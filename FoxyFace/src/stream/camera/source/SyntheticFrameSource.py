@@ -0,0 +1,63 @@
+import numpy
+from cv2.typing import MatLike
+
+from src.stream.camera.source.FramePacer import FramePacer
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+
+
+class SyntheticFrameSource:
+    """
+    Generates a moving BGR gradient, every frame is different. Doesn't contain a face, it is meant for measuring the
+    throughput of the pipeline.
+    """
+
+    def __init__(self, width: int, height: int, fps: float, pacing: FramePacingEnum):
+        if width <= 0 or height <= 0:
+            raise ValueError("Invalid frame size")
+
+        self.__shape: tuple[int, int, int] = (height, width, 3)
+        self.__pacer: FramePacer = FramePacer(fps, pacing)
+        self.__opened: bool = True
+        self.__frame_index: int = 0
+
+        self.__x = (numpy.arange(width) & 0xFF).astype(numpy.uint8)[numpy.newaxis, :]
+        self.__y = (numpy.arange(height) & 0xFF).astype(numpy.uint8)[:, numpy.newaxis]
+
+    def is_opened(self) -> bool:
+        return self.__opened
+
+    def is_live(self) -> bool:
+        return False
+
+    def is_encoded(self) -> bool:
+        return False
+
+    def grab(self) -> bool:
+        if not self.__opened:
+            return False
+
+        self.__pacer.wait()
+
+        self.__frame_index += 1
+
+        return True
+
+    def retrieve(self, buffer: MatLike | None = None) -> MatLike | None:
+        if not self.__opened:
+            return None
+
+        if buffer is None or buffer.shape != self.__shape or buffer.dtype != numpy.uint8:
+            buffer = numpy.empty(self.__shape, dtype=numpy.uint8)
+
+        offset = numpy.uint8(self.__frame_index & 0xFF)
+        numpy.add(self.__x, offset, out=buffer[:, :, 0])
+        numpy.add(self.__y, offset, out=buffer[:, :, 1])
+        buffer[:, :, 2] = offset
+
+        return buffer
+
+    def read(self, buffer: MatLike | None = None) -> MatLike | None:
+        return self.retrieve(buffer) if self.grab() else None
+
+    def release(self) -> None:
+        self.__opened = False
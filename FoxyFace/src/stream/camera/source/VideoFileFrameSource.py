@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import cv2
+from cv2.typing import MatLike
+
+from src.stream.camera.source.FramePacer import FramePacer
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+
+
+class VideoFileFrameSource:
+    def __init__(self, path: str, pacing: FramePacingEnum, loop: bool = True, default_fps: float = 30.0):
+        """
+        Args:
+            default_fps: Used if the file doesn't contain a frame rate.
+        """
+
+        self.__video = cv2.VideoCapture(str(Path(path).resolve(strict=True)))
+        self.__loop: bool = loop
+        self.__finished: bool = False
+
+        fps = self.__video.get(cv2.CAP_PROP_FPS)
+        self.__pacer: FramePacer = FramePacer(fps if fps > 0.0 else default_fps, pacing)
+
+    def is_opened(self) -> bool:
+        return not self.__finished and self.__video.isOpened()
+
+    def is_live(self) -> bool:
+        return False
+
+    def is_encoded(self) -> bool:
+        return False
+
+    def grab(self) -> bool:
+        self.__pacer.wait()
+
+        success = self.__video.grab()
+        if not success and self.__loop:
+            self.__video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+            success = self.__video.grab()
+
+        if not success:
+            self.__finished = True
+
+        return success
+
+    def retrieve(self, buffer: MatLike | None = None) -> MatLike | None:
+        if buffer is None:
+            success, frame = self.__video.retrieve()
+        else:
+            success, frame = self.__video.retrieve(buffer)
+
+        return frame if success else None
+
+    def read(self, buffer: MatLike | None = None) -> MatLike | None:
+        return self.retrieve(buffer) if self.grab() else None
+
+    def release(self) -> None:
+        self.__video.release()
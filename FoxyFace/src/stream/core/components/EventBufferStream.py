@@ -0,0 +1,100 @@
+import time
+from collections import deque
+from threading import Event
+
+from src.stream.core.StreamReadOnly import StreamReadOnly
+from src.stream.core.StreamWriteOnly import StreamWriteOnly
+
+
+class EventBufferStream[T](StreamReadOnly[T], StreamWriteOnly[T]):
+    """
+    Ring buffer for the hot paths between the pipeline threads, a replacement for BufferStream and
+    SingleBufferStream.
+
+    The values are handed over through a bounded deque, whose append and popleft are atomic, so put and poll don't
+    take a lock. The event is only used to wake up a waiting consumer and is set only when it was cleared by the
+    consumer. With max_len=1 it keeps only the latest value like SingleBufferStream.
+
+    Supports any number of producers and a single consumer.
+    """
+
+    def __init__(self, max_len: int = 1):
+        if max_len <= 0:
+            raise ValueError("max_len must be positive")
+
+        self.__values: deque[T] = deque(maxlen=max_len)
+        self.__closed: bool = False
+        self.__event: Event = Event()
+
+    def put(self, value: T) -> bool:
+        if self.__closed:
+            return False
+
+        self.__values.append(value)
+
+        # The consumer clears the event before it checks the deque for the last time, so a set event means the
+        # consumer will see the value without a wakeup
+        if not self.__event.is_set():
+            self.__event.set()
+
+        return True
+
+    def poll(self, timeout: float | None = None) -> T:
+        if timeout is not None and timeout <= 0.0:
+            raise TimeoutError()
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        while True:
+            if self.__closed:
+                raise InterruptedError()
+
+            try:
+                return self.__values.popleft()
+            except IndexError:
+                self.__wait(deadline)
+
+    def flush(self, timeout: float | None = None) -> list[T]:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        while True:
+            if self.__closed:
+                raise InterruptedError()
+
+            values = []
+            try:
+                while True:
+                    values.append(self.__values.popleft())
+            except IndexError:
+                pass
+
+            if values:
+                return values
+
+            self.__wait(deadline)
+
+    def close(self) -> None:
+        self.__closed = True
+
+        self.__values.clear()
+        self.__event.set()
+
+    def __wait(self, deadline: float | None) -> None:
+        self.__event.clear()
+
+        if self.__values or self.__closed:
+            return
+
+        if deadline is None:
+            self.__event.wait()
+            return
+
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0.0 or not self.__event.wait(remaining):
+            raise TimeoutError()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
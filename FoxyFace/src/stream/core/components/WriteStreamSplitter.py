@@ -8,7 +8,8 @@ _logger = logging.getLogger(__name__)
 
 class WriteStreamSplitter[T](StreamWriteOnly[T]):
     """
-    A thread-safe component that splits its input to multiple output streams.
+    A thread-safe component that splits its input to multiple output streams. The streams are stored as an
+    immutable tuple that is replaced on registration, so put doesn't take a lock.
 
     This class receives values via its `put` method and forwards them to all
     registered child streams. It automatically handles the lifecycle of child
@@ -16,7 +17,8 @@ class WriteStreamSplitter[T](StreamWriteOnly[T]):
     """
 
     def __init__(self):
-        self.__streams: set[StreamWriteOnly[T]] | None = set[StreamWriteOnly[T]]()
+        # Copy-on-write, put iterates the current tuple without the lock
+        self.__streams: tuple[StreamWriteOnly[T], ...] | None = ()
         self.__lock: Lock = Lock()
 
     def put(self, value: T) -> bool:
@@ -33,23 +35,26 @@ class WriteStreamSplitter[T](StreamWriteOnly[T]):
             False otherwise.
         """
 
-        streams_to_remove: set[StreamWriteOnly[T]] = set[StreamWriteOnly[T]]()
-        not_closed = False
+        streams = self.__streams
+        if streams is None:
+            raise InterruptedError()
 
-        with self.__lock:
-            if self.__streams is None:
-                raise InterruptedError()
+        streams_to_remove: list[StreamWriteOnly[T]] = []
+        not_closed = False
 
-            for stream in self.__streams:
-                try:
-                    if stream.put(value):
-                        not_closed = True
-                    else:
-                        streams_to_remove.add(stream)
-                except Exception:
-                    _logger.warning("Failed to write to child stream", exc_info=True, stack_info=True)
+        for stream in streams:
+            try:
+                if stream.put(value):
+                    not_closed = True
+                else:
+                    streams_to_remove.append(stream)
+            except Exception:
+                _logger.warning("Failed to write to child stream", exc_info=True, stack_info=True)
 
-            self.__streams.difference_update(streams_to_remove)
+        if streams_to_remove:
+            with self.__lock:
+                if self.__streams is not None:
+                    self.__streams = tuple(stream for stream in self.__streams if stream not in streams_to_remove)
 
         return not_closed
 
@@ -61,7 +66,8 @@ class WriteStreamSplitter[T](StreamWriteOnly[T]):
             if self.__streams is None:
                 raise InterruptedError()
 
-            self.__streams.add(stream)
+            if stream not in self.__streams:
+                self.__streams = self.__streams + (stream,)
 
     def unregister_stream(self, stream: StreamWriteOnly[T]) -> None:
         if self is stream:
@@ -69,7 +75,7 @@ class WriteStreamSplitter[T](StreamWriteOnly[T]):
 
         with self.__lock:
             if self.__streams is not None:
-                self.__streams.discard(stream)
+                self.__streams = tuple(registered for registered in self.__streams if registered is not stream)
 
     def close(self) -> None:
         with self.__lock:
@@ -9,58 +9,82 @@ from src.stream.core.StreamWriteOnly import StreamWriteOnly
 from src.stream.mediapipe.MediaPipeBlendShapeEnum import MediaPipeBlendShapeEnum
 from src.stream.mediapipe.MediaPipeProcessingOptions import MediaPipeProcessingOptions
 from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.trace.FrameTrace import FrameTrace
 
 _logger = logging.getLogger(__name__)
 
+_slots = BlendShapeSlots.of(MediaPipeBlendShapeEnum)
+
+_head_indices = _slots.indices(
+    [MediaPipeBlendShapeEnum.HeadX, MediaPipeBlendShapeEnum.HeadY, MediaPipeBlendShapeEnum.HeadZ,
+     MediaPipeBlendShapeEnum.EyeXLeft, MediaPipeBlendShapeEnum.EyeXRight, MediaPipeBlendShapeEnum.EyeYLeft,
+     MediaPipeBlendShapeEnum.EyeYRight])
+
+_rotation_indices = _slots.indices(
+    [MediaPipeBlendShapeEnum.HeadPitch, MediaPipeBlendShapeEnum.HeadYaw, MediaPipeBlendShapeEnum.HeadRoll])
+
+
+def _create_category_slots() -> dict[str, tuple[int, float]]:
+    """
+    Returns:
+        MediaPipe category name to the slot index and the sign of the score, eye look directions are summed up.
+    """
+
+    category_slots = {member.value: (_slots.index(member), 1.0) for member in MediaPipeBlendShapeEnum}
+
+    category_slots.update({"eyeLookInLeft": (_slots.index(MediaPipeBlendShapeEnum.EyeXRight), 1.0),
+                           "eyeLookOutLeft": (_slots.index(MediaPipeBlendShapeEnum.EyeXRight), -1.0),
+                           "eyeLookInRight": (_slots.index(MediaPipeBlendShapeEnum.EyeXLeft), -1.0),
+                           "eyeLookOutRight": (_slots.index(MediaPipeBlendShapeEnum.EyeXLeft), 1.0),
+                           "eyeLookDownLeft": (_slots.index(MediaPipeBlendShapeEnum.EyeYLeft), -1.0),
+                           "eyeLookUpLeft": (_slots.index(MediaPipeBlendShapeEnum.EyeYLeft), 1.0),
+                           "eyeLookDownRight": (_slots.index(MediaPipeBlendShapeEnum.EyeYRight), -1.0),
+                           "eyeLookUpRight": (_slots.index(MediaPipeBlendShapeEnum.EyeYRight), 1.0)})
+
+    return category_slots
+
+
+_category_slots = _create_category_slots()
+
 
 class MediaPipeProcessing(StreamWriteOnly[MediaPipeFrame]):
-    def __init__(self, stream: StreamWriteOnly[BlendShapesFrame[MediaPipeBlendShapeEnum]],
+    def __init__(self, stream: StreamWriteOnly[DenseBlendShapesFrame[MediaPipeBlendShapeEnum]],
                  options: MediaPipeProcessingOptions):
-        self.__stream: StreamWriteOnly[BlendShapesFrame[MediaPipeBlendShapeEnum]] = stream
+        self.__stream: StreamWriteOnly[DenseBlendShapesFrame[MediaPipeBlendShapeEnum]] = stream
         self.__options: MediaPipeProcessingOptions = options
 
     def put(self, value: MediaPipeFrame) -> bool:
         bottom_point = value.face_landmarker_result.face_landmarks[0][152]
         transformation_matrix = value.face_landmarker_result.facial_transformation_matrixes[0]
 
-        shapes = {MediaPipeBlendShapeEnum.HeadX: bottom_point.x, MediaPipeBlendShapeEnum.HeadY: 1.0 - bottom_point.y,
-                  MediaPipeBlendShapeEnum.HeadZ: transformation_matrix[2, 3], MediaPipeBlendShapeEnum.EyeXLeft: 0.0,
-                  MediaPipeBlendShapeEnum.EyeXRight: 0.0, MediaPipeBlendShapeEnum.EyeYLeft: 0.0,
-                  MediaPipeBlendShapeEnum.EyeYRight: 0.0}
+        values = numpy.zeros(len(_slots), dtype=numpy.float64)
+        mask = numpy.zeros(len(_slots), dtype=numpy.bool_)
+
+        # Eye look directions start from zero and are accumulated from the blend shapes below
+        values[_head_indices] = (bottom_point.x, 1.0 - bottom_point.y, transformation_matrix[2, 3], 0.0, 0.0, 0.0, 0.0)
+        mask[_head_indices] = True
 
         rotation = self.__transformed_normalized_euler_zxy_rotation(transformation_matrix)
 
         if rotation is not None:
-            shapes[MediaPipeBlendShapeEnum.HeadPitch] = rotation[1]
-            shapes[MediaPipeBlendShapeEnum.HeadYaw] = rotation[2]
-            shapes[MediaPipeBlendShapeEnum.HeadRoll] = rotation[0]
+            values[_rotation_indices] = (rotation[1], rotation[2], rotation[0])
+            mask[_rotation_indices] = True
 
+        indices = []
+        scores = []
         for shape in value.face_landmarker_result.face_blendshapes[0]:
-            # noinspection PyUnreachableCode
-            match shape.category_name:
-                case "_neutral":
-                    pass
-                case "eyeLookInLeft":
-                    shapes[MediaPipeBlendShapeEnum.EyeXRight] += shape.score
-                case "eyeLookOutLeft":
-                    shapes[MediaPipeBlendShapeEnum.EyeXRight] -= shape.score
-                case "eyeLookInRight":
-                    shapes[MediaPipeBlendShapeEnum.EyeXLeft] -= shape.score
-                case "eyeLookOutRight":
-                    shapes[MediaPipeBlendShapeEnum.EyeXLeft] += shape.score
-                case "eyeLookDownLeft":
-                    shapes[MediaPipeBlendShapeEnum.EyeYLeft] -= shape.score
-                case "eyeLookUpLeft":
-                    shapes[MediaPipeBlendShapeEnum.EyeYLeft] += shape.score
-                case "eyeLookDownRight":
-                    shapes[MediaPipeBlendShapeEnum.EyeYRight] -= shape.score
-                case "eyeLookUpRight":
-                    shapes[MediaPipeBlendShapeEnum.EyeYRight] += shape.score
-                case _:
-                    shapes[MediaPipeBlendShapeEnum(shape.category_name)] = shape.score
-
-        new_value = BlendShapesFrame(shapes, value.camera_frame.timestamp_ns)
+            category_slot = _category_slots.get(shape.category_name)
+            if category_slot is not None:
+                indices.append(category_slot[0])
+                scores.append(category_slot[1] * shape.score)
+
+        numpy.add.at(values, indices, scores)
+        mask[indices] = True
+
+        new_value = DenseBlendShapesFrame.from_values(_slots, values, mask, value.camera_frame.timestamp_ns,
+                                                      FrameTrace.extend(value.trace, "mediapipe_processing"))
 
         return self.__stream.put(new_value)
 
@@ -0,0 +1,79 @@
+import math
+from dataclasses import dataclass
+
+import numpy
+from cv2.typing import MatLike
+from mediapipe.tasks.python.vision.face_landmarker import FaceLandmarkerResult
+
+# Vertical field of view of the perspective camera of the MediaPipe face geometry
+_TAN_HALF_FOV: float = math.tan(math.radians(63.0) / 2.0)
+
+
+@dataclass(frozen=True, slots=True)
+class FaceRoi:
+    """
+    Part of the camera frame that is given to MediaPipe instead of the whole frame. The region has the aspect ratio
+    of the frame, so the perspective of the crop matches the whole frame and the head position can be mapped back.
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+    frame_width: int
+    frame_height: int
+
+    @property
+    def scale(self) -> float:
+        return self.width / self.frame_width
+
+    def matches(self, frame: MatLike) -> bool:
+        return frame.shape[1] == self.frame_width and frame.shape[0] == self.frame_height
+
+    def contains(self, left: float, top: float, right: float, bottom: float, margin: float) -> bool:
+        """
+        Checks if the rectangle in frame pixels is inside the region shrunk by margin pixels on every side.
+        """
+
+        return (left >= self.x + margin and top >= self.y + margin and right <= self.x + self.width - margin and
+                bottom <= self.y + self.height - margin)
+
+    def crop(self, frame: MatLike) -> MatLike:
+        return numpy.ascontiguousarray(frame[self.y:self.y + self.height, self.x:self.x + self.width])
+
+    def remap(self, result: FaceLandmarkerResult) -> FaceLandmarkerResult:
+        """
+        Maps a result of the cropped image to the whole frame. The landmarks are changed in place, the result must
+        not be used by anyone else. The head rotation is kept as it is, it differs from a full frame result only by
+        the small angle between the center of the region and the camera axis.
+        """
+
+        scale = self.scale
+        scale_y = self.height / self.frame_height  # Differs from scale only by the rounding of the size
+        offset_x = self.x / self.frame_width
+        offset_y = self.y / self.frame_height
+
+        for landmarks in result.face_landmarks:
+            for landmark in landmarks:
+                landmark.x = offset_x + landmark.x * scale
+                landmark.y = offset_y + landmark.y * scale_y
+                landmark.z = landmark.z * scale
+
+        # Center of the region in normalized device coordinates of the frame, Y axis up
+        center_x = 2.0 * (self.x + self.width / 2.0) / self.frame_width - 1.0
+        center_y = 1.0 - 2.0 * (self.y + self.height / 2.0) / self.frame_height
+        aspect = self.frame_width / self.frame_height
+
+        matrixes = []
+        for matrix in result.facial_transformation_matrixes:
+            matrix = numpy.array(matrix, dtype=numpy.float64)
+
+            # The face seems closer by the scale of the crop, move it back and shift it by the region center
+            depth = -matrix[2, 3] / scale
+            matrix[0, 3] += center_x * depth * _TAN_HALF_FOV * aspect
+            matrix[1, 3] += center_y * depth * _TAN_HALF_FOV
+            matrix[2, 3] = -depth
+
+            matrixes.append(matrix)
+
+        return FaceLandmarkerResult(result.face_landmarks, result.face_blendshapes, matrixes)
@@ -0,0 +1,91 @@
+from mediapipe.tasks.python.components.containers.landmark import NormalizedLandmark
+
+from src.stream.mediapipe.core.FaceRoi import FaceRoi
+
+
+class FaceRoiTracker:
+    """
+    Follows the face with a region of the camera frame built from the landmarks of the previous result. The region
+    is moved only when the face gets close to its border or the face becomes much smaller, every move makes the
+    tracking inside MediaPipe start over.
+    """
+
+    def __init__(self, scale: float = 2.0, min_size: int = 256, max_fraction: float = 0.8):
+        """
+        Args:
+            scale: Size of the region relative to the bounding box of the landmarks.
+            min_size: Smallest width and height of the region in pixels.
+            max_fraction: The whole frame is used if the region would be larger than this part of the frame.
+        """
+
+        if scale < 1.0:
+            raise ValueError("scale must be at least 1.0")
+
+        if min_size <= 0:
+            raise ValueError("min_size must be positive")
+
+        self.__scale: float = scale
+        self.__min_size: int = min_size
+        self.__max_fraction: float = max_fraction
+
+        # Written by the MediaPipe callback thread, read by the MediaPipe loop
+        self.__roi: FaceRoi | None = None
+
+    def get_roi(self) -> FaceRoi | None:
+        """
+        Returns None if the whole frame must be used.
+        """
+
+        return self.__roi
+
+    def reset(self) -> None:
+        self.__roi = None
+
+    def update(self, landmarks: list[NormalizedLandmark], frame_width: int, frame_height: int) -> None:
+        """
+        Args:
+            landmarks: Landmarks of one face, normalized to the whole frame.
+        """
+
+        if not landmarks:
+            self.__roi = None
+            return
+
+        xs = [landmark.x for landmark in landmarks]
+        ys = [landmark.y for landmark in landmarks]
+
+        left = min(xs) * frame_width
+        right = max(xs) * frame_width
+        top = min(ys) * frame_height
+        bottom = max(ys) * frame_height
+
+        # Part of the frame the region should cover
+        fraction = max(max((right - left) / frame_width, (bottom - top) / frame_height) * self.__scale,
+                       self.__min_size / min(frame_width, frame_height))
+
+        roi = self.__roi
+        if roi is not None and roi.frame_width == frame_width and roi.frame_height == frame_height:
+            margin = min(roi.width, roi.height) * (self.__scale - 1.0) / (4.0 * self.__scale)
+
+            too_large = roi.scale > fraction * 2.0
+            if not too_large and roi.contains(left, top, right, bottom, margin):
+                return
+
+        self.__roi = self.__create_roi((left + right) / 2.0, (top + bottom) / 2.0, fraction, frame_width,
+                                       frame_height)
+
+    def __create_roi(self, center_x: float, center_y: float, fraction: float, frame_width: int,
+                     frame_height: int) -> FaceRoi | None:
+        if fraction >= self.__max_fraction:
+            return None
+
+        # Same aspect ratio as the frame, even sizes
+        width = int(frame_width * fraction) // 2 * 2
+        height = int(frame_height * fraction) // 2 * 2
+        if width <= 0 or height <= 0:
+            return None
+
+        x = min(max(int(center_x - width / 2.0), 0), frame_width - width)
+        y = min(max(int(center_y - height / 2.0), 0), frame_height - height)
+
+        return FaceRoi(x, y, width, height, frame_width, frame_height)
@@ -11,7 +11,10 @@ from src.stream.camera.CameraFrame import CameraFrame
 from src.stream.core.StreamReadOnly import StreamReadOnly
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
 from src.stream.core.components.WriteStreamSplitter import WriteStreamSplitter
+from src.stream.mediapipe.core.FaceRoi import FaceRoi
+from src.stream.mediapipe.core.FaceRoiTracker import FaceRoiTracker
 from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
+from src.stream.trace.FrameTrace import FrameTrace
 
 _logger = logging.getLogger(__name__)
 
@@ -24,11 +27,16 @@ class MediaPipeStream:
     def __init__(self, image_stream: StreamReadOnly[CameraFrame], model_asset_data: bytes,
                  frame_timeout: float | None = 1.0, min_face_detection_confidence: float = 0.5,
                  min_face_presence_confidence: float = 0.5, min_tracking_confidence: float = 0.5,
-                 frame_lost_timeout: float = 1.0, try_use_gpu: bool = True):
+                 frame_lost_timeout: float = 1.0, try_use_gpu: bool = True, max_in_flight: int = 1):
         self.__image_stream: StreamReadOnly[CameraFrame] = image_stream
         self.__frame_timeout: float | None = frame_timeout
         self.__frame_lost_timeout: float = frame_lost_timeout
 
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+
+        self.__max_in_flight: int = max_in_flight
+
         self.__landmarker = self.__create_landmarker(model_asset_data, min_face_detection_confidence,
                                                      min_face_presence_confidence, min_tracking_confidence, try_use_gpu)
 
@@ -36,7 +44,9 @@ class MediaPipeStream:
         self.__condition_lock = Condition(Lock())
         self.__callback_lock = Lock()
 
-        self.__last_frame: CameraFrame | None = None
+        # Guarded by __condition_lock, the region is None if the whole frame was given to MediaPipe
+        self.__in_flight: dict[int, tuple[CameraFrame, FaceRoi | None]] = dict[
+            int, tuple[CameraFrame, FaceRoi | None]]()
         self.__last_packet_time_ms: int = time.perf_counter_ns() // 1_000_000
         self.__last_callback_time_ms: int = time.perf_counter_ns() // 1_000_000
 
@@ -45,6 +55,8 @@ class MediaPipeStream:
         self.__fps_limiter_time: int = time.perf_counter_ns()
         self.__fps_limit_ns: int | None = None
 
+        self.__roi_tracker: FaceRoiTracker | None = None
+
         self.__thread = Thread(target=self.__loop, daemon=True, name="MediaPipe Thread")
         self.__thread.start()
 
@@ -63,6 +75,30 @@ class MediaPipeStream:
 
             self.__fps_limit_ns = 1_000_000_000 // fps_limit
 
+    def set_max_in_flight(self, max_in_flight: int):
+        """
+        Sets how many frames can be processed by MediaPipe at the same time. More frames in flight give more FPS
+        on slow devices, but every frame waits longer for its result.
+        """
+
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+
+        with self.__condition_lock:
+            self.__max_in_flight = max_in_flight
+            self.__condition_lock.notify_all()
+
+    def set_roi_tracking(self, enabled: bool, scale: float = 2.0):
+        """
+        Gives MediaPipe only the region around the face of the previous result instead of the whole camera frame,
+        the results are mapped back to the whole frame. The whole frame is used again when the face is lost.
+
+        Args:
+            scale: Size of the region relative to the face.
+        """
+
+        self.__roi_tracker = FaceRoiTracker(scale) if enabled else None
+
     def close(self):
         self.__close_event.set()
         self.__stream_root.close()
@@ -86,18 +122,35 @@ class MediaPipeStream:
     def __loop(self):
         while not self.__close_event.is_set():
             try:
-                self.__last_frame = self.__image_stream.poll(self.__frame_timeout)
-                packet_time_ms = self.__last_frame.timestamp_ns // 1_000_000
+                self.__wait_free_slot()
+
+                frame = self.__image_stream.poll(self.__frame_timeout)
+                packet_time_ms = frame.timestamp_ns // 1_000_000
 
                 if self.__last_packet_time_ms - packet_time_ms >= 0:
                     continue  # System lag
 
-                mp_image = mediapipe.Image(image_format=mediapipe.ImageFormat.SRGB, data=self.__last_frame.frame)
+                roi_tracker = self.__roi_tracker
+                roi = roi_tracker.get_roi() if roi_tracker is not None else None
+
+                if roi is not None and roi.matches(frame.frame):
+                    mp_image = mediapipe.Image(image_format=mediapipe.ImageFormat.SRGB, data=roi.crop(frame.frame))
+                else:
+                    roi = None
+                    mp_image = mediapipe.Image(image_format=mediapipe.ImageFormat.SRGB, data=frame.frame)
+
+                with self.__condition_lock:
+                    self.__in_flight[packet_time_ms] = (frame, roi)
 
-                self.__landmarker.detect_async(mp_image, packet_time_ms)
+                try:
+                    self.__landmarker.detect_async(mp_image, packet_time_ms)
+                except Exception:
+                    with self.__condition_lock:
+                        self.__in_flight.pop(packet_time_ms, None)
 
-                with self.__condition_lock:  # not ideal back-pressure, we can load more to achieve more FPS, but latency will increase
-                    self.__condition_lock.wait(self.__frame_lost_timeout)
+                    raise
+
+                self.__last_packet_time_ms = packet_time_ms
 
                 fps_limit = self.__fps_limit_ns
                 if fps_limit is not None:
@@ -109,8 +162,6 @@ class MediaPipeStream:
                         self.__fps_limiter_time = target_frame_completion_time_ns
                     else:
                         self.__fps_limiter_time = current_actual_time_ns
-
-                self.__last_packet_time_ms = packet_time_ms
             except TimeoutError:
                 continue
             except InterruptedError:
@@ -120,25 +171,56 @@ class MediaPipeStream:
 
                 self.__close_event.wait(0.001)
 
-    def __async_result(self, result: FaceLandmarkerResult, image, timestamp_ms):
-        last_packet = self.__last_frame
+    def __wait_free_slot(self):
+        # Back-pressure, more frames in flight give more FPS, but latency will increase
+        with self.__condition_lock:
+            while len(self.__in_flight) >= self.__max_in_flight and not self.__close_event.is_set():
+                if not self.__condition_lock.wait(self.__frame_lost_timeout):
+                    # MediaPipe doesn't call back for frames it has dropped, forget them
+                    self.__in_flight.clear()
+
+                    roi_tracker = self.__roi_tracker
+                    if roi_tracker is not None:
+                        roi_tracker.reset()
 
+    def __async_result(self, result: FaceLandmarkerResult, image, timestamp_ms):
         with self.__condition_lock:
+            in_flight = self.__in_flight.pop(timestamp_ms, None)
+
+            # Results come in timestamp order, older frames in flight were dropped by MediaPipe
+            lost_timestamps = [timestamp for timestamp in self.__in_flight if timestamp < timestamp_ms]
+            for timestamp in lost_timestamps:
+                del self.__in_flight[timestamp]
+
             self.__condition_lock.notify()
 
+        if in_flight is None:
+            return
+
+        packet, roi = in_flight
+        roi_tracker = self.__roi_tracker
+
         if result.face_blendshapes and result.facial_transformation_matrixes and result.face_landmarks:
             try:
+                if roi is not None:
+                    result = roi.remap(result)
+
                 with self.__callback_lock:
                     if self.__last_callback_time_ms - timestamp_ms > 0:
                         return
 
                     self.__last_callback_time_ms = timestamp_ms
 
-                    self.__stream_root.put(MediaPipeFrame(last_packet, result))
+                    if roi_tracker is not None:
+                        roi_tracker.update(result.face_landmarks[0], packet.frame.shape[1], packet.frame.shape[0])
+
+                    self.__stream_root.put(MediaPipeFrame(packet, result, FrameTrace.extend(packet.trace, "mediapipe")))
             except InterruptedError:
                 return
             except Exception:
                 _logger.warning("Exception in MediaPipe callback", exc_info=True, stack_info=True)
+        elif roi_tracker is not None:
+            roi_tracker.reset()  # Face lost, search the whole frame
 
     def __create_landmarker(self, model_asset_data: bytes, min_face_detection_confidence: float,
                             min_face_presence_confidence: float, min_tracking_confidence: float,
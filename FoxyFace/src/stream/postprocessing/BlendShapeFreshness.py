@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+import numpy
+from numpy import ndarray
+
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+
+
+@dataclass(frozen=True, slots=True)
+class BlendShapeFreshness[T]:
+    """
+    Freshness of the values of a frame given by BlendShapeTimedBuffer, indexed by the slots.
+
+    The arrays are shared, treat them as read-only.
+    """
+
+    slots: BlendShapeSlots[T]
+    timestamp_ns: int  # Time of the poll, the ages are measured to it
+    ages_ns: ndarray  # int64, age of the values from their source frames, undefined if the value isn't present
+    stale: ndarray  # bool, True if the value was held from an earlier frame because the last frame didn't have it
+    expired: ndarray  # bool, True if the value was dropped at this poll because it was older than the ttl
+
+    @property
+    def stale_count(self) -> int:
+        return int(numpy.count_nonzero(self.stale))
+
+    @property
+    def expired_count(self) -> int:
+        return int(numpy.count_nonzero(self.expired))
+
+    def get_stale(self) -> list[T]:
+        members = self.slots.members
+
+        return [members[index] for index in numpy.flatnonzero(self.stale).tolist()]
+
+    def get_expired(self) -> list[T]:
+        members = self.slots.members
+
+        return [members[index] for index in numpy.flatnonzero(self.expired).tolist()]
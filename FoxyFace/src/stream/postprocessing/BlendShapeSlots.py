@@ -0,0 +1,53 @@
+from enum import Enum
+from threading import Lock
+
+import numpy
+from numpy import ndarray
+
+
+class BlendShapeSlots[T]:
+    """
+    Maps every member of a blend shape enum to a fixed array index (in the enum definition order).
+
+    The table is built once per enum type, use BlendShapeSlots.of to get the shared instance.
+    """
+
+    __instances: dict[type[Enum], "BlendShapeSlots"] = {}
+    __instances_lock = Lock()
+
+    def __init__(self, enum_type: type[T]):
+        self.__enum_type: type[T] = enum_type
+        self.__members: tuple[T, ...] = tuple(enum_type)
+        self.__index: dict[T, int] = {member: index for index, member in enumerate(self.__members)}
+
+    @staticmethod
+    def of(enum_type: type[T]) -> "BlendShapeSlots[T]":
+        slots = BlendShapeSlots.__instances.get(enum_type)
+        if slots is not None:
+            return slots
+
+        with BlendShapeSlots.__instances_lock:
+            return BlendShapeSlots.__instances.setdefault(enum_type, BlendShapeSlots(enum_type))
+
+    @property
+    def enum_type(self) -> type[T]:
+        return self.__enum_type
+
+    @property
+    def members(self) -> tuple[T, ...]:
+        return self.__members
+
+    def index(self, member: T) -> int:
+        return self.__index[member]
+
+    def get_index(self, member: T) -> int | None:
+        return self.__index.get(member)
+
+    def indices(self, members: list[T]) -> ndarray:
+        return numpy.array([self.__index[member] for member in members], dtype=numpy.intp)
+
+    def __len__(self) -> int:
+        return len(self.__members)
+
+    def __contains__(self, member: object) -> bool:
+        return member in self.__index
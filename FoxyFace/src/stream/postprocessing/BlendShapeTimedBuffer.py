@@ -1,42 +1,72 @@
 import time
+from threading import Lock
+
+import numpy
+from numpy import ndarray
 
 from src.stream.core.StreamReadOnly import StreamReadOnly
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.BlendShapeFreshness import BlendShapeFreshness
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
 
 
-class BlendShapeTimedBuffer(StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]):
-    def __init__(self, stream: StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]], ttl: float = 1.0):
+class BlendShapeTimedBuffer(StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]):
+    def __init__(self, stream: StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]], ttl: float = 1.0):
         """
         Initializes the buffer.
 
         Args:
-            stream: The underlying stream of BlendShapesFrame objects.
+            stream: The underlying stream of DenseBlendShapesFrame objects.
             ttl: The time-to-live in seconds. Blend shape values older than this
                  (based on their source frame's timestamp) will be dropped.
         """
         if ttl < 0.0:
             raise ValueError("ttl cannot be negative")
 
-        self.__stream: StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]] = stream
+        self.__stream: StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]] = stream
         self.__ttl_nanos: int = int(ttl * 1_000_000_000)
 
-        self.__cache: dict[GeneralBlendShapeEnum, tuple[float, int]] = dict[GeneralBlendShapeEnum, tuple[float, int]]()
+        slots = BlendShapeSlots.of(GeneralBlendShapeEnum)
+
+        # The UI windows poll the same buffer from their own threads. The cache is indexed by the slots and updated
+        # in place, only the arrays of the new frame are allocated.
+        self.__cache_lock: Lock = Lock()
+        self.__values: ndarray = numpy.zeros(len(slots), dtype=numpy.float64)
+        self.__timestamps: ndarray = numpy.zeros(len(slots), dtype=numpy.int64)
+        self.__present: ndarray = numpy.zeros(len(slots), dtype=numpy.bool_)
+
+        self.__freshness: BlendShapeFreshness[GeneralBlendShapeEnum] | None = None
 
-    def poll(self, timeout: float | None = None) -> BlendShapesFrame[GeneralBlendShapeEnum]:
+    def poll(self, timeout: float | None = None) -> DenseBlendShapesFrame[GeneralBlendShapeEnum]:
         frame = self.__stream.poll(timeout=timeout)
 
-        for key, value in frame.blend_shapes.items():
-            self.__cache[key] = (value, frame.timestamp_ns)
+        with self.__cache_lock:
+            numpy.copyto(self.__values, frame.values, where=frame.mask)
+            numpy.copyto(self.__timestamps, frame.timestamps_ns, where=frame.mask)
+            self.__present |= frame.mask
+
+            # One clock read for all values
+            current_time = time.perf_counter_ns()
+
+            ages = current_time - self.__timestamps
+            present = self.__present & (ages <= self.__ttl_nanos)
+            expired = self.__present & ~present
 
-        new_cache: dict[GeneralBlendShapeEnum, tuple[float, int]] = dict[GeneralBlendShapeEnum, tuple[float, int]]()
-        new_blendshape: dict[GeneralBlendShapeEnum, float] = dict[GeneralBlendShapeEnum, float]()
+            numpy.copyto(self.__present, present)  # The new frame keeps its own mask
 
-        for key, value in self.__cache.items():
-            if time.perf_counter_ns() - value[1] <= self.__ttl_nanos:
-                new_cache[key] = value
-                new_blendshape[key] = value[0]
+            new_frame = DenseBlendShapesFrame(frame.slots, numpy.where(present, self.__values, 0.0), present,
+                                              numpy.where(present, self.__timestamps, frame.timestamp_ns),
+                                              frame.timestamp_ns, frame.trace)
 
-        self.__cache = new_cache
+            self.__freshness = BlendShapeFreshness(frame.slots, current_time, ages, present & ~frame.mask, expired)
+
+        return new_frame
+
+    def get_freshness(self) -> BlendShapeFreshness[GeneralBlendShapeEnum] | None:
+        """
+        Returns:
+            Freshness of the last polled frame, None before the first frame.
+        """
 
-        return BlendShapesFrame(new_blendshape, frame.timestamp_ns)
+        return self.__freshness
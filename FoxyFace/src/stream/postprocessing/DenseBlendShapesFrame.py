@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+
+import numpy
+from numpy import ndarray
+
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.trace.FrameTrace import FrameTrace
+
+
+@dataclass(frozen=True, slots=True)
+class DenseBlendShapesFrame[T]:
+    """
+    Dense variant of BlendShapesFrame, the values are stored in fixed arrays indexed by the slots of the enum, so the
+    processing stages can work on the whole frame at once.
+
+    The arrays are shared between all consumers without copying, treat them as read-only.
+    """
+
+    slots: BlendShapeSlots[T]
+    values: ndarray  # float64, the value of not present slots is undefined
+    mask: ndarray  # bool, True if the slot is present
+    timestamps_ns: ndarray  # int64, timestamp of the source frame of every slot
+    timestamp_ns: int
+    trace: FrameTrace | None = None
+
+    @property
+    def blend_shapes(self) -> dict[T, float]:
+        members = self.slots.members
+        indices = numpy.flatnonzero(self.mask)
+
+        return dict(zip([members[index] for index in indices.tolist()], self.values[indices].tolist()))
+
+    def get(self, member: T) -> float | None:
+        index = self.slots.get_index(member)
+        if index is None or not self.mask[index]:
+            return None
+
+        return float(self.values[index])
+
+    def is_empty(self) -> bool:
+        return not self.mask.any()
+
+    @staticmethod
+    def empty(slots: BlendShapeSlots[T], timestamp_ns: int,
+              trace: FrameTrace | None = None) -> "DenseBlendShapesFrame[T]":
+        size = len(slots)
+
+        return DenseBlendShapesFrame(slots, numpy.zeros(size, dtype=numpy.float64),
+                                     numpy.zeros(size, dtype=numpy.bool_),
+                                     numpy.full(size, timestamp_ns, dtype=numpy.int64), timestamp_ns, trace)
+
+    @staticmethod
+    def from_values(slots: BlendShapeSlots[T], values: ndarray, mask: ndarray | None, timestamp_ns: int,
+                    trace: FrameTrace | None = None) -> "DenseBlendShapesFrame[T]":
+        """
+        Creates a frame where every slot comes from the same source frame.
+
+        Args:
+            values: Values in slot order, converted to float64 if needed.
+            mask: Present slots, None if all slots are present.
+        """
+
+        size = len(slots)
+
+        if mask is None:
+            mask = numpy.ones(size, dtype=numpy.bool_)
+
+        return DenseBlendShapesFrame(slots, numpy.asarray(values, dtype=numpy.float64), mask,
+                                     numpy.full(size, timestamp_ns, dtype=numpy.int64), timestamp_ns, trace)
+
+    @staticmethod
+    def from_blend_shapes(slots: BlendShapeSlots[T], blend_shapes: dict[T, float],
+                          timestamp_ns: int) -> "DenseBlendShapesFrame[T]":
+        """
+        Converts a dict based frame, keys that are not members of the slots enum are ignored.
+        """
+
+        frame = DenseBlendShapesFrame.empty(slots, timestamp_ns)
+
+        for key, value in blend_shapes.items():
+            index = slots.get_index(key)
+            if index is not None:
+                frame.values[index] = value
+                frame.mask[index] = True
+
+        return frame
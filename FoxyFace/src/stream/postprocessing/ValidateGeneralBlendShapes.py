@@ -1,18 +1,23 @@
-import math
+import numpy
 
 from src.stream.core.StreamReadOnly import StreamReadOnly
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
 
 
-class ValidateGeneralBlendShapes(StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]):
-    def __init__(self, stream: StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]):
-        self.__stream: StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]] = stream
+class ValidateGeneralBlendShapes(StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]):
+    def __init__(self, stream: StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]):
+        self.__stream: StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]] = stream
 
-    def poll(self, timeout: float | None = None) -> BlendShapesFrame[GeneralBlendShapeEnum]:
+        members = BlendShapeSlots.of(GeneralBlendShapeEnum).members
+        self.__min_values = numpy.array([member.value.min_value for member in members], dtype=numpy.float64)
+        self.__max_values = numpy.array([member.value.max_value for member in members], dtype=numpy.float64)
+
+    def poll(self, timeout: float | None = None) -> DenseBlendShapesFrame[GeneralBlendShapeEnum]:
         frame = self.__stream.poll(timeout)
 
-        blend_shapes = {k: min(k.value.max_value, max(k.value.min_value, v)) for k, v in frame.blend_shapes.items() if
-                        isinstance(v, float) and math.isfinite(v)}
+        mask = frame.mask & numpy.isfinite(frame.values)
+        values = numpy.clip(numpy.where(mask, frame.values, 0.0), self.__min_values, self.__max_values)
 
-        return BlendShapesFrame(blend_shapes, frame.timestamp_ns)
+        return DenseBlendShapesFrame(frame.slots, values, mask, frame.timestamps_ns, frame.timestamp_ns, frame.trace)
@@ -2,8 +2,40 @@ from dataclasses import dataclass, field
 
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
 from src.stream.postprocessing.calibration.BlendShapeOption import BlendShapeOption
+from src.stream.postprocessing.calibration.CalibrationTable import CalibrationTable
 
 
 @dataclass(slots=True)
 class CalibrateProcessingOptions:
     blend_shape_options: dict[GeneralBlendShapeEnum, BlendShapeOption] = field(default_factory=dict)
+
+    # Incremented by invalidate, the options can be edited in place
+    __version: int = field(default=0, init=False, repr=False, compare=False)
+
+    # The source dict, its version and the table compiled from them, replaced together
+    __compiled: tuple[dict[GeneralBlendShapeEnum, BlendShapeOption], int, CalibrationTable] | None = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def invalidate(self) -> None:
+        """
+        Call after a BlendShapeOption of blend_shape_options is changed in place, the next get_table compiles the
+        table again.
+        """
+
+        self.__version += 1
+
+    def get_table(self) -> CalibrationTable:
+        """
+        Returns the calibration compiled from blend_shape_options. The table is compiled again when
+        blend_shape_options is replaced or after invalidate.
+        """
+
+        blend_shape_options = self.blend_shape_options
+        version = self.__version  # Read before compiling, an invalidate during the compilation isn't lost
+
+        compiled = self.__compiled
+        if compiled is None or compiled[0] is not blend_shape_options or compiled[1] != version:
+            compiled = (blend_shape_options, version, CalibrationTable.compile(blend_shape_options))
+            self.__compiled = compiled
+
+        return compiled[2]
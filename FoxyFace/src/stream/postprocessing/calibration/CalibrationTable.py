@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+import numpy
+from numpy import ndarray
+
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
+from src.stream.postprocessing.calibration.BlendShapeOption import BlendShapeOption
+
+
+@dataclass(frozen=True, slots=True)
+class CalibrationTable:
+    """
+    Calibration of all GeneralBlendShapeEnum slots compiled into three point piecewise-linear mappings.
+
+    Blend shapes without center use two points, the last point is repeated. For increasing breakpoints the result
+    is the same as numpy.interp, values outside the breakpoints are clamped to the first or the last y value.
+    """
+
+    breakpoints_x: ndarray  # float64 (slots, 3)
+    breakpoints_y: ndarray  # float64 (slots, 3)
+    enabled: ndarray  # bool (slots,), False for pass-through slots
+
+    def apply(self, values: ndarray) -> ndarray:
+        x0, x1, x2 = self.breakpoints_x[:, 0], self.breakpoints_x[:, 1], self.breakpoints_x[:, 2]
+        y0, y1, y2 = self.breakpoints_y[:, 0], self.breakpoints_y[:, 1], self.breakpoints_y[:, 2]
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            lower = y0 + (values - x0) * ((y1 - y0) / (x1 - x0))
+            upper = y1 + (values - x1) * ((y2 - y1) / (x2 - x1))
+
+        calibrated = numpy.where(values < x1, lower, upper)
+        calibrated = numpy.where(values <= x0, y0, calibrated)
+        calibrated = numpy.where(values >= x2, y2, calibrated)
+
+        return numpy.where(self.enabled, calibrated, values)
+
+    @staticmethod
+    def compile(blend_shape_options: dict[GeneralBlendShapeEnum, BlendShapeOption]) -> "CalibrationTable":
+        members = BlendShapeSlots.of(GeneralBlendShapeEnum).members
+
+        breakpoints_x = numpy.zeros((len(members), 3), dtype=numpy.float64)
+        breakpoints_y = numpy.zeros((len(members), 3), dtype=numpy.float64)
+        enabled = numpy.zeros(len(members), dtype=numpy.bool_)
+
+        for index, key in enumerate(members):
+            option = blend_shape_options.get(key)
+            if option is None or key.value.disable_calibration:
+                continue
+
+            if key.value.has_center:
+                breakpoints_x[index] = (option.max_pose_negative, option.neutral_pose, option.max_pose_positive)
+                breakpoints_y[index] = (key.value.min_value, 0.0, key.value.max_value)
+            else:
+                breakpoints_x[index] = (option.neutral_pose, option.max_pose_positive, option.max_pose_positive)
+                breakpoints_y[index] = (key.value.min_value, key.value.max_value, key.value.max_value)
+
+            enabled[index] = True
+
+        return CalibrationTable(breakpoints_x, breakpoints_y, enabled)
@@ -1,32 +1,36 @@
-from typing import Any
-
-from OneEuroFilter import OneEuroFilter
-
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.filter.BlendShapesOneEuroFilterOptions import BlendShapesOneEuroFilterOptions
+from src.stream.postprocessing.filter.OneEuroFilterBank import OneEuroFilterBank
 
 
-class BlendShapesOneEuroFilter[T](StreamWriteOnly[BlendShapesFrame[T]]):
-    def __init__(self, stream: StreamWriteOnly[BlendShapesFrame[T]], options: BlendShapesOneEuroFilterOptions):
+class BlendShapesOneEuroFilter[T](StreamWriteOnly[DenseBlendShapesFrame[T]]):
+    def __init__(self, stream: StreamWriteOnly[DenseBlendShapesFrame[T]], options: BlendShapesOneEuroFilterOptions):
         self.__stream = stream
         self.__options = options
 
-        self.__filter_map: dict[Any, OneEuroFilter] = {}
+        self.__filter_bank: OneEuroFilterBank | None = None
+        self.__filter_bank_enum: type | None = None
+
+    def put(self, value: DenseBlendShapesFrame[T]) -> bool:
+        if not self.__options.enabled:
+            self.recreate()
+
+            return self.__stream.put(value)
 
-    def put(self, value: BlendShapesFrame[T]) -> bool:
-        blend_shapes = {}
-        for k, v in value.blend_shapes.items():
-            one_euro_filter = self.__filter_map.setdefault(k, OneEuroFilter(30, self.__options.mincutoff,
-                                                                            self.__options.beta,
-                                                                            self.__options.dcutoff))
+        if self.__filter_bank is None or self.__filter_bank_enum is not value.slots.enum_type:
+            self.__filter_bank = OneEuroFilterBank(len(value.slots), self.__options)
+            self.__filter_bank_enum = value.slots.enum_type
 
-            blend_shapes[k] = one_euro_filter.filter(v, value.timestamp_ns / 1_000_000_000)
+        values = self.__filter_bank.filter(value.values, value.mask, value.timestamps_ns / 1_000_000_000)
 
-        return self.__stream.put(BlendShapesFrame(blend_shapes, value.timestamp_ns))
+        return self.__stream.put(
+            DenseBlendShapesFrame(value.slots, values, value.mask, value.timestamps_ns, value.timestamp_ns,
+                                  value.trace))
 
     def recreate(self):
-        self.__filter_map.clear()
+        if self.__filter_bank is not None:
+            self.__filter_bank.reset()
 
     def close(self) -> None:
         self.__stream.close()
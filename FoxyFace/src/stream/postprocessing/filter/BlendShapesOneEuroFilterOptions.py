@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 @dataclass(slots=True)
 class BlendShapesOneEuroFilterOptions:
+    enabled: bool = True
     mincutoff: float = 3.0
     beta: float = 0.9
     dcutoff: float = 1.0
@@ -0,0 +1,93 @@
+import math
+
+import numpy
+from numpy import ndarray
+
+from src.stream.postprocessing.filter.BlendShapesOneEuroFilterOptions import BlendShapesOneEuroFilterOptions
+
+
+class OneEuroFilterBank:
+    """
+    One Euro filters for a fixed number of slots, the state of all filters is stored in arrays and a whole frame
+    is filtered in one step. Gives the same results as one OneEuroFilter object per slot.
+
+    The options are read on every call, so changing mincutoff, beta or dcutoff keeps the filter state.
+
+    Not thread-safe.
+    """
+
+    def __init__(self, size: int, options: BlendShapesOneEuroFilterOptions, frequency: float = 30.0):
+        if frequency <= 0.0:
+            raise ValueError("frequency must be positive")
+
+        self.__options: BlendShapesOneEuroFilterOptions = options
+        self.__initial_frequency: float = frequency
+
+        self.__initialized = numpy.zeros(size, dtype=numpy.bool_)
+        self.__frequency = numpy.full(size, frequency, dtype=numpy.float64)
+        self.__last_time = numpy.zeros(size, dtype=numpy.float64)
+        self.__x = numpy.zeros(size, dtype=numpy.float64)
+        self.__dx = numpy.zeros(size, dtype=numpy.float64)
+
+    def filter(self, values: ndarray, mask: ndarray, timestamps: ndarray) -> ndarray:
+        """
+        Filters the present slots, the state of the other slots is not changed.
+
+        Args:
+            values: Values of all slots.
+            mask: Present slots.
+            timestamps: Timestamps of all slots in seconds.
+
+        Returns:
+            A new array with the filtered values, not present slots are copied from values.
+        """
+
+        mincutoff = self.__options.mincutoff
+        beta = self.__options.beta
+        dcutoff = self.__options.dcutoff
+
+        if mincutoff <= 0.0:
+            raise ValueError("mincutoff should be >0")
+        if dcutoff <= 0.0:
+            raise ValueError("dcutoff should be >0")
+
+        initialized = self.__initialized[mask]
+        last_time = self.__last_time[mask]
+        x = values[mask]
+        time = timestamps[mask]
+
+        frequency = self.__frequency[mask]
+        update_frequency = initialized & (time > last_time)
+        frequency[update_frequency] = 1.0 / (time[update_frequency] - last_time[update_frequency])
+
+        x_prev = self.__x[mask]
+        dx = numpy.where(initialized, (x - x_prev) * frequency, 0.0)
+        edx = numpy.where(initialized, self.__lowpass(dx, self.__dx[mask], self.__alpha(dcutoff, frequency)), dx)
+
+        cutoff = mincutoff + beta * numpy.abs(edx)
+        x_hat = numpy.where(initialized, self.__lowpass(x, x_prev, self.__alpha(cutoff, frequency)), x)
+
+        self.__initialized[mask] = True
+        self.__frequency[mask] = frequency
+        self.__last_time[mask] = time
+        self.__x[mask] = x_hat
+        self.__dx[mask] = edx
+
+        filtered = values.astype(numpy.float64, copy=True)
+        filtered[mask] = x_hat
+
+        return filtered
+
+    def reset(self) -> None:
+        self.__initialized[:] = False
+        self.__frequency[:] = self.__initial_frequency
+
+    @staticmethod
+    def __alpha(cutoff: float | ndarray, frequency: ndarray) -> ndarray:
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+
+        return 1.0 / (1.0 + tau * frequency)
+
+    @staticmethod
+    def __lowpass(value: ndarray, previous: ndarray, alpha: ndarray) -> ndarray:
+        return alpha * value + (1.0 - alpha) * previous
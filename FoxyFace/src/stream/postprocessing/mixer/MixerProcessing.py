@@ -1,43 +1,64 @@
 from typing import Any
 
+import numpy
+
 from src.stream.core.StreamReadOnly import StreamReadOnly
-from src.stream.core.components.BufferStream import BufferStream
+from src.stream.core.components.EventBufferStream import EventBufferStream
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
 from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
-from src.stream.postprocessing.mixer.MixSelectEnum import MixSelectEnum
 from src.stream.postprocessing.mixer.MixerProcessingOptions import MixerProcessingOptions
+from src.stream.trace.FrameTrace import FrameTrace
 
 
-class MixerProcessing(StreamReadOnly[BlendShapesFrame[GeneralBlendShapeEnum]]):
-    def __init__(self, stream: BufferStream[BlendShapesFrame[Any]], options: MixerProcessingOptions):
-        self.__stream: BufferStream[BlendShapesFrame[Any]] = stream
+class MixerProcessing(StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]]):
+    def __init__(self, stream: EventBufferStream[BlendShapesFrame[Any] | DenseBlendShapesFrame[Any]],
+                 options: MixerProcessingOptions):
+        self.__stream: EventBufferStream[BlendShapesFrame[Any] | DenseBlendShapesFrame[Any]] = stream
         self.__options: MixerProcessingOptions = options
 
-    def poll(self, timeout: float | None = None) -> BlendShapesFrame[GeneralBlendShapeEnum]:
-        output = {}
+        self.__slots: BlendShapeSlots[GeneralBlendShapeEnum] = BlendShapeSlots.of(GeneralBlendShapeEnum)
 
-        enabled = self.__options.get_enabled()
+    def poll(self, timeout: float | None = None) -> DenseBlendShapesFrame[GeneralBlendShapeEnum]:
+        routing_table = self.__options.get_routing_table()
 
         frame = self.__stream.flush(timeout)
 
+        size = len(self.__slots)
+        values = numpy.zeros(size, dtype=numpy.float64)
+        mask = numpy.zeros(size, dtype=numpy.bool_)
+        timestamps = numpy.zeros(size, dtype=numpy.int64)
+
         last_timestamp = frame[-1].timestamp_ns
+        last_trace = None
         for packet in frame:
-            for enumEntry in GeneralBlendShapeEnum:
-                enable_state = enabled.get(enumEntry)
-                if enable_state is None:
-                    value = packet.blend_shapes.get(enumEntry.value.same_as[0])
-                    if value is not None:
-                        output[enumEntry] = value
-                        last_timestamp = packet.timestamp_ns
-                elif enable_state == MixSelectEnum.Disabled:
+            if isinstance(packet, DenseBlendShapesFrame):
+                route = routing_table.slot_routes.get(packet.slots.enum_type)
+                if route is None:
+                    continue
+
+                source_indices, target_indices = route
+
+                present = packet.mask[source_indices]
+                if not present.any():
                     continue
-                else:
-                    for same_as in enumEntry.value.same_as:
-                        if isinstance(same_as, enable_state.value):
-                            value = packet.blend_shapes.get(same_as)
-                            if value is not None:
-                                output[enumEntry] = value
-                                last_timestamp = packet.timestamp_ns
-                            break
-
-        return BlendShapesFrame(output, last_timestamp)
+
+                source_indices = source_indices[present]
+                target_indices = target_indices[present]
+
+                values[target_indices] = packet.values[source_indices]
+                timestamps[target_indices] = packet.timestamps_ns[source_indices]
+                mask[target_indices] = True
+                last_timestamp = packet.timestamp_ns
+                last_trace = packet.trace
+            else:
+                for key, value in packet.blend_shapes.items():
+                    for target_index in routing_table.member_routes.get(key, ()):
+                        values[target_index] = value
+                        timestamps[target_index] = packet.timestamp_ns
+                        mask[target_index] = True
+                        last_timestamp = packet.timestamp_ns
+
+        return DenseBlendShapesFrame(self.__slots, values, mask, timestamps, last_timestamp,
+                                     FrameTrace.extend(last_trace, "mixer"))
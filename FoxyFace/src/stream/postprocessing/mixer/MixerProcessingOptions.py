@@ -3,17 +3,43 @@ from dataclasses import dataclass, field
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
 from src.stream.postprocessing.mixer import MixBlockList
 from src.stream.postprocessing.mixer.MixSelectEnum import MixSelectEnum
+from src.stream.postprocessing.mixer.MixerRoutingTable import MixerRoutingTable
 
 
 @dataclass(slots=True)
 class MixerProcessingOptions:
     enable: dict[GeneralBlendShapeEnum, MixSelectEnum] = field(default_factory=dict)
 
+    # The enable dict the routing was compiled for and the routing, compared by identity because ProcessingPipeline
+    # assigns a new dict whenever a source selection changes
+    __compiled: tuple[dict[GeneralBlendShapeEnum, MixSelectEnum], MixerRoutingTable] | None = field(
+        default=None, init=False, repr=False, compare=False)
+
     def get_enabled(self) -> dict[GeneralBlendShapeEnum, MixSelectEnum]:
-        new_list = self.enable.copy()
+        return MixerProcessingOptions.__apply_block_list(self.enable)
+
+    def get_routing_table(self) -> MixerRoutingTable:
+        """
+        Returns the routing compiled from get_enabled, with the block list applied. The routing is compiled again
+        when a new enable dict is assigned, editing the assigned dict doesn't change the routing.
+        """
+
+        enable = self.enable
+
+        compiled = self.__compiled
+        if compiled is None or compiled[0] is not enable:
+            compiled = (enable, MixerRoutingTable.compile(MixerProcessingOptions.__apply_block_list(enable)))
+            self.__compiled = compiled
+
+        return compiled[1]
+
+    @staticmethod
+    def __apply_block_list(enable: dict[GeneralBlendShapeEnum, MixSelectEnum]) -> dict[
+        GeneralBlendShapeEnum, MixSelectEnum]:
+        new_list = enable.copy()
 
         for key, value in MixBlockList.block_list.items():
-            if self.enable.get(key) != MixSelectEnum.Disabled:
+            if enable.get(key) != MixSelectEnum.Disabled:
                 new_list[value] = MixSelectEnum.Disabled
 
         return new_list
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy
+from numpy import ndarray
+
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
+from src.stream.postprocessing.mixer.MixSelectEnum import MixSelectEnum
+
+
+@dataclass(frozen=True, slots=True)
+class MixerRoutingTable:
+    """
+    Source blend shapes that are copied to every GeneralBlendShapeEnum slot, compiled from the mixer selection.
+    """
+
+    slot_routes: dict[type[Enum], tuple[ndarray, ndarray]]  # Source enum type to source and general slot indices
+    member_routes: dict[Enum, tuple[int, ...]]  # Source enum member to general slot indices
+
+    @staticmethod
+    def compile(enabled: dict[GeneralBlendShapeEnum, MixSelectEnum]) -> "MixerRoutingTable":
+        routes: dict[type[Enum], tuple[list[int], list[int]]] = {}
+        member_routes: dict[Enum, tuple[int, ...]] = {}
+
+        for target_index, enumEntry in enumerate(BlendShapeSlots.of(GeneralBlendShapeEnum).members):
+            enable_state = enabled.get(enumEntry)
+            if enable_state is None:
+                source = enumEntry.value.same_as[0]
+            elif enable_state == MixSelectEnum.Disabled:
+                continue
+            else:
+                source = next((same_as for same_as in enumEntry.value.same_as if
+                               isinstance(same_as, enable_state.value)), None)
+                if source is None:
+                    continue
+
+            source_indices, target_indices = routes.setdefault(type(source), ([], []))
+            source_indices.append(BlendShapeSlots.of(type(source)).index(source))
+            target_indices.append(target_index)
+
+            member_routes[source] = member_routes.get(source, ()) + (target_index,)
+
+        slot_routes = {enum_type: (numpy.array(source_indices, dtype=numpy.intp),
+                                   numpy.array(target_indices, dtype=numpy.intp)) for
+                       enum_type, (source_indices, target_indices) in routes.items()}
+
+        return MixerRoutingTable(slot_routes, member_routes)
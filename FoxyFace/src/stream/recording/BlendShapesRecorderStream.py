@@ -0,0 +1,36 @@
+import numpy
+
+from src.stream.core.StreamWriteOnly import StreamWriteOnly
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.recording.SessionWriter import SessionWriter
+
+
+class BlendShapesRecorderStream[T](StreamWriteOnly[DenseBlendShapesFrame[T]]):
+    """
+    Writes the frames to a track of the session, the columns are the names of the enum members. put copies the
+    values into the queue of the writer and doesn't wait for the disk.
+    """
+
+    def __init__(self, writer: SessionWriter, track_name: str, slots: BlendShapeSlots[T]):
+        self.__writer: SessionWriter = writer
+        self.__track_name: str = track_name
+        self.__closed: bool = False
+
+        writer.add_track(track_name, [member.name for member in slots.members], slots.enum_type.__name__)
+
+    def put(self, value: DenseBlendShapesFrame[T]) -> bool:
+        if self.__closed:
+            return False
+
+        try:
+            self.__writer.append(self.__track_name, value.timestamp_ns,
+                                 numpy.where(value.mask, value.values, numpy.nan))
+        except InterruptedError:
+            self.__closed = True
+            return False
+
+        return True
+
+    def close(self) -> None:
+        self.__closed = True
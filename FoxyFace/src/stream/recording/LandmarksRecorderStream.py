@@ -0,0 +1,57 @@
+import numpy
+from numpy import ndarray
+
+from src.stream.core.StreamWriteOnly import StreamWriteOnly
+from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
+from src.stream.recording.SessionWriter import SessionWriter
+
+
+class LandmarksRecorderStream(StreamWriteOnly[MediaPipeFrame]):
+    """
+    Writes the face landmarks and the facial transformation matrix of MediaPipe to a track of the session. The
+    track is created with the first frame, the number of landmarks depends on the model.
+
+    The row is built on the writer thread, put only keeps the references to the MediaPipe result.
+    """
+
+    def __init__(self, writer: SessionWriter, track_name: str):
+        self.__writer: SessionWriter = writer
+        self.__track_name: str = track_name
+        self.__closed: bool = False
+
+    def put(self, value: MediaPipeFrame) -> bool:
+        if self.__closed:
+            return False
+
+        landmarks = value.face_landmarker_result.face_landmarks[0]
+        matrix = value.face_landmarker_result.facial_transformation_matrixes[0]
+
+        try:
+            self.__writer.append(self.__track_name, value.camera_frame.timestamp_ns,
+                                 lambda: self.__create_row(landmarks, matrix))
+        except InterruptedError:
+            self.__closed = True
+            return False
+
+        return True
+
+    def close(self) -> None:
+        self.__closed = True
+
+    def __create_row(self, landmarks: list, matrix: ndarray) -> ndarray:
+        if not self.__writer.has_track(self.__track_name):
+            self.__writer.add_track(self.__track_name, LandmarksRecorderStream.__get_columns(len(landmarks)))
+
+        row = numpy.empty(len(landmarks) * 3 + 16, dtype=numpy.float32)
+        row[:len(landmarks) * 3] = [coordinate for landmark in landmarks for coordinate in
+                                    (landmark.x, landmark.y, landmark.z)]
+        row[len(landmarks) * 3:] = numpy.asarray(matrix, dtype=numpy.float32).reshape(-1)
+
+        return row
+
+    @staticmethod
+    def __get_columns(landmark_count: int) -> list[str]:
+        columns = [f"landmark_{index}_{axis}" for index in range(landmark_count) for axis in "xyz"]
+        columns.extend(f"matrix_{row}{column}" for row in range(4) for column in range(4))
+
+        return columns
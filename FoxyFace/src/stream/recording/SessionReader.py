@@ -0,0 +1,40 @@
+import logging
+from pathlib import Path
+
+from src.timeseries.TimeSeriesFormat import TimeSeriesFormat
+from src.timeseries.TimeSeriesReader import TimeSeriesReader
+
+_logger = logging.getLogger(__name__)
+
+
+class SessionReader:
+    """
+    Reads a session directory written by SessionWriter. The tracks are memory-mapped, only the rows that are used
+    are loaded from the disk.
+
+    Tracks that can't be opened, e.g. damaged by a crash, are skipped, the session is read without them.
+    """
+
+    def __init__(self, path: Path):
+        self.__path: Path = path
+        self.__tracks: dict[str, TimeSeriesReader] = {}
+
+        for file in sorted(path.glob(f"*{TimeSeriesFormat.EXTENSION}")):
+            try:
+                self.__tracks[file.stem] = TimeSeriesReader(file)
+            except Exception:
+                _logger.warning(f"Failed to open track {file}", exc_info=True, stack_info=True)
+
+        if not self.__tracks:
+            raise ValueError(f"No tracks in session {path}")
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def tracks(self) -> dict[str, TimeSeriesReader]:
+        return self.__tracks
+
+    def get_track(self, name: str) -> TimeSeriesReader | None:
+        return self.__tracks.get(name)
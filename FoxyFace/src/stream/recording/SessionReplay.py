@@ -0,0 +1,170 @@
+import logging
+import time
+from threading import Event, Thread
+
+import numpy
+from numpy import ndarray
+
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+from src.stream.core.StreamWriteOnly import StreamWriteOnly
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.recording.SessionReader import SessionReader
+from src.stream.trace.FrameTrace import FrameTrace
+from src.timeseries.TimeSeriesReader import TimeSeriesReader
+
+_logger = logging.getLogger(__name__)
+
+
+class SessionReplay:
+    """
+    Puts the recorded blend shape tracks of a session into streams, in the recorded order. The timestamps are moved
+    to the time of the replay, the intervals between the frames stay the same, so the filters give the same output
+    at any speed.
+
+    The target streams aren't closed by the replay.
+    """
+
+    def __init__(self, session: SessionReader,
+                 streams: dict[str, tuple[BlendShapeSlots, StreamWriteOnly[DenseBlendShapesFrame]]],
+                 pacing: FramePacingEnum = FramePacingEnum.RealTime, loop: bool = False):
+        """
+        Args:
+            streams: Track name to the slots of the track enum and the stream for its frames. Tracks of the session
+                without a stream are skipped.
+        """
+
+        self.__pacing: FramePacingEnum = pacing
+        self.__loop: bool = loop
+
+        self.__tracks: list[tuple[TimeSeriesReader, BlendShapeSlots, StreamWriteOnly, ndarray, ndarray]] = []
+
+        for name, (slots, stream) in streams.items():
+            track = session.get_track(name)
+            if track is None:
+                _logger.warning(f"Session has no track {name}")
+                continue
+
+            if track.enum_name != slots.enum_type.__name__:
+                _logger.warning(f"Track {name} has {track.enum_name} values, expected {slots.enum_type.__name__}")
+                continue
+
+            columns, indices = SessionReplay.__map_columns(track, slots)
+            self.__tracks.append((track, slots, stream, columns, indices))
+
+        self.__frame_count: int = 0
+        self.__finished_event = Event()
+        self.__close_event = Event()
+
+        self.__thread = Thread(target=self.__run, daemon=True, name="Session Replay")
+        self.__thread.start()
+
+    @property
+    def frame_count(self) -> int:
+        return self.__frame_count
+
+    def is_finished(self) -> bool:
+        return self.__finished_event.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits until every frame is replayed, never with loop.
+
+        Returns:
+            True if the replay has finished.
+        """
+
+        return self.__finished_event.wait(timeout)
+
+    def close(self) -> None:
+        self.__close_event.set()
+        self.__thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __run(self):
+        try:
+            track_ids, rows, timestamps = self.__get_order()
+
+            if len(timestamps) > 0:
+                # A loop starts one average frame interval after the end of the previous one
+                duration_ns = int(timestamps[-1] - timestamps[0])
+                period_ns = duration_ns + duration_ns // max(1, len(timestamps) - 1)
+
+                start_ns = time.perf_counter_ns()
+
+                while self.__replay(track_ids.tolist(), rows.tolist(), (timestamps - timestamps[0]).tolist(),
+                                    start_ns) and self.__loop:
+                    start_ns += period_ns
+        except Exception:
+            _logger.warning("Session replay failed", exc_info=True, stack_info=True)
+        finally:
+            self.__finished_event.set()
+
+    def __replay(self, track_ids: list[int], rows: list[int], offsets_ns: list[int], start_ns: int) -> bool:
+        """
+        Returns:
+            False if the replay was closed.
+        """
+
+        for track_id, row, offset_ns in zip(track_ids, rows, offsets_ns):
+            if self.__close_event.is_set():
+                return False
+
+            timestamp_ns = start_ns + offset_ns
+
+            if self.__pacing == FramePacingEnum.RealTime:
+                remaining_ns = timestamp_ns - time.perf_counter_ns()
+                if remaining_ns > 0 and self.__close_event.wait(remaining_ns / 1_000_000_000):
+                    return False
+
+            track, slots, stream, columns, indices = self.__tracks[track_id]
+
+            values = numpy.full(len(slots), numpy.nan, dtype=numpy.float64)
+            values[indices] = track.read_row(row)[1][columns]
+
+            mask = ~numpy.isnan(values)
+            values[~mask] = 0.0
+
+            stream.put(DenseBlendShapesFrame.from_values(slots, values, mask, timestamp_ns,
+                                                         FrameTrace("replay", time.perf_counter_ns())))
+
+            self.__frame_count += 1
+
+        return True
+
+    def __get_order(self) -> tuple[ndarray, ndarray, ndarray]:
+        """
+        Returns:
+            Track index, row and timestamp of every frame of all tracks sorted by the timestamp.
+        """
+
+        track_ids = numpy.concatenate([numpy.full(len(track), index, dtype=numpy.intp) for index, (track, *_) in
+                                       enumerate(self.__tracks)] + [numpy.empty(0, dtype=numpy.intp)])
+        rows = numpy.concatenate([numpy.arange(len(track), dtype=numpy.intp) for track, *_ in self.__tracks] +
+                                 [numpy.empty(0, dtype=numpy.intp)])
+        timestamps = numpy.concatenate([track.read_timestamps() for track, *_ in self.__tracks] +
+                                       [numpy.empty(0, dtype=numpy.int64)])
+
+        order = numpy.argsort(timestamps, kind="stable")
+
+        return track_ids[order], rows[order], timestamps[order]
+
+    @staticmethod
+    def __map_columns(track: TimeSeriesReader, slots: BlendShapeSlots) -> tuple[ndarray, ndarray]:
+        """
+        Returns:
+            Columns of the track that are members of the enum and their slot indices, the enum may have changed
+            since the recording.
+        """
+
+        members = slots.enum_type.__members__
+
+        columns = [column for column, name in enumerate(track.columns) if name in members]
+        indices = [slots.index(members[track.columns[column]]) for column in columns]
+
+        return numpy.array(columns, dtype=numpy.intp), numpy.array(indices, dtype=numpy.intp)
@@ -0,0 +1,8 @@
+from enum import Enum, unique
+
+
+@unique
+class SessionTrackEnum(Enum):
+    MediaPipe = "mediapipe"  # MediaPipe blend shapes after MediaPipeProcessing
+    Babble = "babble"
+    MediaPipeLandmarks = "mediapipe_landmarks"  # Face landmarks and facial transformation matrix, optional
@@ -0,0 +1,186 @@
+import logging
+from pathlib import Path
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import Callable
+
+from numpy import ndarray
+
+from src.timeseries.TimeSeriesFormat import TimeSeriesFormat
+from src.timeseries.TimeSeriesWriter import TimeSeriesWriter
+
+_logger = logging.getLogger(__name__)
+
+
+class SessionWriter:
+    """
+    Appends tracking output to a session directory. Every track is a time series file named after the track, see
+    src/timeseries/README.md.
+
+    The rows are written by the "Session Writer" thread, append only puts them into a bounded queue, so a slow disk
+    doesn't stall the pipelines that are recorded. Rows that don't fit into the queue are dropped and counted.
+
+    Thread-safe, the tracks are appended by the threads of their pipelines.
+    """
+
+    def __init__(self, path: Path, queue_size: int = 1024):
+        """
+        Args:
+            queue_size: Rows waiting for the disk, about 8 seconds of MediaPipe and Babble at 60 FPS by default.
+        """
+
+        if queue_size <= 0:
+            raise ValueError("queue_size must be positive")
+
+        path.mkdir(parents=True, exist_ok=False)
+
+        self.__path: Path = path
+        self.__lock: Lock = Lock()
+
+        self.__tracks: dict[str, TimeSeriesWriter] = {}
+        self.__closed: bool = False
+        self.__dropped_rows: int = 0
+
+        # Rows as (track name, timestamp, values), an Event to flush and None to stop. queue.Queue rather than
+        # EventBufferStream, whose ring buffer drops the oldest value without telling the producer.
+        self.__queue: Queue[tuple[str, int, ndarray | Callable[[], ndarray]] | Event | None] = Queue(queue_size)
+
+        self.__thread: Thread = Thread(target=self.__loop, daemon=True, name="Session Writer")
+        self.__thread.start()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def dropped_rows(self) -> int:
+        """
+        Rows dropped because the queue was full.
+        """
+
+        return self.__dropped_rows
+
+    def add_track(self, name: str, columns: list[str], enum_name: str | None = None) -> None:
+        """
+        Args:
+            columns: Names of the values of a row, e.g. the names of the enum members.
+            enum_name: Name of the blend shape enum of the columns, None if the track has no blend shapes.
+        """
+
+        with self.__lock:
+            if self.__closed:
+                raise InterruptedError()
+
+            if name in self.__tracks:
+                raise ValueError(f"Track {name} already exists")
+
+            self.__tracks[name] = TimeSeriesWriter(self.__path / f"{name}{TimeSeriesFormat.EXTENSION}", columns,
+                                                   enum_name)
+
+    def has_track(self, name: str) -> bool:
+        return name in self.__tracks
+
+    def append(self, name: str, timestamp_ns: int, values: ndarray | Callable[[], ndarray]) -> None:
+        """
+        Queues a row, never blocks.
+
+        Args:
+            values: A row in the column order of the track, NaN for values that aren't present. Must not be changed
+                after the call. A callable is called on the writer thread, for rows that are expensive to build, it
+                may add the track.
+
+        Raises:
+            InterruptedError if the writer is closed.
+        """
+
+        if self.__closed:
+            raise InterruptedError()
+
+        try:
+            self.__queue.put_nowait((name, timestamp_ns, values))
+        except Full:
+            with self.__lock:
+                self.__dropped_rows += 1
+
+    def flush(self) -> None:
+        """
+        Waits until the queued rows are written and flushes them to the file.
+        """
+
+        if self.__closed:
+            return
+
+        flushed = Event()
+        self.__queue.put(flushed)
+
+        # The thread stops without setting the event if the writer is closed meanwhile
+        while not flushed.wait(0.1) and self.__thread.is_alive():
+            pass
+
+    def close(self) -> None:
+        """
+        Writes the queued rows and closes the tracks.
+        """
+
+        with self.__lock:
+            if self.__closed:
+                return
+
+            self.__closed = True
+
+        self.__queue.put(None)
+        self.__thread.join()
+
+        for track in self.__tracks.values():
+            try:
+                track.close()
+            except Exception:
+                _logger.warning(f"Failed to close track {track.path}", exc_info=True, stack_info=True)
+
+        if self.__dropped_rows > 0:
+            _logger.warning(f"Dropped {self.__dropped_rows} rows of session {self.__path}, the disk was too slow")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __loop(self):
+        failed_tracks: set[str] = set()
+
+        while True:
+            item = self.__queue.get()
+
+            if item is None:
+                return
+
+            if isinstance(item, Event):
+                try:
+                    for name, track in list(self.__tracks.items()):  # A track can be added meanwhile
+                        if name not in failed_tracks:
+                            track.flush()
+                except Exception:
+                    _logger.warning("Failed to flush session", exc_info=True, stack_info=True)
+                finally:
+                    item.set()
+
+                continue
+
+            name, timestamp_ns, values = item
+
+            if name in failed_tracks:
+                continue
+
+            try:
+                if callable(values):
+                    values = values()
+
+                self.__tracks[name].append(timestamp_ns, values)
+            except InterruptedError:
+                pass
+            except Exception:
+                # Logged once, a full disk would fail every row
+                _logger.warning(f"Failed to write track {name}, the track is not recorded anymore", exc_info=True,
+                                stack_info=True)
+                failed_tracks.add(name)
@@ -0,0 +1,46 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class FrameTrace:
+    """
+    Timestamps of the stages a frame went through. Every stage adds a new node that points to the previous one,
+    so a frame shared by several consumers can be stamped by all of them without locks.
+    """
+
+    stage: str
+    time_ns: int
+    previous: "FrameTrace | None" = None
+
+    def mark(self, stage: str) -> "FrameTrace":
+        return FrameTrace(stage, time.perf_counter_ns(), self)
+
+    def spans(self) -> list[tuple[str, int]]:
+        """
+        Returns:
+            Stage names and the time since the previous stage in nanoseconds, in stage order. The first stage
+            has no span, it is the start of the trace.
+        """
+
+        spans = []
+
+        node = self
+        while node.previous is not None:
+            spans.append((node.stage, node.time_ns - node.previous.time_ns))
+            node = node.previous
+
+        spans.reverse()
+
+        return spans
+
+    def total_ns(self) -> int:
+        node = self
+        while node.previous is not None:
+            node = node.previous
+
+        return self.time_ns - node.time_ns
+
+    @staticmethod
+    def extend(trace: "FrameTrace | None", stage: str) -> "FrameTrace | None":
+        return None if trace is None else trace.mark(stage)
@@ -0,0 +1,102 @@
+import logging
+import time
+from threading import Lock
+
+from src.metrics.LatencyHistogram import LatencyHistogram
+from src.metrics.LatencySnapshot import LatencySnapshot
+from src.stream.trace.FrameTrace import FrameTrace
+
+_logger = logging.getLogger(__name__)
+
+
+class FrameTraceCollector:
+    """
+    Aggregates the traces of sent frames into a latency histogram per stage. The report is recalculated every
+    report_interval seconds, a summary is written to the log every log_interval seconds.
+    """
+
+    TOTAL_STAGE: str = "total"
+
+    def __init__(self, report_interval: float = 5.0, log_interval: float = 60.0):
+        self.__report_interval_ns: int = int(report_interval * 1_000_000_000)
+        self.__log_interval_ns: int = int(log_interval * 1_000_000_000)
+
+        self.__report_histograms: dict[str, LatencyHistogram] = dict[str, LatencyHistogram]()
+        self.__log_histograms: dict[str, LatencyHistogram] = dict[str, LatencyHistogram]()
+        # Traces of different paths contain different stages, a new stage is placed after its predecessor
+        self.__stage_order: list[str] = [FrameTraceCollector.TOTAL_STAGE]
+
+        self.__last_report: dict[str, LatencySnapshot] = dict[str, LatencySnapshot]()
+        self.__last_report_time_ns: int = time.perf_counter_ns()
+        self.__last_log_time_ns: int = time.perf_counter_ns()
+
+        self.__lock: Lock = Lock()
+
+    def submit(self, trace: FrameTrace) -> None:
+        spans = trace.spans()
+
+        with self.__lock:
+            previous_stage = None
+            for stage, _ in spans:
+                if stage not in self.__stage_order:
+                    position = 0 if previous_stage is None else self.__stage_order.index(previous_stage) + 1
+                    self.__stage_order.insert(position, stage)
+
+                previous_stage = stage
+
+            spans.append((FrameTraceCollector.TOTAL_STAGE, trace.total_ns()))
+
+            for stage, duration_ns in spans:
+                FrameTraceCollector.__get_histogram(self.__report_histograms, stage).add(duration_ns)
+                FrameTraceCollector.__get_histogram(self.__log_histograms, stage).add(duration_ns)
+
+            current_time = time.perf_counter_ns()
+            if current_time - self.__last_log_time_ns < self.__log_interval_ns:
+                return
+
+            summary = FrameTraceCollector.__format(self.__create_report(self.__log_histograms))
+            self.__last_log_time_ns = current_time
+
+        _logger.info(f"Stage latency p50/p95/p99 ms: {summary}")
+
+    def get_report(self) -> dict[str, LatencySnapshot]:
+        """
+        Returns:
+            Latency of every stage in the order of the stages, the last one is TOTAL_STAGE.
+        """
+
+        with self.__lock:
+            current_time = time.perf_counter_ns()
+
+            if current_time - self.__last_report_time_ns >= self.__report_interval_ns:
+                self.__last_report = self.__create_report(self.__report_histograms)
+                self.__last_report_time_ns = current_time
+
+            return self.__last_report
+
+    @staticmethod
+    def __get_histogram(histograms: dict[str, LatencyHistogram], stage: str) -> LatencyHistogram:
+        histogram = histograms.get(stage)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            histograms[stage] = histogram
+
+        return histogram
+
+    def __create_report(self, histograms: dict[str, LatencyHistogram]) -> dict[str, LatencySnapshot]:
+        report = dict[str, LatencySnapshot]()
+
+        for stage in self.__stage_order:
+            histogram = histograms.get(stage)
+            if histogram is None or histogram.count == 0:
+                continue
+
+            report[stage] = LatencySnapshot.from_histogram(histogram)
+            histogram.clear()
+
+        return report
+
+    @staticmethod
+    def __format(report: dict[str, LatencySnapshot]) -> str:
+        return ", ".join(f"{stage} {value.p50_ms:.1f}/{value.p95_ms:.1f}/{value.p99_ms:.1f}"
+                         for stage, value in report.items())
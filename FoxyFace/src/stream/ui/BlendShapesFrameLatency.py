@@ -1,46 +1,40 @@
-import threading
 import time
 
+from src.metrics.LatencyMetric import LatencyMetric
 from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
 from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
-from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 
 
-class BlendShapesFrameLatency(StreamWriteOnly[BlendShapesFrame[BabbleBlendShapeEnum] | MediaPipeFrame]):
-    def __init__(self):
-        self.__last_latency: float = 0.0
-        self.__last_latency_update_ns: int = time.perf_counter_ns()
+class BlendShapesFrameLatency(StreamWriteOnly[DenseBlendShapesFrame[BabbleBlendShapeEnum] | MediaPipeFrame]):
+    """
+    Latency from the camera frame to the put call, must be written by a single thread.
+    """
 
-        self.__latency_sum: int = 0
-        self.__latency_count: int = 0
+    def __init__(self):
+        self.__metric: LatencyMetric = LatencyMetric()
 
-        self.__lock = threading.Lock()
+    @property
+    def metric(self) -> LatencyMetric:
+        return self.__metric
 
-    def put(self, value: BlendShapesFrame[BabbleBlendShapeEnum] | MediaPipeFrame) -> bool:
-        with self.__lock:
-            if isinstance(value, BlendShapesFrame):
-                self.__latency_sum += time.perf_counter_ns() - value.timestamp_ns
-            elif isinstance(value, MediaPipeFrame):
-                self.__latency_sum += time.perf_counter_ns() - value.camera_frame.timestamp_ns
-            else:
-                raise ValueError
+    def put(self, value: DenseBlendShapesFrame[BabbleBlendShapeEnum] | MediaPipeFrame) -> bool:
+        current_time = time.perf_counter_ns()
 
-            self.__latency_count += 1
+        if isinstance(value, DenseBlendShapesFrame):
+            self.__metric.record(current_time - value.timestamp_ns, current_time)
+        elif isinstance(value, MediaPipeFrame):
+            self.__metric.record(current_time - value.camera_frame.timestamp_ns, current_time)
+        else:
+            raise ValueError
 
         return True
 
     def get_latency(self) -> float:
-        with self.__lock:
-            current_time = time.perf_counter_ns()
-
-            if current_time - self.__last_latency_update_ns >= 1_000_000_000:
-                if self.__latency_count == 0:
-                    self.__last_latency = 0.0
-                else:
-                    self.__last_latency = self.__latency_sum / (self.__latency_count * 1_000_000_000)
-                self.__last_latency_update_ns = current_time
-                self.__latency_sum = 0
-                self.__latency_count = 0
-
-        return self.__last_latency
+        """
+        Returns:
+            Median latency of the last window in seconds.
+        """
+
+        return self.__metric.snapshot().window.p50_ms / 1_000
@@ -1,6 +1,7 @@
 from enum import StrEnum, unique
 
 
+# The binary VRCFT packet sends the values in the definition order, new members must be added only to the end
 @unique
 class UnifiedExpressionEnum(StrEnum):
     # Eye Expressions
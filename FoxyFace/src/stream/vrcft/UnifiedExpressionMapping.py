@@ -0,0 +1,184 @@
+import numpy
+from numpy import ndarray
+
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
+from src.stream.vrcft.UnifiedExpressionEnum import UnifiedExpressionEnum
+
+# The first present source is used
+# @formatter:off
+_sources: dict[UnifiedExpressionEnum, tuple[GeneralBlendShapeEnum, ...]] = {
+    UnifiedExpressionEnum.BrowLowererLeft: (GeneralBlendShapeEnum.BrowDownLeft,),
+    UnifiedExpressionEnum.BrowPinchLeft: (GeneralBlendShapeEnum.BrowDownLeft,),
+
+    UnifiedExpressionEnum.BrowLowererRight: (GeneralBlendShapeEnum.BrowDownRight,),
+    UnifiedExpressionEnum.BrowPinchRight: (GeneralBlendShapeEnum.BrowDownRight,),
+
+    UnifiedExpressionEnum.BrowInnerUpRight: (GeneralBlendShapeEnum.BrowInnerUp,),
+    UnifiedExpressionEnum.BrowInnerUpLeft: (GeneralBlendShapeEnum.BrowInnerUp,),
+
+    UnifiedExpressionEnum.BrowOuterUpLeft: (GeneralBlendShapeEnum.BrowOuterUpLeft,),
+    UnifiedExpressionEnum.BrowOuterUpRight: (GeneralBlendShapeEnum.BrowOuterUpRight,),
+
+    UnifiedExpressionEnum.CheekPuffLeft: (GeneralBlendShapeEnum.CheekPuffLeft, GeneralBlendShapeEnum.CheekPuff),
+    UnifiedExpressionEnum.CheekPuffRight: (GeneralBlendShapeEnum.CheekPuffRight, GeneralBlendShapeEnum.CheekPuff),
+
+    UnifiedExpressionEnum.CheekSquintLeft: (GeneralBlendShapeEnum.CheekSquintLeft,),
+    UnifiedExpressionEnum.CheekSquintRight: (GeneralBlendShapeEnum.CheekSquintRight,),
+
+    UnifiedExpressionEnum.EyeOpennessLeft: (GeneralBlendShapeEnum.EyeBlinkLeft,),
+    UnifiedExpressionEnum.EyeOpennessRight: (GeneralBlendShapeEnum.EyeBlinkRight,),
+
+    UnifiedExpressionEnum.EyeXLeft: (GeneralBlendShapeEnum.EyeXLeft,),
+    UnifiedExpressionEnum.EyeXRight: (GeneralBlendShapeEnum.EyeXRight,),
+    UnifiedExpressionEnum.EyeYLeft: (GeneralBlendShapeEnum.EyeYLeft,),
+    UnifiedExpressionEnum.EyeYRight: (GeneralBlendShapeEnum.EyeYRight,),
+
+    UnifiedExpressionEnum.EyeSquintLeft: (GeneralBlendShapeEnum.EyeSquintLeft,),
+    UnifiedExpressionEnum.EyeSquintRight: (GeneralBlendShapeEnum.EyeSquintRight,),
+
+    UnifiedExpressionEnum.EyeWideLeft: (GeneralBlendShapeEnum.EyeWideLeft,),
+    UnifiedExpressionEnum.EyeWideRight: (GeneralBlendShapeEnum.EyeWideRight,),
+
+    UnifiedExpressionEnum.JawForward: (GeneralBlendShapeEnum.JawForward,),
+    UnifiedExpressionEnum.JawLeft: (GeneralBlendShapeEnum.JawLeft,),
+    UnifiedExpressionEnum.JawOpen: (GeneralBlendShapeEnum.JawOpen,),
+    UnifiedExpressionEnum.JawRight: (GeneralBlendShapeEnum.JawRight,),
+
+    UnifiedExpressionEnum.MouthClosed: (GeneralBlendShapeEnum.MouthClosed,),
+
+    UnifiedExpressionEnum.MouthDimpleLeft: (GeneralBlendShapeEnum.MouthDimpleLeft,),
+    UnifiedExpressionEnum.MouthDimpleRight: (GeneralBlendShapeEnum.MouthDimpleRight,),
+
+    UnifiedExpressionEnum.MouthFrownLeft: (GeneralBlendShapeEnum.MouthFrownLeft,),
+    UnifiedExpressionEnum.MouthFrownRight: (GeneralBlendShapeEnum.MouthFrownRight,),
+
+    UnifiedExpressionEnum.LipFunnelUpperRight: (GeneralBlendShapeEnum.MouthFunnel,),
+    UnifiedExpressionEnum.LipFunnelUpperLeft: (GeneralBlendShapeEnum.MouthFunnel,),
+    UnifiedExpressionEnum.LipFunnelLowerRight: (GeneralBlendShapeEnum.MouthFunnel,),
+    UnifiedExpressionEnum.LipFunnelLowerLeft: (GeneralBlendShapeEnum.MouthFunnel,),
+
+    UnifiedExpressionEnum.MouthUpperLeft: (GeneralBlendShapeEnum.MouthLeft,),
+    UnifiedExpressionEnum.MouthLowerLeft: (GeneralBlendShapeEnum.MouthLeft,),
+
+    UnifiedExpressionEnum.MouthLowerDownLeft: (GeneralBlendShapeEnum.MouthLowerDownLeft,),
+    UnifiedExpressionEnum.MouthLowerDownRight: (GeneralBlendShapeEnum.MouthLowerDownRight,),
+
+    UnifiedExpressionEnum.MouthPressLeft: (GeneralBlendShapeEnum.MouthPressLeft,),
+    UnifiedExpressionEnum.MouthPressRight: (GeneralBlendShapeEnum.MouthPressRight,),
+
+    UnifiedExpressionEnum.LipPuckerUpperRight: (GeneralBlendShapeEnum.MouthPucker,),
+    UnifiedExpressionEnum.LipPuckerUpperLeft: (GeneralBlendShapeEnum.MouthPucker,),
+    UnifiedExpressionEnum.LipPuckerLowerRight: (GeneralBlendShapeEnum.MouthPucker,),
+    UnifiedExpressionEnum.LipPuckerLowerLeft: (GeneralBlendShapeEnum.MouthPucker,),
+
+    UnifiedExpressionEnum.MouthUpperRight: (GeneralBlendShapeEnum.MouthRight,),
+    UnifiedExpressionEnum.MouthLowerRight: (GeneralBlendShapeEnum.MouthRight,),
+
+    UnifiedExpressionEnum.LipSuckLowerRight: (GeneralBlendShapeEnum.MouthRollLower,),
+    UnifiedExpressionEnum.LipSuckLowerLeft: (GeneralBlendShapeEnum.MouthRollLower,),
+
+    UnifiedExpressionEnum.LipSuckUpperRight: (GeneralBlendShapeEnum.MouthRollUpper,),
+    UnifiedExpressionEnum.LipSuckUpperLeft: (GeneralBlendShapeEnum.MouthRollUpper,),
+
+    UnifiedExpressionEnum.MouthRaiserLower: (GeneralBlendShapeEnum.MouthRaiserLower,),
+    UnifiedExpressionEnum.MouthRaiserUpper: (GeneralBlendShapeEnum.MouthRaiserUpper,),
+
+    UnifiedExpressionEnum.MouthCornerPullLeft: (GeneralBlendShapeEnum.MouthSmileLeft,),
+    UnifiedExpressionEnum.MouthCornerSlantLeft: (GeneralBlendShapeEnum.MouthSmileLeft,),
+
+    UnifiedExpressionEnum.MouthCornerPullRight: (GeneralBlendShapeEnum.MouthSmileRight,),
+    UnifiedExpressionEnum.MouthCornerSlantRight: (GeneralBlendShapeEnum.MouthSmileRight,),
+
+    UnifiedExpressionEnum.MouthStretchLeft: (GeneralBlendShapeEnum.MouthStretchLeft,),
+    UnifiedExpressionEnum.MouthStretchRight: (GeneralBlendShapeEnum.MouthStretchRight,),
+
+    UnifiedExpressionEnum.MouthUpperUpLeft: (GeneralBlendShapeEnum.MouthUpperUpLeft,),
+    UnifiedExpressionEnum.MouthUpperUpRight: (GeneralBlendShapeEnum.MouthUpperUpRight,),
+
+    UnifiedExpressionEnum.NoseSneerLeft: (GeneralBlendShapeEnum.NoseSneerLeft,),
+    UnifiedExpressionEnum.NoseSneerRight: (GeneralBlendShapeEnum.NoseSneerRight,),
+
+    UnifiedExpressionEnum.HeadX: (GeneralBlendShapeEnum.HeadX,),
+    UnifiedExpressionEnum.HeadY: (GeneralBlendShapeEnum.HeadY,),
+    UnifiedExpressionEnum.HeadZ: (GeneralBlendShapeEnum.HeadZ,),
+
+    UnifiedExpressionEnum.HeadPitch: (GeneralBlendShapeEnum.HeadPitch,),
+    UnifiedExpressionEnum.HeadYaw: (GeneralBlendShapeEnum.HeadYaw,),
+    UnifiedExpressionEnum.HeadRoll: (GeneralBlendShapeEnum.HeadRoll,),
+
+    UnifiedExpressionEnum.CheekSuckLeft: (GeneralBlendShapeEnum.CheekSuckLeft,),
+    UnifiedExpressionEnum.CheekSuckRight: (GeneralBlendShapeEnum.CheekSuckRight,),
+
+    UnifiedExpressionEnum.TongueOut: (GeneralBlendShapeEnum.TongueOut,),
+    UnifiedExpressionEnum.TongueUp: (GeneralBlendShapeEnum.TongueUp,),
+    UnifiedExpressionEnum.TongueDown: (GeneralBlendShapeEnum.TongueDown,),
+    UnifiedExpressionEnum.TongueLeft: (GeneralBlendShapeEnum.TongueLeft,),
+    UnifiedExpressionEnum.TongueRight: (GeneralBlendShapeEnum.TongueRight,),
+    UnifiedExpressionEnum.TongueRoll: (GeneralBlendShapeEnum.TongueRoll,),
+    UnifiedExpressionEnum.TongueBendDown: (GeneralBlendShapeEnum.TongueBendDown,),
+    UnifiedExpressionEnum.TongueCurlUp: (GeneralBlendShapeEnum.TongueCurlUp,),
+    UnifiedExpressionEnum.TongueSquish: (GeneralBlendShapeEnum.TongueSquish,),
+    UnifiedExpressionEnum.TongueFlat: (GeneralBlendShapeEnum.TongueFlat,),
+    UnifiedExpressionEnum.TongueTwistLeft: (GeneralBlendShapeEnum.TongueTwistLeft,),
+    UnifiedExpressionEnum.TongueTwistRight: (GeneralBlendShapeEnum.TongueTwistRight,)
+}
+# @formatter:on
+
+# Blink is sent as openness
+_inverted: set[UnifiedExpressionEnum] = {UnifiedExpressionEnum.EyeOpennessLeft, UnifiedExpressionEnum.EyeOpennessRight}
+
+
+class UnifiedExpressionMapping:
+    """
+    Converts general blend shapes to VRCFT unified expressions, the result is indexed by the UnifiedExpressionEnum
+    definition order. The mapping is compiled into index arrays once.
+    """
+
+    def __init__(self):
+        self.__members: tuple[UnifiedExpressionEnum, ...] = tuple(UnifiedExpressionEnum)
+
+        general_slots = BlendShapeSlots.of(GeneralBlendShapeEnum)
+
+        size = len(self.__members)
+        self.__primary = numpy.zeros(size, dtype=numpy.intp)
+        self.__has_primary = numpy.zeros(size, dtype=numpy.bool_)
+        self.__fallback = numpy.zeros(size, dtype=numpy.intp)
+        self.__has_fallback = numpy.zeros(size, dtype=numpy.bool_)
+        self.__inverted = numpy.zeros(size, dtype=numpy.bool_)
+
+        for index, member in enumerate(self.__members):
+            sources = _sources.get(member, ())
+
+            if len(sources) > 0:
+                self.__primary[index] = general_slots.index(sources[0])
+                self.__has_primary[index] = True
+            if len(sources) > 1:
+                self.__fallback[index] = general_slots.index(sources[1])
+                self.__has_fallback[index] = True
+
+            self.__inverted[index] = member in _inverted
+
+    @property
+    def members(self) -> tuple[UnifiedExpressionEnum, ...]:
+        return self.__members
+
+    def map(self, frame: DenseBlendShapesFrame[GeneralBlendShapeEnum]) -> tuple[ndarray, ndarray]:
+        """
+        Returns:
+            Values (float64) and presence mask of all unified expressions.
+        """
+
+        present = self.__has_primary & frame.mask[self.__primary]
+        use_fallback = ~present & self.__has_fallback & frame.mask[self.__fallback]
+
+        values = numpy.where(use_fallback, frame.values[self.__fallback], frame.values[self.__primary])
+        values = numpy.where(self.__inverted, 1.0 - values, values)
+
+        return values, present | use_fallback
+
+    def to_dict(self, values: ndarray, present: ndarray) -> dict[UnifiedExpressionEnum, float]:
+        indices = numpy.flatnonzero(present)
+
+        return dict(zip([self.__members[index] for index in indices.tolist()], values[indices].tolist()))
@@ -1,8 +1,9 @@
 import logging
 import socket
-import time
-from threading import Event, Lock, Thread
+from threading import Event, Thread
 
+from src.metrics.FrameRateMetric import FrameRateMetric
+from src.stream.trace.FrameTraceCollector import FrameTraceCollector
 from src.stream.vrcft.VrcftPacketEncoderStream import VrcftPacketEncoderStream
 
 _logger = logging.getLogger(__name__)
@@ -10,19 +11,15 @@ _logger = logging.getLogger(__name__)
 
 class VRCFTUdpSocket:
     def __init__(self, packet_stream: VrcftPacketEncoderStream, target_address: tuple[str, int] = ("localhost", 25747),
-                 ping_connection_time: float = 1.0):
+                 ping_connection_time: float = 1.0, trace_collector: FrameTraceCollector | None = None):
         self.__packet_stream: VrcftPacketEncoderStream = packet_stream
+        self.__trace_collector: FrameTraceCollector | None = trace_collector
         self.target_address: tuple[str, int] = target_address
         self.ping_connection_time: float = ping_connection_time
 
         self.__sock: socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.__lock: Lock = Lock()
 
-        self.__last_statistic_time_ns: int = time.perf_counter_ns()
-
-        self.__packet_count: int = 0
-
-        self.__last_pps: int = 0
+        self.__packet_metric: FrameRateMetric = FrameRateMetric()
         self.__has_error: bool = False
 
         self.__close_event: Event = Event()
@@ -33,9 +30,10 @@ class VRCFTUdpSocket:
         return self.__has_error
 
     def get_pps(self) -> float:
-        self.__update_statistic()
+        return self.__packet_metric.snapshot().rate
 
-        return self.__last_pps
+    def get_packet_metric(self) -> FrameRateMetric:
+        return self.__packet_metric
 
     def close(self):
         self.__close_event.set()
@@ -53,16 +51,20 @@ class VRCFTUdpSocket:
     def __loop(self):
         while not self.__close_event.is_set():
             try:
+                trace = None
                 try:
                     data = self.__packet_stream.poll(self.ping_connection_time)
+                    trace = self.__packet_stream.last_trace
                 except TimeoutError:
                     data = self.__packet_stream.generate_ping_packet()
 
                 _logger.debug(f"Sending {data}")
                 self.__sock.sendto(data, self.target_address)
 
-                with self.__lock:
-                    self.__packet_count += 1
+                if trace is not None and self.__trace_collector is not None:
+                    self.__trace_collector.submit(trace.mark("send"))
+
+                self.__packet_metric.mark()
 
                 self.__has_error = False
             except InterruptedError:
@@ -73,14 +75,3 @@ class VRCFTUdpSocket:
                 _logger.warning("Exception in UDP VRCFT loop", exc_info=True, stack_info=True)
 
                 self.__close_event.wait(0.001)
-
-    def __update_statistic(self):
-        with self.__lock:
-            current_time = time.perf_counter_ns()
-
-            if current_time - self.__last_statistic_time_ns >= 1_000_000_000:
-                self.__last_pps = (self.__packet_count * 1_000_000_000) / (current_time - self.__last_statistic_time_ns)
-
-                self.__last_statistic_time_ns = current_time
-
-                self.__packet_count = 0
@@ -72,6 +72,8 @@ class VrcftAutoConnect:
 
                 self.__config_manager.config.socket.ip = str(addr[0])
                 self.__config_manager.config.socket.port = int(json_data.get("Port"))
+                self.__config_manager.config.socket.interface_binary_protocol_version = int(
+                    json_data.get("BinaryProtocolVersion", 0))
                 self.__config_manager.write()
 
                 _logger.info(f"Auto connected to {self.__config_manager.config.socket.ip}. Data: {json_data}")
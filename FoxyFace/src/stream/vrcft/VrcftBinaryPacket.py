@@ -0,0 +1,75 @@
+import struct
+
+import numpy
+from numpy import ndarray
+
+from src.stream.vrcft.VrcftInterfaceOptions import VrcftInterfaceOptions
+
+
+class VrcftBinaryPacket:
+    """
+    Compact alternative to the JSON packet, parsed by FoxyFaceBinaryPacket.cs in the VRCFT interface.
+
+    Layout, little-endian:
+        0   3 bytes         magic "FXF"
+        3   uint8           version
+        4   uint8           flags, bit 0: values are uint16, bit 1: BypassOtherModulesBlock, bit 2: delta packet
+        5   uint8           keyframe id, since version 2
+        6   uint16          UdpReadTimeoutMs
+        8   int64           Timestamp
+        16  uint16          expression count N
+        18  ceil(N / 8)     presence bitmap, bit i (least significant first) is set if expression i is present
+        ..                  values of the present expressions in order, float32 or uint16 mapped from [-1, 1]
+
+    Expression i is the i-th member of UnifiedExpressionEnum. The receiver skips expressions it doesn't know.
+    A delta packet contains only the expressions changed since the keyframe with the same id, the receiver merges
+    it with that keyframe and drops it if the keyframe was lost. Every other packet is a keyframe.
+    Ping packets are always JSON, so every interface version can read the config.
+    """
+
+    MAGIC: bytes = b"FXF"
+    VERSION: int = 2
+    DELTA_VERSION: int = 2
+
+    FLAG_QUANTIZED: int = 1
+    FLAG_BYPASS_OTHER_MODULES_BLOCK: int = 2
+    FLAG_DELTA: int = 4
+
+    __HEADER = struct.Struct("<3sBBBHqH")
+
+    @staticmethod
+    def encode(timestamp: int, options: VrcftInterfaceOptions, values: ndarray, present: ndarray,
+               keyframe_id: int = 0, delta: bool = False) -> bytes:
+        """
+        Writes options.binary_protocol_version as the packet version, delta packets require DELTA_VERSION.
+        """
+
+        flags = 0
+        if options.quantize_values:
+            flags |= VrcftBinaryPacket.FLAG_QUANTIZED
+        if options.bypass_other_modules_block:
+            flags |= VrcftBinaryPacket.FLAG_BYPASS_OTHER_MODULES_BLOCK
+        if delta:
+            flags |= VrcftBinaryPacket.FLAG_DELTA
+
+        header = VrcftBinaryPacket.__HEADER.pack(VrcftBinaryPacket.MAGIC, options.binary_protocol_version, flags,
+                                                 keyframe_id, min(max(options.udp_read_timeout_ms, 0), 0xFFFF),
+                                                 timestamp, len(present))
+
+        bitmap = numpy.packbits(present, bitorder="little")
+
+        present_values = values[present]
+        if options.quantize_values:
+            encoded_values = VrcftBinaryPacket.quantize(present_values)
+        else:
+            encoded_values = present_values.astype("<f4")
+
+        return b"".join((header, bitmap.tobytes(), encoded_values.tobytes()))
+
+    @staticmethod
+    def quantize(values: ndarray) -> ndarray:
+        return numpy.rint((numpy.clip(values, -1.0, 1.0) + 1.0) * 32767.5).astype("<u2")
+
+    @staticmethod
+    def dequantize(values: ndarray) -> ndarray:
+        return values.astype(numpy.float64) / 32767.5 - 1.0
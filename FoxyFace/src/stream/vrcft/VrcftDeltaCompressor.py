@@ -0,0 +1,77 @@
+import numpy
+from numpy import ndarray
+
+from src.stream.vrcft.VrcftInterfaceOptions import VrcftInterfaceOptions
+
+
+class VrcftDeltaCompressor:
+    """
+    Chooses the expressions of delta packets. A delta packet contains the expressions that changed by more than
+    delta_epsilon since the last keyframe, the receiver merges it with that keyframe. Deltas don't depend on each
+    other, so a lost delta is repaired by the next one and a lost keyframe by the next keyframe.
+
+    Keyframes are sent every keyframe_interval_ms. If nothing changed since the last packet, the packet is skipped
+    until static_packet_interval_ms has passed.
+
+    Not thread-safe.
+    """
+
+    def __init__(self, size: int):
+        self.__keyframe_values = numpy.zeros(size, dtype=numpy.float64)
+        self.__keyframe_present = numpy.zeros(size, dtype=numpy.bool_)
+        self.__keyframe_id: int = 0
+        self.__has_keyframe: bool = False
+        self.__last_keyframe_time_ns: int = 0
+
+        # State of the receiver after the last packet
+        self.__sent_values = numpy.zeros(size, dtype=numpy.float64)
+        self.__sent_present = numpy.zeros(size, dtype=numpy.bool_)
+        self.__last_packet_time_ns: int = 0
+
+    @property
+    def keyframe_id(self) -> int:
+        return self.__keyframe_id
+
+    def compress(self, values: ndarray, present: ndarray, options: VrcftInterfaceOptions,
+                 time_ns: int) -> tuple[ndarray, bool] | None:
+        """
+        Returns:
+            The expressions to send and True if it is a delta packet, or None if the packet should be skipped.
+            keyframe_id is updated before a keyframe is returned.
+        """
+
+        epsilon = options.delta_epsilon
+
+        keyframe_due = (not self.__has_keyframe or
+                        time_ns - self.__last_keyframe_time_ns >= options.keyframe_interval_ms * 1_000_000)
+
+        if not keyframe_due:
+            changed = present & (~self.__sent_present | (numpy.abs(values - self.__sent_values) > epsilon))
+            static_packet_due = time_ns - self.__last_packet_time_ns >= options.static_packet_interval_ms * 1_000_000
+            if not changed.any() and not static_packet_due:
+                return None
+
+            delta = present & (~self.__keyframe_present | (numpy.abs(values - self.__keyframe_values) > epsilon))
+
+            # A keyframe isn't much bigger than such delta and the next deltas will be smaller
+            if numpy.count_nonzero(delta) * 2 <= numpy.count_nonzero(present):
+                self.__sent_values = numpy.where(delta, values, self.__keyframe_values)
+                self.__sent_present = self.__keyframe_present | delta
+                self.__last_packet_time_ns = time_ns
+
+                return delta, True
+
+        self.__keyframe_values = values.copy()
+        self.__keyframe_present = present.copy()
+        self.__keyframe_id = (self.__keyframe_id + 1) & 0xFF
+        self.__has_keyframe = True
+        self.__last_keyframe_time_ns = time_ns
+
+        self.__sent_values = self.__keyframe_values
+        self.__sent_present = self.__keyframe_present
+        self.__last_packet_time_ns = time_ns
+
+        return present, False
+
+    def reset(self) -> None:
+        self.__has_keyframe = False
@@ -6,6 +6,17 @@ class VrcftInterfaceOptions:
     udp_read_timeout_ms: int = 5_000
     bypass_other_modules_block: bool = False
 
+    # 0 if the JSON packets are used
+    binary_protocol_version: int = 0
+    quantize_values: bool = False
+
+    # Requires binary_protocol_version >= VrcftBinaryPacket.DELTA_VERSION
+    delta_encoding: bool = False
+    delta_epsilon: float = 0.001
+    keyframe_interval_ms: int = 1_000
+    static_packet_interval_ms: int = 100
+
     def to_packet_format_dict(self) -> dict[str, int | bool]:
         return {"UdpReadTimeoutMs": self.udp_read_timeout_ms,
-                "BypassOtherModulesBlock": self.bypass_other_modules_block}
+                "BypassOtherModulesBlock": self.bypass_other_modules_block,
+                "BinaryProtocolVersion": self.binary_protocol_version}
@@ -0,0 +1,8 @@
+from enum import Enum, unique
+
+
+@unique
+class VrcftPacketFormatEnum(Enum):
+    Auto = 0  # Binary if the VRCFT interface announced support for it by auto connect
+    Json = 1
+    Binary = 2
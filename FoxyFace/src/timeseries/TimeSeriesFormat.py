@@ -0,0 +1,93 @@
+import json
+import struct
+from typing import BinaryIO
+
+import numpy
+
+
+class TimeSeriesFormat:
+    """
+    Layout of the time series files, see README.md in this directory. All numbers are little-endian.
+    """
+
+    MAGIC: bytes = b"FXTS"
+    VERSION: int = 1
+    EXTENSION: str = ".fxts"
+
+    ALIGNMENT: int = 64
+    CHUNK_HEADER_SIZE: int = 64
+
+    # Magic, version, reserved, header size, column count, chunk rows, metadata size, then reserved up to 64 bytes
+    __HEADER: struct.Struct = struct.Struct("<4sHHIIII")
+    __FIXED_HEADER_SIZE: int = 64
+
+    @staticmethod
+    def align(size: int) -> int:
+        return -(-size // TimeSeriesFormat.ALIGNMENT) * TimeSeriesFormat.ALIGNMENT
+
+    @staticmethod
+    def get_chunk_dtype(chunk_rows: int, column_count: int) -> numpy.dtype:
+        """
+        Returns:
+            Structured dtype of a whole chunk, the file after the header is an array of it.
+        """
+
+        timestamps_offset = TimeSeriesFormat.CHUNK_HEADER_SIZE
+        values_offset = timestamps_offset + 8 * chunk_rows
+
+        return numpy.dtype({"names": ["row_count", "min_timestamp", "max_timestamp", "timestamps", "values"],
+                            "formats": ["<u4", "<i8", "<i8", ("<i8", (chunk_rows,)),
+                                        ("<f4", (chunk_rows, column_count))],
+                            "offsets": [0, 8, 16, timestamps_offset, values_offset],
+                            "itemsize": TimeSeriesFormat.align(values_offset + 4 * chunk_rows * column_count)})
+
+    @staticmethod
+    def write_header(file: BinaryIO, column_count: int, chunk_rows: int, metadata: dict) -> int:
+        """
+        Returns:
+            Size of the header, the offset of the first chunk.
+        """
+
+        metadata_bytes = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+        header_size = TimeSeriesFormat.align(TimeSeriesFormat.__FIXED_HEADER_SIZE + len(metadata_bytes))
+
+        offset = TimeSeriesFormat.__FIXED_HEADER_SIZE
+
+        header = bytearray(header_size)
+        TimeSeriesFormat.__HEADER.pack_into(header, 0, TimeSeriesFormat.MAGIC, TimeSeriesFormat.VERSION, 0,
+                                            header_size, column_count, chunk_rows, len(metadata_bytes))
+        header[offset:offset + len(metadata_bytes)] = metadata_bytes
+
+        file.write(header)
+
+        return header_size
+
+    @staticmethod
+    def read_header(file: BinaryIO) -> tuple[int, int, int, dict]:
+        """
+        Returns:
+            Header size, column count, chunk rows and the metadata.
+
+        Raises:
+            ValueError if the file isn't a time series of a supported version.
+        """
+
+        fixed_header = file.read(TimeSeriesFormat.__FIXED_HEADER_SIZE)
+        if len(fixed_header) < TimeSeriesFormat.__FIXED_HEADER_SIZE:
+            raise ValueError("Not a time series file")
+
+        fields = TimeSeriesFormat.__HEADER.unpack_from(fixed_header)
+        magic, version, _, header_size, column_count, chunk_rows, metadata_size = fields
+
+        if magic != TimeSeriesFormat.MAGIC:
+            raise ValueError("Not a time series file")
+
+        if version != TimeSeriesFormat.VERSION:
+            raise ValueError(f"Unsupported time series version: {version}")
+
+        if chunk_rows <= 0 or header_size < TimeSeriesFormat.__FIXED_HEADER_SIZE + metadata_size:
+            raise ValueError("Corrupted time series header")
+
+        metadata = json.loads(file.read(metadata_size).decode("utf-8"))
+
+        return header_size, column_count, chunk_rows, metadata
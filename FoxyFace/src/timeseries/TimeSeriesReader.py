@@ -0,0 +1,175 @@
+from pathlib import Path
+
+import numpy
+from numpy import ndarray
+
+from src.timeseries.TimeSeriesFormat import TimeSeriesFormat
+
+
+class TimeSeriesReader:
+    """
+    Memory-maps a time series file, only the chunks that are read are loaded from the disk. A file that is still
+    being written can be read, the rows that the writer adds after the file is opened are not seen.
+
+    The returned views are read-only and valid while the reader is referenced.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            header_size, column_count, chunk_rows, header = TimeSeriesFormat.read_header(file)
+
+        columns = tuple(header["columns"])
+        if len(columns) != column_count:
+            raise ValueError("Corrupted time series header")
+
+        self.__path: Path = path
+        self.__enum_name: str | None = header.get("enum")
+        self.__columns: tuple[str, ...] = columns
+        self.__column_index: dict[str, int] = {name: index for index, name in enumerate(columns)}
+        self.__metadata: dict = header.get("metadata", {})
+
+        chunk_dtype = TimeSeriesFormat.get_chunk_dtype(chunk_rows, column_count)
+        chunk_count = (path.stat().st_size - header_size) // chunk_dtype.itemsize
+
+        # memmap can't map empty files
+        if chunk_count > 0:
+            self.__chunks: ndarray = numpy.memmap(path, dtype=chunk_dtype, mode="r", offset=header_size,
+                                                  shape=(chunk_count,))
+        else:
+            self.__chunks = numpy.zeros(0, dtype=chunk_dtype)
+
+        # Copied, the writer may still add rows to the last chunk. Clamped, so a damaged header can't point after the
+        # chunk.
+        self.__row_counts: ndarray = numpy.minimum(numpy.array(self.__chunks["row_count"], dtype=numpy.int64),
+                                                   chunk_rows)
+
+        # First row of every chunk, and the row count at the end
+        self.__row_offsets: ndarray = numpy.concatenate(([0], numpy.cumsum(self.__row_counts)))
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def enum_name(self) -> str | None:
+        return self.__enum_name
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self.__columns
+
+    @property
+    def metadata(self) -> dict:
+        return self.__metadata
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.__chunks)
+
+    @property
+    def chunk_index(self) -> ndarray:
+        """
+        Structured array with row_count, min_timestamp and max_timestamp of every chunk, read from the chunk headers.
+        """
+
+        return self.__chunks[["row_count", "min_timestamp", "max_timestamp"]]
+
+    def __len__(self) -> int:
+        return int(self.__row_offsets[-1])
+
+    def read_chunk(self, index: int) -> tuple[ndarray, ndarray]:
+        """
+        Returns:
+            Timestamps and values of the chunk, views of the file.
+        """
+
+        chunk = self.__chunks[index]
+        row_count = int(self.__row_counts[index])
+
+        return chunk["timestamps"][:row_count], chunk["values"][:row_count]
+
+    def read_row(self, index: int) -> tuple[int, ndarray]:
+        """
+        Returns:
+            Timestamp and values of the row, the values are a view of the file.
+        """
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        chunk_index = int(numpy.searchsorted(self.__row_offsets, index, side="right")) - 1
+        row = index - int(self.__row_offsets[chunk_index])
+
+        chunk = self.__chunks[chunk_index]
+
+        return int(chunk["timestamps"][row]), chunk["values"][row]
+
+    def read_range(self, start: int = 0, stop: int | None = None) -> tuple[ndarray, ndarray]:
+        """
+        Returns:
+            Timestamps and values of the rows from start to stop, copied from the file.
+        """
+
+        stop = len(self) if stop is None else min(stop, len(self))
+        start = max(0, start)
+
+        first_chunk = int(numpy.searchsorted(self.__row_offsets, start, side="right")) - 1
+        last_chunk = int(numpy.searchsorted(self.__row_offsets, stop, side="left"))
+
+        return self.__concatenate(range(max(0, first_chunk), last_chunk), start, stop)
+
+    def read_time_range(self, start_ns: int, stop_ns: int) -> tuple[ndarray, ndarray]:
+        """
+        Returns:
+            Timestamps and values of the rows with start_ns <= timestamp < stop_ns, copied from the file. Only the
+            chunks whose range overlaps are read.
+        """
+
+        index = self.chunk_index
+        chunk_indices = numpy.flatnonzero((self.__row_counts > 0) & (index["max_timestamp"] >= start_ns) &
+                                          (index["min_timestamp"] < stop_ns))
+
+        timestamps, values = self.__concatenate(chunk_indices.tolist(), 0, len(self))
+
+        selected = (timestamps >= start_ns) & (timestamps < stop_ns)
+
+        return timestamps[selected], values[selected]
+
+    def read_timestamps(self) -> ndarray:
+        """
+        Returns:
+            Timestamps of all rows, without reading the values.
+        """
+
+        return numpy.concatenate([self.read_chunk(index)[0] for index in range(len(self.__chunks))] +
+                                 [numpy.empty(0, dtype=numpy.int64)]).astype(numpy.int64)
+
+    def read_column(self, name: str) -> ndarray:
+        """
+        Returns:
+            Values of the column in all rows.
+        """
+
+        column = self.__column_index[name]
+
+        return numpy.concatenate([self.read_chunk(index)[1][:, column] for index in range(len(self.__chunks))] +
+                                 [numpy.empty(0, dtype=numpy.float32)]).astype(numpy.float32)
+
+    def __concatenate(self, chunk_indices: range | list[int], start: int, stop: int) -> tuple[ndarray, ndarray]:
+        timestamps = [numpy.empty(0, dtype=numpy.int64)]
+        values = [numpy.empty((0, len(self.__columns)), dtype=numpy.float32)]
+
+        for chunk_index in chunk_indices:
+            chunk_timestamps, chunk_values = self.read_chunk(chunk_index)
+
+            offset = int(self.__row_offsets[chunk_index])
+            begin = max(0, start - offset)
+            end = min(len(chunk_timestamps), stop - offset)
+
+            timestamps.append(chunk_timestamps[begin:end])
+            values.append(chunk_values[begin:end])
+
+        return numpy.concatenate(timestamps).astype(numpy.int64), numpy.concatenate(values).astype(numpy.float32)
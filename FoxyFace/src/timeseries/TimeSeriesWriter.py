@@ -0,0 +1,148 @@
+import time
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy
+from numpy import ndarray
+
+from src.timeseries.TimeSeriesFormat import TimeSeriesFormat
+
+
+class TimeSeriesWriter:
+    """
+    Creates a time series file and appends rows to it. The rows of the last chunk are kept in memory and written
+    when the chunk is full, on flush and at least every flush_interval, so a crash loses only the last rows. Written
+    rows are never changed, the chunk header is written after its rows.
+
+    Not thread-safe.
+    """
+
+    def __init__(self, path: Path, columns: list[str], enum_name: str | None = None, metadata: dict | None = None,
+                 chunk_rows: int = 1024, flush_interval: float = 1.0):
+        """
+        Args:
+            columns: Names of the values of a row, e.g. the names of the enum members.
+            enum_name: Name of the enum of the columns, None if the columns aren't enum members.
+            metadata: Any JSON data stored in the header.
+            chunk_rows: Rows in a chunk, the chunk index has one entry per chunk.
+        """
+
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be positive")
+
+        self.__file: BinaryIO = open(path, "xb")
+
+        try:
+            self.__header_size: int = TimeSeriesFormat.write_header(self.__file, len(columns), chunk_rows,
+                                                                    {"enum": enum_name, "columns": list(columns),
+                                                                     "metadata": metadata or {}})
+
+            # A track without rows can be opened by the reader too
+            self.__file.flush()
+        except Exception:
+            self.__file.close()
+            raise
+
+        self.__path: Path = path
+        self.__column_count: int = len(columns)
+        self.__chunk_rows: int = chunk_rows
+        self.__chunk_size: int = TimeSeriesFormat.get_chunk_dtype(chunk_rows, len(columns)).itemsize
+        self.__flush_interval_ns: int = int(flush_interval * 1_000_000_000)
+
+        # The last chunk, rows before __flushed_rows are in the file
+        self.__chunk_index: int = 0
+        self.__timestamps: ndarray = numpy.empty(chunk_rows, dtype="<i8")
+        self.__values: ndarray = numpy.empty((chunk_rows, len(columns)), dtype="<f4")
+        self.__rows: int = 0
+        self.__flushed_rows: int = 0
+        self.__last_flush_ns: int = time.perf_counter_ns()
+
+        self.__row_count: int = 0
+        self.__closed: bool = False
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def __len__(self) -> int:
+        return self.__row_count
+
+    def append(self, timestamp_ns: int, values: ndarray) -> None:
+        """
+        Args:
+            values: A row in the column order, NaN for values that aren't present.
+        """
+
+        if self.__closed:
+            raise InterruptedError()
+
+        if len(values) != self.__column_count:
+            raise ValueError(f"Expected {self.__column_count} values, got {len(values)}")
+
+        self.__timestamps[self.__rows] = timestamp_ns
+        self.__values[self.__rows] = values
+        self.__rows += 1
+        self.__row_count += 1
+
+        if self.__rows == self.__chunk_rows:
+            self.__write_chunk()
+
+            self.__chunk_index += 1
+            self.__rows = 0
+            self.__flushed_rows = 0
+        elif time.perf_counter_ns() - self.__last_flush_ns >= self.__flush_interval_ns:
+            self.__write_chunk()
+
+    def flush(self) -> None:
+        if self.__closed:
+            return
+
+        self.__write_chunk()
+
+    def close(self) -> None:
+        if self.__closed:
+            return
+
+        try:
+            self.__write_chunk()
+        finally:
+            self.__closed = True
+            self.__file.close()
+
+    def __write_chunk(self) -> None:
+        self.__last_flush_ns = time.perf_counter_ns()
+
+        rows = self.__rows
+        flushed_rows = self.__flushed_rows
+        if rows == flushed_rows:
+            return
+
+        chunk_offset = self.__header_size + self.__chunk_index * self.__chunk_size
+
+        # The whole chunk is allocated when it's started, so the reader can map every chunk of the file
+        if flushed_rows == 0:
+            self.__file.truncate(chunk_offset + self.__chunk_size)
+
+        timestamps_offset = chunk_offset + TimeSeriesFormat.CHUNK_HEADER_SIZE
+        self.__file.seek(timestamps_offset + 8 * flushed_rows)
+        self.__file.write(self.__timestamps[flushed_rows:rows].tobytes())
+
+        self.__file.seek(timestamps_offset + 8 * self.__chunk_rows + 4 * self.__column_count * flushed_rows)
+        self.__file.write(self.__values[flushed_rows:rows].tobytes())
+
+        # The row count makes the new rows visible, it's written after them
+        self.__file.flush()
+
+        timestamps = self.__timestamps[:rows]
+        self.__file.seek(chunk_offset)
+        self.__file.write(numpy.array(rows, dtype="<u4").tobytes() + bytes(4) +
+                          numpy.array([timestamps.min(), timestamps.max()], dtype="<i8").tobytes())
+        self.__file.flush()
+
+        self.__flushed_rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -230,6 +230,13 @@ class Ui_MainWindow(object):
 
         self.vrcft_vertical_layout.addWidget(self.vrcft_status_lbl)
 
+        self.vrcft_latency_lbl = QLabel(self.centralwidget)
+        self.vrcft_latency_lbl.setObjectName(u"vrcft_latency_lbl")
+        self.vrcft_latency_lbl.setFont(font1)
+        self.vrcft_latency_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.vrcft_vertical_layout.addWidget(self.vrcft_latency_lbl)
+
         self.vrcft_spacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
 
         self.vrcft_vertical_layout.addItem(self.vrcft_spacer)
@@ -272,6 +279,7 @@ class Ui_MainWindow(object):
         self.vrcft_zone_lbl.setText(QCoreApplication.translate("MainWindow", u"VRCFT", None))
         self.vrcft_pps_lbl.setText(QCoreApplication.translate("MainWindow", u"PPS: 0.0", None))
         self.vrcft_status_lbl.setText(QCoreApplication.translate("MainWindow", u"Status: IP Error", None))
+        self.vrcft_latency_lbl.setText(QCoreApplication.translate("MainWindow", u"Latency: -", None))
         self.open_vrcft_settings_btn.setText(QCoreApplication.translate("MainWindow", u"Settings", None))
     # retranslateUi
 
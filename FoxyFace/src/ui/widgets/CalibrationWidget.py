@@ -8,6 +8,7 @@ from src.config.ConfigUpdateListener import ConfigUpdateListener
 from src.config.schemas.Config import Config
 from src.config.schemas.core.enums.GeneralBlendShapeEnumConfig import GeneralBlendShapeEnumConfig
 from src.config.schemas.core.enums.MixSelectEnumConfig import MixSelectEnumConfig
+from src.pipline.ProcessingPipeline import ProcessingPipeline
 from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
 from src.stream.mediapipe.MediaPipeBlendShapeEnum import MediaPipeBlendShapeEnum
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
@@ -22,11 +23,13 @@ class CalibrationWidget(QWidget):
     __set_neutral_sp: Signal = Signal(float)
     __set_positive_sp: Signal = Signal(float)
 
-    def __init__(self, blend_shape_type: GeneralBlendShapeEnum, config_manager: ConfigManager):
+    def __init__(self, blend_shape_type: GeneralBlendShapeEnum, config_manager: ConfigManager,
+                 processing_pipeline: ProcessingPipeline):
         super().__init__()
 
         self.__blend_shape_type = blend_shape_type
         self.__config_manager = config_manager
+        self.__processing_pipeline = processing_pipeline
 
         self.__ui = Ui_CalibrationSettingsItem()
         self.__ui.setupUi(self)
@@ -162,6 +165,7 @@ class CalibrationWidget(QWidget):
             GeneralBlendShapeEnumConfig.from_original(self.__blend_shape_type), BlendShapeOption())
 
         option.max_pose_negative = self.__ui.negative_sp.value()
+        self.__processing_pipeline.invalidate_calibration()
 
     def __register_change_negative_options(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.processing.calibration.get(
@@ -180,6 +184,7 @@ class CalibrationWidget(QWidget):
             GeneralBlendShapeEnumConfig.from_original(self.__blend_shape_type), BlendShapeOption())
 
         option.neutral_pose = self.__ui.neutral_sp.value()
+        self.__processing_pipeline.invalidate_calibration()
 
     def __register_change_neutral_options(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.processing.calibration.get(
@@ -198,6 +203,7 @@ class CalibrationWidget(QWidget):
             GeneralBlendShapeEnumConfig.from_original(self.__blend_shape_type), BlendShapeOption())
 
         option.max_pose_positive = self.__ui.positive_sp.value()
+        self.__processing_pipeline.invalidate_calibration()
 
     def __register_change_positive_options(self) -> ConfigUpdateListener:
         watch_array: list[Callable[[Config], Any]] = [lambda config: config.processing.calibration.get(
@@ -112,7 +112,7 @@ class CalibrationWindow(FoxyWindow):
 
     def __set_default_values(self):
         for enu in _head_global:
-            calibration_widget = CalibrationWidget(enu, self.__config_manager)
+            calibration_widget = CalibrationWidget(enu, self.__config_manager, self.__processing_pipeline)
 
             self.__ui.head_global_container.addWidget(calibration_widget)
             self.__calibration_widgets[enu] = calibration_widget
@@ -121,7 +121,7 @@ class CalibrationWindow(FoxyWindow):
 
         _head_upper.sort(key=lambda element: element.name)
         for enu in _head_upper:
-            calibration_widget = CalibrationWidget(enu, self.__config_manager)
+            calibration_widget = CalibrationWidget(enu, self.__config_manager, self.__processing_pipeline)
 
             self.__ui.head_upper_container.addWidget(calibration_widget)
             self.__calibration_widgets[enu] = calibration_widget
@@ -130,7 +130,7 @@ class CalibrationWindow(FoxyWindow):
 
         _head_bottom.sort(key=lambda element: element.name)
         for enu in _head_bottom:
-            calibration_widget = CalibrationWidget(enu, self.__config_manager)
+            calibration_widget = CalibrationWidget(enu, self.__config_manager, self.__processing_pipeline)
 
             self.__ui.head_bottom_container.addWidget(calibration_widget)
             self.__calibration_widgets[enu] = calibration_widget
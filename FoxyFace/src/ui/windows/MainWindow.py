@@ -8,6 +8,7 @@ from packaging.version import Version
 
 from AppConstants import AppConstants
 from src.autorun.SteamAutoRun import SteamAutoRun
+from src.metrics.LatencyMetricSnapshot import LatencyMetricSnapshot
 from src.config.ConfigManager import ConfigManager
 from src.pipline.BabblePipeline import BabblePipeline
 from src.pipline.CameraPipeline import CameraPipeline
@@ -19,6 +20,7 @@ from src.stream.camera.CameraStream import CameraStream
 from src.stream.camera.CameraEnumerator import CameraEnumerator
 from src.stream.core.StreamWriteOnly import StreamWriteOnly
 from src.stream.core.components.WriteCpsCounter import WriteCpsCounter
+from src.stream.trace.FrameTraceCollector import FrameTraceCollector
 from src.pipline.calibration.AutoCalibrationEndpoint import AutoCalibrationEndpoint
 from src.ui import UiImageUtil
 from src.ui.FoxyWindow import FoxyWindow
@@ -40,8 +42,12 @@ class MainWindow(FoxyWindow):
     mediapipe_latency_signal = Signal(str)
     babble_fps_signal = Signal(str)
     babble_latency_signal = Signal(str)
+    mediapipe_latency_tooltip_signal = Signal(str)
+    babble_latency_tooltip_signal = Signal(str)
     udp_pps_signal = Signal(str)
     udp_status_signal = Signal(str)
+    udp_latency_signal = Signal(str)
+    udp_latency_tooltip_signal = Signal(str)
     has_update_signal = Signal(object)
     camera_list_ready_signal = Signal()
 
@@ -136,6 +142,17 @@ class MainWindow(FoxyWindow):
                 f"Latency: {self.__babble_pipeline.get_latency() * 1000.0:.0f} ms"
             )
 
+            self.mediapipe_latency_tooltip_signal.emit(
+                MainWindow.__format_latency_tooltip(
+                    self.__media_pipe_pipeline.get_latency_metric().snapshot()
+                )
+            )
+            self.babble_latency_tooltip_signal.emit(
+                MainWindow.__format_latency_tooltip(
+                    self.__babble_pipeline.get_latency_metric().snapshot()
+                )
+            )
+
             self.udp_pps_signal.emit(f"PPS: {self.__udp_pipeline.get_pps():.1f}")
             self.udp_status_signal.emit(
                 "Status: {}".format(
@@ -143,6 +160,20 @@ class MainWindow(FoxyWindow):
                 )
             )
 
+            trace_report = self.__udp_pipeline.get_trace_report()
+            total_latency = trace_report.get(FrameTraceCollector.TOTAL_STAGE)
+            self.udp_latency_signal.emit(
+                "Latency: {}".format(
+                    "-" if total_latency is None else f"{total_latency.p50_ms:.0f} ms"
+                )
+            )
+            self.udp_latency_tooltip_signal.emit(
+                "\n".join(
+                    f"{stage}: p50 {value.p50_ms:.1f} ms, p95 {value.p95_ms:.1f} ms"
+                    for stage, value in trace_report.items()
+                )
+            )
+
             model = self.__babble_pipeline.get_model_loader().model
             if model is None or model.is_default_model:
                 warning_icon = UiImageUtil.get_warning_icon()
@@ -153,14 +184,27 @@ class MainWindow(FoxyWindow):
         except Exception:
             _logger.warning("Failed to update thread", exc_info=True, stack_info=True)
 
+    @staticmethod
+    def __format_latency_tooltip(snapshot: LatencyMetricSnapshot) -> str:
+        window = snapshot.window
+
+        return (
+            f"p50: {window.p50_ms:.1f} ms\np95: {window.p95_ms:.1f} ms\n"
+            f"p99: {window.p99_ms:.1f} ms\nmax: {window.max_ms:.1f} ms"
+        )
+
     def __register_signals(self):
         self.camera_fps_signal.connect(self.__ui.camera_fps_lbl.setText)
         self.mediapipe_fps_signal.connect(self.__ui.mediapipe_fps_lbl.setText)
         self.mediapipe_latency_signal.connect(self.__ui.mediapipe_latency_lbl.setText)
         self.babble_fps_signal.connect(self.__ui.babble_fps_lbl.setText)
         self.babble_latency_signal.connect(self.__ui.babble_latency_lbl.setText)
+        self.mediapipe_latency_tooltip_signal.connect(self.__ui.mediapipe_latency_lbl.setToolTip)
+        self.babble_latency_tooltip_signal.connect(self.__ui.babble_latency_lbl.setToolTip)
         self.udp_pps_signal.connect(self.__ui.vrcft_pps_lbl.setText)
         self.udp_status_signal.connect(self.__ui.vrcft_status_lbl.setText)
+        self.udp_latency_signal.connect(self.__ui.vrcft_latency_lbl.setText)
+        self.udp_latency_tooltip_signal.connect(self.__ui.vrcft_latency_lbl.setToolTip)
         self.has_update_signal.connect(self.__has_update)
         self.camera_list_ready_signal.connect(self.__on_camera_list_ready)
 
@@ -172,8 +216,14 @@ class MainWindow(FoxyWindow):
         )
         self.babble_fps_signal.disconnect(self.__ui.babble_fps_lbl.setText)
         self.babble_latency_signal.disconnect(self.__ui.babble_latency_lbl.setText)
+        self.mediapipe_latency_tooltip_signal.disconnect(
+            self.__ui.mediapipe_latency_lbl.setToolTip
+        )
+        self.babble_latency_tooltip_signal.disconnect(self.__ui.babble_latency_lbl.setToolTip)
         self.udp_pps_signal.disconnect(self.__ui.vrcft_pps_lbl.setText)
         self.udp_status_signal.disconnect(self.__ui.vrcft_status_lbl.setText)
+        self.udp_latency_signal.disconnect(self.__ui.vrcft_latency_lbl.setText)
+        self.udp_latency_tooltip_signal.disconnect(self.__ui.vrcft_latency_lbl.setToolTip)
         self.has_update_signal.disconnect(self.__has_update)
 
     def __register_events(self):
@@ -0,0 +1,224 @@
+"""
+Headless end-to-end benchmark of CameraPipeline -> MediaPipePipeline -> BabblePipeline -> ProcessingPipeline ->
+UdpPipeline driven by a recorded clip.
+
+Run from the FoxyFace directory:
+    python -m tests.benchmark.PipelineBenchmark --source clip.mp4 --duration 30 --output result.json
+
+The source is a video file or a directory/glob of PNG/JPEG images. Without --source a synthetic source is used, it
+doesn't contain a face, so only the camera and MediaPipe stages produce frames. The packets are sent to a local UDP
+socket of the benchmark, the settings of the user are not read or changed.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import socket
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from threading import Event, Thread
+
+from AppConstants import AppConstants
+from src.FreeThreadingCheck import FreeThreadingCheck
+from src.config.ConfigManager import ConfigManager
+from src.config.schemas.core.enums.FramePacingEnumConfig import FramePacingEnumConfig
+from src.config.schemas.core.enums.FrameSourceEnumConfig import FrameSourceEnumConfig
+from src.pipline.BabblePipeline import BabblePipeline
+from src.pipline.CameraPipeline import CameraPipeline
+from src.pipline.MediaPipePipeline import MediaPipePipeline
+from src.pipline.ProcessingPipeline import ProcessingPipeline
+from src.pipline.UdpPipeline import UdpPipeline
+from tests.benchmark.StageProbe import StageProbe
+from tests.benchmark.ThreadCpuSampler import ThreadCpuSampler
+
+_logger = logging.getLogger(__name__)
+
+
+class _UdpProbePipeline:
+    """
+    Gives UdpPipeline the stream of the processing pipeline wrapped in a probe, the probe sees every frame right
+    before it is encoded and sent.
+    """
+
+    def __init__(self, processing_pipeline: ProcessingPipeline):
+        self.probe: StageProbe = StageProbe(processing_pipeline.get_udp_stream())
+
+    def get_udp_stream(self) -> StageProbe:
+        return self.probe
+
+
+class _UdpReceiver:
+    def __init__(self):
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.__socket.bind(("127.0.0.1", 0))
+        self.__socket.settimeout(0.1)
+
+        self.packet_count: int = 0
+        self.byte_count: int = 0
+
+        self.__close_event = Event()
+        self.__thread = Thread(target=self.__loop, daemon=True, name="Benchmark UDP Receiver")
+        self.__thread.start()
+
+    @property
+    def port(self) -> int:
+        return self.__socket.getsockname()[1]
+
+    def reset(self) -> None:
+        self.packet_count = 0
+        self.byte_count = 0
+
+    def close(self) -> None:
+        self.__close_event.set()
+        self.__thread.join()
+        self.__socket.close()
+
+    def __loop(self):
+        while not self.__close_event.is_set():
+            try:
+                data = self.__socket.recv(65536)
+            except TimeoutError:
+                continue
+
+            self.packet_count += 1
+            self.byte_count += len(data)
+
+
+def _configure(config_manager: ConfigManager, args: argparse.Namespace, udp_port: int) -> None:
+    config = config_manager.config
+
+    if args.source is None:
+        config.camera.source = FrameSourceEnumConfig.Synthetic
+    elif Path(args.source).is_file():
+        config.camera.source = FrameSourceEnumConfig.VideoFile
+    else:
+        config.camera.source = FrameSourceEnumConfig.ImageSequence
+
+    config.camera.source_path = args.source or ""
+    config.camera.source_fps = args.fps
+    config.camera.source_pacing = FramePacingEnumConfig.AsFastAsPossible if args.fast else FramePacingEnumConfig.RealTime
+    config.camera.source_loop = True
+
+    config.babble.enabled = not args.disable_babble
+    config.babble.use_worker_process = args.babble_worker_process
+
+    config.socket.auto_connect = False
+    config.socket.ip = "127.0.0.1"
+    config.socket.port = udp_port
+
+
+def run(args: argparse.Namespace) -> dict:
+    if args.trace_allocations:
+        tracemalloc.start()
+
+    receiver = _UdpReceiver()
+
+    with tempfile.TemporaryDirectory() as config_directory:
+        config_manager = ConfigManager(Path(config_directory) / "config.json")
+        _configure(config_manager, args, receiver.port)
+
+        camera_pipeline = CameraPipeline(config_manager)
+        media_pipe_pipeline = MediaPipePipeline(config_manager, camera_pipeline)
+        babble_pipeline = BabblePipeline(config_manager, media_pipe_pipeline)
+        processing_pipeline = ProcessingPipeline(config_manager, media_pipe_pipeline, babble_pipeline)
+
+        udp_probe_pipeline = _UdpProbePipeline(processing_pipeline)
+        # noinspection PyTypeChecker
+        udp_pipeline = UdpPipeline(config_manager, udp_probe_pipeline)
+
+        probes = {"camera": StageProbe(), "mediapipe": StageProbe(), "babble": StageProbe(),
+                  "udp": udp_probe_pipeline.probe}
+        camera_pipeline.register_stream(probes["camera"])
+        media_pipe_pipeline.register_stream(probes["mediapipe"])
+        babble_pipeline.register_stream(probes["babble"])
+
+        cpu_sampler = ThreadCpuSampler()
+
+        try:
+            time.sleep(args.warmup)
+
+            for probe in probes.values():
+                probe.reset()
+            receiver.reset()
+            cpu_sampler.reset()
+            gc.collect()
+            start_blocks = sys.getallocatedblocks()
+            if args.trace_allocations:
+                tracemalloc.reset_peak()
+
+            time.sleep(args.duration)
+
+            end_blocks = sys.getallocatedblocks()
+            stages = {name: probe.get_report() for name, probe in probes.items()}
+            threads = cpu_sampler.get_report()
+            traced_peak = tracemalloc.get_traced_memory()[1] if args.trace_allocations else None
+            udp_packets = receiver.packet_count
+            udp_bytes = receiver.byte_count
+        finally:
+            camera_pipeline.unregister_stream(probes["camera"])
+            media_pipe_pipeline.unregister_stream(probes["mediapipe"])
+            babble_pipeline.unregister_stream(probes["babble"])
+
+            udp_pipeline.close()
+            processing_pipeline.close()
+            babble_pipeline.close()
+            media_pipe_pipeline.close()
+            camera_pipeline.close()
+            config_manager.close()
+            receiver.close()
+
+    camera_frames = stages["camera"]["frames"]
+
+    return {
+        "app_version": str(AppConstants.VERSION),
+        "python": sys.version,
+        "platform": platform.platform(),
+        # Read after the pipelines have started, an extension module can enable the GIL again when it is imported
+        "free_threaded_build": FreeThreadingCheck.is_free_threaded_build(),
+        "gil_enabled": FreeThreadingCheck.is_gil_enabled(),
+        "source": args.source,
+        "pacing": "AsFastAsPossible" if args.fast else "RealTime",
+        "warmup_s": args.warmup,
+        "duration_s": args.duration,
+        "stages": stages,
+        "udp": {"packets": udp_packets, "bytes": udp_bytes,
+                "bytes_per_packet": udp_bytes / udp_packets if udp_packets > 0 else None},
+        # Net growth of the live Python memory blocks, CPython can't count allocations themselves
+        "allocations": {"net_blocks_per_camera_frame": (end_blocks - start_blocks) / camera_frames
+                        if camera_frames > 0 else None,
+                        "traced_peak_bytes": traced_peak},
+        "threads": threads
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FoxyFace pipeline benchmark")
+    parser.add_argument("--source", help="Video file, or a directory or glob of PNG/JPEG images")
+    parser.add_argument("--fps", type=float, default=30.0, help="Frame rate of image sequences and synthetic frames")
+    parser.add_argument("--fast", action="store_true", help="Read the source as fast as possible")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Seconds excluded from the results")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument("--disable-babble", action="store_true")
+    parser.add_argument("--babble-worker-process", action="store_true",
+                        help="Run the Babble model in a worker process")
+    parser.add_argument("--trace-allocations", action="store_true", help="Report the tracemalloc peak, slow")
+    parser.add_argument("--output", help="JSON file, stdout if not set")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    result = json.dumps(run(args), indent=2)
+
+    if args.output:
+        Path(args.output).write_text(result, encoding="utf-8")
+    else:
+        print(result)
+
+
+if __name__ == '__main__':
+    main()
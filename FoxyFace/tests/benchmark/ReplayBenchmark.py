@@ -0,0 +1,150 @@
+"""
+Replays a recorded session through the post-processing chain
+OneEuroFilter -> MixerProcessing -> CalibrateProcessing -> ValidateGeneralBlendShapes -> BlendShapeTimedBuffer
+as fast as possible. Every replayed frame is processed before the next one, so the output only depends on the
+recording and the config (up to the rounding of the replay timestamps), e.g. to compare mincutoff and beta values
+without a camera.
+
+Record a session with recording.record_enabled in config.json, then run from the FoxyFace directory:
+    python -m tests.benchmark.ReplayBenchmark recordings/2025-01-01_12-00-00 --config config.json --values out.csv
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy
+
+from AppConstants import AppConstants
+from src.config.schemas.Config import Config
+from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+from src.stream.core.StreamReadOnly import StreamReadOnly
+from src.stream.core.StreamWriteOnly import StreamWriteOnly
+from src.stream.core.components.EventBufferStream import EventBufferStream
+from src.stream.mediapipe.MediaPipeBlendShapeEnum import MediaPipeBlendShapeEnum
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.BlendShapeTimedBuffer import BlendShapeTimedBuffer
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
+from src.stream.postprocessing.ValidateGeneralBlendShapes import ValidateGeneralBlendShapes
+from src.stream.postprocessing.calibration.CalibrateProcessing import CalibrateProcessing
+from src.stream.postprocessing.calibration.CalibrateProcessingOptions import CalibrateProcessingOptions
+from src.stream.postprocessing.filter.BlendShapesOneEuroFilter import BlendShapesOneEuroFilter
+from src.stream.postprocessing.filter.BlendShapesOneEuroFilterOptions import BlendShapesOneEuroFilterOptions
+from src.stream.postprocessing.mixer.MixerProcessing import MixerProcessing
+from src.stream.postprocessing.mixer.MixerProcessingOptions import MixerProcessingOptions
+from src.stream.recording.SessionReader import SessionReader
+from src.stream.recording.SessionReplay import SessionReplay
+from src.stream.recording.SessionTrackEnum import SessionTrackEnum
+
+
+class _LockstepStream(StreamWriteOnly[DenseBlendShapesFrame]):
+    """
+    Runs the chain for every replayed frame in the replay thread.
+    """
+
+    def __init__(self, stream: StreamWriteOnly[DenseBlendShapesFrame],
+                 output: StreamReadOnly[DenseBlendShapesFrame[GeneralBlendShapeEnum]],
+                 results: list[DenseBlendShapesFrame[GeneralBlendShapeEnum]]):
+        self.__stream = stream
+        self.__output = output
+        self.__results = results
+
+    def put(self, value: DenseBlendShapesFrame) -> bool:
+        self.__stream.put(value)
+        self.__results.append(self.__output.poll(1.0))
+
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+def run(args: argparse.Namespace) -> tuple[dict, list[DenseBlendShapesFrame[GeneralBlendShapeEnum]]]:
+    config = Config.from_json(Path(args.config).read_text(encoding="utf-8")) if args.config else Config()
+
+    buffer = EventBufferStream[DenseBlendShapesFrame](16)
+
+    media_pipe_filter = BlendShapesOneEuroFilter[MediaPipeBlendShapeEnum](
+        buffer, BlendShapesOneEuroFilterOptions(config.media_pipe.enable_filter, config.media_pipe.mincutoff,
+                                                config.media_pipe.beta, config.media_pipe.dcutoff))
+    babble_filter = BlendShapesOneEuroFilter[BabbleBlendShapeEnum](
+        buffer, BlendShapesOneEuroFilterOptions(True, config.babble.mincutoff, config.babble.beta,
+                                                config.babble.dcutoff))
+
+    mixer_options = MixerProcessingOptions({key.to_original(): value.to_original() for key, value in
+                                            config.processing.source.items()})
+    calibration_options = CalibrateProcessingOptions({key.to_original(): value for key, value in
+                                                      config.processing.calibration.items()})
+
+    stream = CalibrateProcessing(MixerProcessing(buffer, mixer_options), calibration_options)
+    output = BlendShapeTimedBuffer(ValidateGeneralBlendShapes(stream), ttl=1.0)
+
+    results: list[DenseBlendShapesFrame[GeneralBlendShapeEnum]] = []
+
+    session = SessionReader(Path(args.session))
+    streams = {SessionTrackEnum.MediaPipe.value: (BlendShapeSlots.of(MediaPipeBlendShapeEnum),
+                                                  _LockstepStream(media_pipe_filter, output, results)),
+               SessionTrackEnum.Babble.value: (BlendShapeSlots.of(BabbleBlendShapeEnum),
+                                               _LockstepStream(babble_filter, output, results))}
+
+    start_time = time.perf_counter()
+
+    with SessionReplay(session, streams, FramePacingEnum.AsFastAsPossible) as replay:
+        replay.wait()
+        frame_count = replay.frame_count
+
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "app_version": str(AppConstants.VERSION),
+        "python": sys.version,
+        "session": str(session.path),
+        "tracks": {name: len(track) for name, track in session.tracks.items()},
+        "frames": frame_count,
+        "elapsed_ms": elapsed * 1000.0,
+        "frames_per_second": frame_count / elapsed if elapsed > 0.0 else 0.0
+    }, results
+
+
+def _write_values(path: Path, results: list[DenseBlendShapesFrame[GeneralBlendShapeEnum]]) -> None:
+    members = BlendShapeSlots.of(GeneralBlendShapeEnum).members
+
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["frame"] + [member.name for member in members])
+
+        for index, frame in enumerate(results):
+            writer.writerow([index] + numpy.where(frame.mask, frame.values, numpy.nan).tolist())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FoxyFace session replay benchmark")
+    parser.add_argument("session", help="Session directory written by the recorder")
+    parser.add_argument("--config", help="config.json with the filter, mixer and calibration options")
+    parser.add_argument("--values", help="CSV file for the processed values of every frame")
+    parser.add_argument("--output", help="JSON file, stdout if not set")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    report, results = run(args)
+
+    if args.values:
+        _write_values(Path(args.values), results)
+
+    result = json.dumps(report, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(result, encoding="utf-8")
+    else:
+        print(result)
+
+
+if __name__ == '__main__':
+    main()
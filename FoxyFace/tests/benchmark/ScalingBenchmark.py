@@ -0,0 +1,148 @@
+"""
+Per-core scaling of the whole stage graph. Runs PipelineBenchmark (CameraPipeline -> MediaPipePipeline ->
+BabblePipeline -> ProcessingPipeline -> UdpPipeline) with the source read as fast as possible in a child process
+pinned to 1, 2, 4, ... cores, with the GIL and, on a free-threaded build, with -X gil=0. The parallelism comes from
+the stage threads, so the end-to-end FPS can grow only until the slowest stage saturates its core.
+
+Run from the FoxyFace directory with a clip that contains a face, without a face only the camera stage produces
+frames and the end-to-end FPS is 0:
+    python -m tests.benchmark.ScalingBenchmark --source clip.mp4 --duration 10 --output result.json
+    python3.13t -m tests.benchmark.ScalingBenchmark --source clip.mp4  # also measures -X gil=0
+
+The cores are pinned with os.sched_setaffinity, on other platforms only all cores are measured.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from AppConstants import AppConstants
+from src.FreeThreadingCheck import FreeThreadingCheck
+
+_logger = logging.getLogger(__name__)
+
+# Stage of the threads by name, the threads without a Python name are MediaPipe, ONNX Runtime and OpenCV workers
+_stage_threads: dict[str, str] = {"Camera Stream": "camera", "MediaPipe Thread": "mediapipe",
+                                  "Babble Thread": "babble", "Babble Worker": "babble",
+                                  "VRCFT UDP Socket": "processing_udp", "native": "native"}
+
+
+def _get_core_counts(max_cores: int | None) -> list[int]:
+    if not hasattr(os, "sched_setaffinity"):
+        return [os.cpu_count() or 1]
+
+    available = len(os.sched_getaffinity(0))
+    if max_cores is not None:
+        available = min(available, max_cores)
+
+    core_counts = []
+    core_count = 1
+    while core_count < available:
+        core_counts.append(core_count)
+        core_count *= 2
+
+    core_counts.append(available)
+
+    return core_counts
+
+
+def _get_stage_cpu(threads: list[dict] | None) -> dict[str, float] | None:
+    if threads is None:
+        return None
+
+    stage_cpu: dict[str, float] = {}
+    for thread in threads:
+        stage = _stage_threads.get(thread["name"], "other")
+        stage_cpu[stage] = stage_cpu.get(stage, 0.0) + thread["cpu_percent"]
+
+    return stage_cpu
+
+
+def _run_pipeline(args: argparse.Namespace, gil: int, core_count: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        output = Path(directory) / "result.json"
+
+        command = [sys.executable, "-X", f"gil={gil}", "-m", "tests.benchmark.PipelineBenchmark", "--fast",
+                   "--fps", str(args.fps), "--warmup", str(args.warmup), "--duration", str(args.duration),
+                   "--output", str(output)]
+        if args.source:
+            command += ["--source", args.source]
+        if args.disable_babble:
+            command.append("--disable-babble")
+
+        cores = sorted(os.sched_getaffinity(0))[:core_count] if hasattr(os, "sched_setaffinity") else None
+
+        # Pinned before the interpreter starts, every thread of the child inherits the affinity
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       preexec_fn=None if cores is None else lambda: os.sched_setaffinity(0, cores))
+
+        result = json.loads(output.read_text(encoding="utf-8"))
+
+    return {"gil": gil, "cores": core_count, "gil_enabled": result["gil_enabled"],
+            "end_to_end_fps": result["stages"]["udp"]["fps"],
+            "stage_fps": {name: stage["fps"] for name, stage in result["stages"].items()},
+            "udp_latency_ms": result["stages"]["udp"]["latency_ms"],
+            "stage_cpu_percent": _get_stage_cpu(result["threads"])}
+
+
+def run(args: argparse.Namespace) -> dict:
+    # -X gil=0 is a fatal error on a build with the GIL
+    gil_modes = [1, 0] if FreeThreadingCheck.is_free_threaded_build() else [1]
+
+    results = []
+    for gil in gil_modes:
+        single_core_fps = None
+
+        for core_count in _get_core_counts(args.max_cores):
+            _logger.info(f"Measuring gil={gil} on {core_count} cores")
+
+            result = _run_pipeline(args, gil, core_count)
+
+            if single_core_fps is None:
+                single_core_fps = result["end_to_end_fps"]
+
+            result["speedup"] = result["end_to_end_fps"] / single_core_fps if single_core_fps > 0.0 else None
+            results.append(result)
+
+    return {
+        "app_version": str(AppConstants.VERSION),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "free_threaded_build": FreeThreadingCheck.is_free_threaded_build(),
+        "source": args.source,
+        "duration_s": args.duration,
+        "results": results
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FoxyFace per-core scaling benchmark of the pipeline")
+    parser.add_argument("--source", help="Video file, or a directory or glob of PNG/JPEG images, with a face")
+    parser.add_argument("--fps", type=float, default=30.0, help="Frame rate of image sequences and synthetic frames")
+    parser.add_argument("--max-cores", type=int, help="Largest core count, all available cores if not set")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Seconds excluded from every run")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds of every run")
+    parser.add_argument("--disable-babble", action="store_true")
+    parser.add_argument("--output", help="JSON file, stdout if not set")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    _logger.setLevel(logging.INFO)
+
+    result = json.dumps(run(args), indent=2)
+
+    if args.output:
+        Path(args.output).write_text(result, encoding="utf-8")
+    else:
+        print(result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import time
+from threading import Lock
+
+import numpy
+
+from src.stream.camera.CameraFrame import CameraFrame
+from src.stream.core.StreamReadOnly import StreamReadOnly
+from src.stream.core.StreamWriteOnly import StreamWriteOnly
+from src.stream.mediapipe.core.MediaPipeFrame import MediaPipeFrame
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+
+
+class StageProbe(StreamWriteOnly):
+    """
+    Counts the frames of a pipeline stage and records their latency from the camera timestamp. Can be registered
+    as a write stream or wrap a read stream.
+    """
+
+    def __init__(self, stream: StreamReadOnly | None = None):
+        self.__stream: StreamReadOnly | None = stream
+        self.__lock: Lock = Lock()
+
+        self.__start_time_ns: int = time.perf_counter_ns()
+        self.__latencies_ns: list[int] = []
+
+    def put(self, value) -> bool:
+        self.__record(value)
+
+        return True
+
+    def close(self) -> None:
+        pass
+
+    def poll(self, timeout: float | None = None):
+        value = self.__stream.poll(timeout)
+
+        self.__record(value)
+
+        return value
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__start_time_ns = time.perf_counter_ns()
+            self.__latencies_ns = []
+
+    def get_report(self) -> dict[str, float | int | dict[str, float] | None]:
+        with self.__lock:
+            duration = (time.perf_counter_ns() - self.__start_time_ns) / 1_000_000_000
+            latencies_ms = numpy.array(self.__latencies_ns, dtype=numpy.float64) / 1_000_000
+
+        if len(latencies_ms) == 0:
+            latency = None
+        else:
+            p50, p95, p99 = numpy.percentile(latencies_ms, (50, 95, 99)).tolist()
+            latency = {"mean": float(latencies_ms.mean()), "p50": p50, "p95": p95, "p99": p99,
+                       "max": float(latencies_ms.max())}
+
+        return {"frames": len(latencies_ms), "fps": len(latencies_ms) / duration if duration > 0.0 else 0.0,
+                "latency_ms": latency}
+
+    def __record(self, value) -> None:
+        current_time = time.perf_counter_ns()
+
+        if isinstance(value, CameraFrame):
+            timestamp = value.timestamp_ns
+        elif isinstance(value, MediaPipeFrame):
+            timestamp = value.camera_frame.timestamp_ns
+        elif isinstance(value, DenseBlendShapesFrame):
+            timestamp = value.timestamp_ns
+        else:
+            timestamp = current_time
+
+        with self.__lock:
+            self.__latencies_ns.append(current_time - timestamp)
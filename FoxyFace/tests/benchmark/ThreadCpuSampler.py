@@ -0,0 +1,66 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class ThreadCpuSampler:
+    """
+    CPU time of every thread of this process, uses psutil if it is installed and /proc on Linux otherwise.
+    """
+
+    def __init__(self):
+        self.__start_time_ns: int = time.perf_counter_ns()
+        self.__start_cpu: dict[int, float] = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        return psutil is not None or Path("/proc/self/task").is_dir()
+
+    def reset(self) -> None:
+        self.__start_time_ns = time.perf_counter_ns()
+        self.__start_cpu = ThreadCpuSampler.__read_cpu_times()
+
+    def get_report(self) -> list[dict[str, str | int | float]] | None:
+        if not ThreadCpuSampler.is_supported():
+            return None
+
+        duration = (time.perf_counter_ns() - self.__start_time_ns) / 1_000_000_000
+        names = {thread.native_id: thread.name for thread in threading.enumerate()}
+
+        report = []
+        for thread_id, cpu_time in ThreadCpuSampler.__read_cpu_times().items():
+            used = cpu_time - self.__start_cpu.get(thread_id, 0.0)
+            report.append({"id": thread_id, "name": names.get(thread_id, "native"), "cpu_s": used,
+                           "cpu_percent": used * 100.0 / duration if duration > 0.0 else 0.0})
+
+        report.sort(key=lambda thread: thread["cpu_s"], reverse=True)
+
+        return report
+
+    @staticmethod
+    def __read_cpu_times() -> dict[int, float]:
+        if psutil is not None:
+            return {thread.id: thread.user_time + thread.system_time for thread in psutil.Process().threads()}
+
+        task_directory = Path("/proc/self/task")
+        if not task_directory.is_dir():
+            return {}
+
+        ticks = os.sysconf("SC_CLK_TCK")
+
+        cpu_times = {}
+        for task in task_directory.iterdir():
+            try:
+                # The name in the second field may contain spaces, the fields after it are fixed
+                fields = (task / "stat").read_text().rsplit(")", 1)[1].split()
+                cpu_times[int(task.name)] = (int(fields[11]) + int(fields[12])) / ticks
+            except (OSError, IndexError, ValueError):
+                continue
+
+        return cpu_times
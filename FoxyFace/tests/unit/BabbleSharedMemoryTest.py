@@ -0,0 +1,28 @@
+import unittest
+
+import numpy
+
+from src.stream.babble.process.BabbleSharedMemory import BabbleSharedMemory
+
+
+class BabbleSharedMemoryTest(unittest.TestCase):
+    def test_attached_views_share_data(self):
+        owner = BabbleSharedMemory(2, 6, 4)
+        attached = BabbleSharedMemory(2, 6, 4, owner.name)
+
+        try:
+            self.assertEqual(owner.images.shape, (2, 4, 6))
+
+            owner.images[1] = 7
+            attached.outputs[0] = numpy.linspace(0.0, 1.0, attached.outputs.shape[1])
+
+            self.assertTrue((attached.images[1] == 7).all())
+            self.assertFalse(attached.images[0].any())
+            self.assertAlmostEqual(float(owner.outputs[0, -1]), 1.0)
+        finally:
+            attached.close()
+            owner.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
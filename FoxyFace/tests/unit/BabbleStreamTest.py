@@ -0,0 +1,94 @@
+import unittest
+
+import numpy
+from cv2.typing import MatLike
+from numpy import ndarray
+
+from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
+from src.stream.babble.BabbleModelLoader import BabbleModelLoader
+from src.stream.babble.BabbleStream import BabbleStream
+from src.stream.babble.BabbleStreamOptions import BabbleStreamOptions
+from src.stream.babble.imageprocessing.BabbleImageFrame import BabbleImageFrame
+from src.stream.core.components.EventBufferStream import EventBufferStream
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+
+
+class _FixedModelLoader(BabbleModelLoader):
+    """
+    Returns rows filled with the first pixel of the image divided by 100, or None like a model that isn't loaded.
+    """
+
+    def __init__(self, loaded: bool = True):
+        super().__init__()
+
+        self.loaded: bool = loaded
+        self.batch_sizes: list[int] = []
+
+    def process_gray_images(self, images: list[MatLike]) -> ndarray | None:
+        self.batch_sizes.append(len(images))
+
+        if not self.loaded:
+            return None
+
+        return numpy.array([numpy.full(len(BabbleBlendShapeEnum), image[0, 0] / 100.0) for image in images])
+
+
+class BabbleStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.__images = EventBufferStream[BabbleImageFrame](16)
+        self.__output = EventBufferStream[DenseBlendShapesFrame[BabbleBlendShapeEnum]](16)
+
+    def __put_frames(self, frame_count: int) -> list[int]:
+        timestamps = [1_000_000 + index * 16_000_000 for index in range(frame_count)]
+
+        for index, timestamp in enumerate(timestamps):
+            self.__images.put(BabbleImageFrame(numpy.full((1, 1), index, dtype=numpy.uint8), timestamp))
+
+        return timestamps
+
+    def test_batch(self):
+        model = _FixedModelLoader()
+
+        with BabbleStream(self.__images, 0.1, model, BabbleStreamOptions(4, 0.2)) as stream:
+            stream.register_stream(self.__output)
+
+            timestamps = self.__put_frames(5)
+
+            results = [self.__output.poll(2.0) for _ in range(5)]
+
+        # The last frame waits for the time budget and is flushed as a partial batch
+        self.assertEqual(model.batch_sizes, [4, 1])
+
+        self.assertEqual([result.timestamp_ns for result in results], timestamps)
+        self.assertEqual([result.get(BabbleBlendShapeEnum.JawOpen) for result in results],
+                         [0.0, 0.01, 0.02, 0.03, 0.04])
+
+    def test_partial_batch(self):
+        model = _FixedModelLoader()
+
+        with BabbleStream(self.__images, 0.1, model, BabbleStreamOptions(8, 0.05)) as stream:
+            stream.register_stream(self.__output)
+
+            timestamps = self.__put_frames(2)
+
+            results = [self.__output.poll(2.0) for _ in range(2)]
+
+        self.assertEqual(model.batch_sizes, [2])
+        self.assertEqual([result.timestamp_ns for result in results], timestamps)
+
+    def test_model_not_loaded(self):
+        model = _FixedModelLoader(False)
+
+        with BabbleStream(self.__images, 0.1, model, BabbleStreamOptions(4, 0.05)) as stream:
+            stream.register_stream(self.__output)
+
+            self.__put_frames(3)
+
+            with self.assertRaises(TimeoutError):
+                self.__output.poll(0.3)
+
+        self.assertEqual(model.batch_sizes, [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
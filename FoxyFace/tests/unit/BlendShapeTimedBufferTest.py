@@ -0,0 +1,60 @@
+import time
+import unittest
+
+import numpy
+
+from src.stream.core.components.EventBufferStream import EventBufferStream
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.BlendShapeTimedBuffer import BlendShapeTimedBuffer
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
+
+_slots = BlendShapeSlots.of(GeneralBlendShapeEnum)
+
+
+class BlendShapeTimedBufferTest(unittest.TestCase):
+    @staticmethod
+    def __frame(values: dict[int, float], timestamp_ns: int) -> DenseBlendShapesFrame[GeneralBlendShapeEnum]:
+        frame = DenseBlendShapesFrame.empty(_slots, timestamp_ns)
+
+        for index, value in values.items():
+            frame.values[index] = value
+            frame.mask[index] = True
+
+        return frame
+
+    def test_hold_and_expire(self):
+        stream = EventBufferStream[DenseBlendShapesFrame[GeneralBlendShapeEnum]](16)
+        buffer = BlendShapeTimedBuffer(stream, ttl=1.0)
+
+        self.assertIsNone(buffer.get_freshness())
+
+        now = time.perf_counter_ns()
+
+        stream.put(self.__frame({0: 0.5, 1: 0.25}, now - 2_000_000_000))  # Already expired
+        stream.put(self.__frame({2: 0.75}, now))
+        stream.put(self.__frame({3: 1.0}, now))
+
+        buffer.poll(1.0)
+        freshness = buffer.get_freshness()
+        self.assertEqual(freshness.expired_count, 2)
+        self.assertEqual(freshness.get_expired(), [_slots.members[0], _slots.members[1]])
+
+        buffer.poll(1.0)
+        first = buffer.poll(1.0)
+
+        # The value of slot 2 is held from the previous frame
+        self.assertEqual(first.blend_shapes, {_slots.members[2]: 0.75, _slots.members[3]: 1.0})
+        self.assertEqual(first.timestamps_ns[2], now)
+
+        freshness = buffer.get_freshness()
+        self.assertEqual(freshness.stale_count, 1)
+        self.assertEqual(freshness.get_stale(), [_slots.members[2]])
+        self.assertEqual(freshness.expired_count, 0)
+
+        # The returned frame doesn't change with the next poll
+        stream.put(self.__frame({4: 0.5}, now))
+        buffer.poll(1.0)
+
+        self.assertFalse(first.mask[4])
+        self.assertEqual(numpy.count_nonzero(first.mask), 2)
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy
+
+from src.stream.core.components.BufferStream import BufferStream
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
+from src.stream.postprocessing.calibration.BlendShapeOption import BlendShapeOption
+from src.stream.postprocessing.calibration.CalibrateProcessing import CalibrateProcessing
+from src.stream.postprocessing.calibration.CalibrateProcessingOptions import CalibrateProcessingOptions
+
+
+class CalibrateProcessingTest(unittest.TestCase):
+    def test_same_as_interp(self):
+        slots = BlendShapeSlots.of(GeneralBlendShapeEnum)
+        options = CalibrateProcessingOptions(
+            {GeneralBlendShapeEnum.JawOpen: BlendShapeOption(0.1, -1.0, 0.6),
+             GeneralBlendShapeEnum.HeadX: BlendShapeOption(0.45, 0.2, 0.7),
+             GeneralBlendShapeEnum.HeadYaw: BlendShapeOption(0.3, 0.0, 0.5)})
+
+        for value in numpy.linspace(-1.5, 1.5, 61):
+            stream = BufferStream[DenseBlendShapesFrame[GeneralBlendShapeEnum]]()
+            stream.put(DenseBlendShapesFrame.from_values(slots, numpy.full(len(slots), value), None, 0))
+            result = CalibrateProcessing(stream, options).poll(1)
+
+            self.assertAlmostEqual(result.get(GeneralBlendShapeEnum.JawOpen),
+                                   numpy.interp(value, (0.1, 0.6), (0.0, 1.0)))
+            self.assertAlmostEqual(result.get(GeneralBlendShapeEnum.HeadX),
+                                   numpy.interp(value, (0.2, 0.45, 0.7), (-1.0, 0.0, 1.0)))
+            self.assertEqual(result.get(GeneralBlendShapeEnum.HeadYaw), value)  # disable_calibration
+            self.assertEqual(result.get(GeneralBlendShapeEnum.MouthClosed), value)  # no option
+
+    def test_recompile_on_replace(self):
+        options = CalibrateProcessingOptions({GeneralBlendShapeEnum.JawOpen: BlendShapeOption(0.1, -1.0, 0.6)})
+        table = options.get_table()
+
+        self.assertIs(options.get_table(), table)
+
+        options.blend_shape_options = {}
+
+        self.assertIsNot(options.get_table(), table)
+        self.assertFalse(options.get_table().enabled.any())
+
+    def test_recompile_on_change_in_place(self):
+        slots = BlendShapeSlots.of(GeneralBlendShapeEnum)
+        option = BlendShapeOption(0.1, -1.0, 0.6)
+        options = CalibrateProcessingOptions({GeneralBlendShapeEnum.JawOpen: option})
+
+        stream = BufferStream[DenseBlendShapesFrame[GeneralBlendShapeEnum]]()
+        processing = CalibrateProcessing(stream, options)
+
+        stream.put(DenseBlendShapesFrame.from_values(slots, numpy.full(len(slots), 0.35), None, 0))
+        self.assertAlmostEqual(processing.poll(1).get(GeneralBlendShapeEnum.JawOpen), 0.5)
+
+        option.max_pose_positive = 0.35
+        options.invalidate()
+
+        stream.put(DenseBlendShapesFrame.from_values(slots, numpy.full(len(slots), 0.35), None, 0))
+        self.assertAlmostEqual(processing.poll(1).get(GeneralBlendShapeEnum.JawOpen), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import itertools
+import unittest
+
+import numpy
+
+from src.stream.camera.CameraFrame import CameraFrame
+from src.stream.camera.CameraOrientation import CameraOrientation
+from src.stream.camera.CameraProcessing import CameraProcessing
+from src.stream.camera.CameraProcessingOption import CameraProcessingOption
+from src.stream.camera.CameraTransform import CameraTransform
+from src.stream.core.components.BufferStream import BufferStream
+
+
+class CameraOrientationTest(unittest.TestCase):
+    def test_to_source(self):
+        source = numpy.arange(6 * 4, dtype=numpy.uint8).reshape((4, 6))
+
+        for mirror_x, mirror_y, rotate_ninety in itertools.product((False, True), repeat=3):
+            orientation = CameraOrientation(mirror_x, mirror_y, rotate_ninety)
+            oriented = orientation.apply(source)
+
+            for y, x in itertools.product(range(oriented.shape[0]), range(oriented.shape[1])):
+                # Pixel centers
+                source_x, source_y = orientation.to_source((x + 0.5) / oriented.shape[1],
+                                                           (y + 0.5) / oriented.shape[0])
+
+                self.assertEqual(oriented[y, x],
+                                 source[int(source_y * source.shape[0]), int(source_x * source.shape[1])],
+                                 (mirror_x, mirror_y, rotate_ninety, x, y))
+
+    def test_compiled_transform(self):
+        source = numpy.arange(6 * 4 * 3, dtype=numpy.uint8).reshape((4, 6, 3))
+
+        for mirror_x, mirror_y, rotate_ninety in itertools.product((False, True), repeat=3):
+            orientation = CameraOrientation(mirror_x, mirror_y, rotate_ninety)
+            transform = CameraTransform.compile(orientation)
+
+            result = transform.apply(source, numpy.empty(transform.get_shape(source.shape), dtype=numpy.uint8))
+
+            self.assertTrue(numpy.array_equal(result, orientation.apply(source)), (mirror_x, mirror_y, rotate_ninety))
+
+    def test_downscale(self):
+        packet = CameraFrame(numpy.zeros((1080, 1920, 3), dtype=numpy.uint8), 1)
+
+        buffer = BufferStream[CameraFrame]()
+        buffer.put(packet)
+
+        result = CameraProcessing(buffer, CameraProcessingOption(rotate_ninety=True, max_size=640)).poll(1.0)
+
+        self.assertEqual(result.frame.shape, (640, 360, 3))
+        self.assertIs(result.source, packet)
+        self.assertEqual(result.orientation, CameraOrientation(rotate_ninety=True))
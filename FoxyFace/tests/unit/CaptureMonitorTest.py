@@ -0,0 +1,42 @@
+import unittest
+
+import numpy
+
+from src.stream.camera.CaptureMonitor import CaptureMonitor
+
+_INTERVAL_NS = 33_000_000
+
+
+class CaptureMonitorTest(unittest.TestCase):
+    def test_late_and_queued_frames(self):
+        monitor = CaptureMonitor()
+
+        # The grabs wait for the camera most of the interval
+        time_ns = 0
+        for _ in range(10):
+            self.assertFalse(monitor.on_grab(time_ns - 30_000_000, time_ns))
+            time_ns += _INTERVAL_NS
+
+        self.assertEqual(monitor.late.total_count, 0)
+
+        # The loop stalled for three intervals, the next grab returns a frame from the driver queue at once
+        time_ns += 2 * _INTERVAL_NS
+        self.assertTrue(monitor.on_grab(time_ns - 100_000, time_ns))
+        self.assertEqual(monitor.late.total_count, 1)
+
+        self.assertTrue(monitor.is_queued(time_ns, time_ns + 100_000))
+        monitor.on_drained(time_ns + 100_000)
+        self.assertFalse(monitor.is_queued(time_ns + 100_000, time_ns + 30_000_000))
+        monitor.on_drained(time_ns + 30_000_000)
+
+        self.assertEqual(monitor.dropped.total_count, 2)
+
+    def test_duplicated_frames(self):
+        monitor = CaptureMonitor()
+        frame = numpy.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=numpy.uint8)
+
+        monitor.on_retrieve(frame)
+        monitor.on_retrieve(frame.copy())
+        monitor.on_retrieve(255 - frame)
+
+        self.assertEqual(monitor.duplicated.total_count, 1)
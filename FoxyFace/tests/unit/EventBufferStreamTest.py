@@ -0,0 +1,49 @@
+import threading
+import time
+import unittest
+
+from src.stream.core.components.EventBufferStream import EventBufferStream
+
+
+class EventBufferStreamTest(unittest.TestCase):
+    def test_keeps_latest_value(self):
+        stream = EventBufferStream[int]()
+
+        stream.put(1)
+        stream.put(2)
+
+        self.assertEqual(stream.poll(0.1), 2)
+        self.assertRaises(TimeoutError, stream.poll, 0.01)
+
+    def test_close_interrupts_consumer(self):
+        stream = EventBufferStream[int]()
+
+        threading.Timer(0.05, stream.close).start()
+
+        self.assertRaises(InterruptedError, stream.poll, 5.0)
+        self.assertFalse(stream.put(1))
+
+    def test_producer_consumer(self):
+        count = 20_000
+        stream = EventBufferStream[int](count)
+        received = []
+
+        def consume():
+            while len(received) < count:
+                received.extend(stream.flush(5.0))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+
+        for value in range(count):
+            stream.put(value)
+            if value % 1_000 == 0:
+                time.sleep(0.001)
+
+        consumer.join()
+
+        self.assertEqual(received, list(range(count)))
+
+
+if __name__ == '__main__':
+    unittest.main()
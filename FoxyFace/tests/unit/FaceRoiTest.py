@@ -0,0 +1,62 @@
+import unittest
+
+import numpy
+from mediapipe.tasks.python.components.containers.landmark import NormalizedLandmark
+from mediapipe.tasks.python.vision.face_landmarker import FaceLandmarkerResult
+
+from src.stream.mediapipe.core.FaceRoi import FaceRoi
+from src.stream.mediapipe.core.FaceRoiTracker import FaceRoiTracker
+
+
+def _face(left: float, top: float, right: float, bottom: float) -> list[NormalizedLandmark]:
+    return [NormalizedLandmark(x=left, y=top, z=0.0), NormalizedLandmark(x=right, y=bottom, z=0.0)]
+
+
+class FaceRoiTest(unittest.TestCase):
+    def test_remap_landmarks(self):
+        roi = FaceRoi(480, 270, 960, 540, 1920, 1080)
+        frame = numpy.zeros((1080, 1920, 3), dtype=numpy.uint8)
+
+        self.assertEqual(roi.crop(frame).shape, (540, 960, 3))
+
+        result = FaceLandmarkerResult([[NormalizedLandmark(x=0.0, y=1.0, z=0.2)]], [],
+                                      [numpy.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0],
+                                                    [0.0, 0.0, 1.0, -30.0], [0.0, 0.0, 0.0, 1.0]])])
+        remapped = roi.remap(result)
+
+        landmark = remapped.face_landmarks[0][0]
+        self.assertAlmostEqual(landmark.x, 0.25)
+        self.assertAlmostEqual(landmark.y, 0.75)
+        self.assertAlmostEqual(landmark.z, 0.1)
+
+        # Centered region, the face is only moved away by the scale
+        matrix = remapped.facial_transformation_matrixes[0]
+        self.assertAlmostEqual(matrix[0, 3], 0.0)
+        self.assertAlmostEqual(matrix[1, 3], 0.0)
+        self.assertAlmostEqual(matrix[2, 3], -60.0)
+
+    def test_tracker(self):
+        tracker = FaceRoiTracker(scale=2.0, min_size=128)
+        self.assertIsNone(tracker.get_roi())
+
+        tracker.update(_face(0.4, 0.4, 0.5, 0.5), 1920, 1080)
+        roi = tracker.get_roi()
+        self.assertIsNotNone(roi)
+        self.assertTrue(roi.contains(0.4 * 1920, 0.4 * 1080, 0.5 * 1920, 0.5 * 1080, 0.0))
+        self.assertAlmostEqual(roi.width / roi.height, 1920 / 1080, places=2)
+
+        # Small movement keeps the region
+        tracker.update(_face(0.41, 0.41, 0.51, 0.51), 1920, 1080)
+        self.assertIs(tracker.get_roi(), roi)
+
+        # The face near the border moves it
+        tracker.update(_face(0.6, 0.6, 0.7, 0.7), 1920, 1080)
+        self.assertIsNot(tracker.get_roi(), roi)
+
+        # The face fills the frame
+        tracker.update(_face(0.1, 0.1, 0.9, 0.9), 1920, 1080)
+        self.assertIsNone(tracker.get_roi())
+
+        tracker.update(_face(0.4, 0.4, 0.5, 0.5), 1920, 1080)
+        tracker.reset()
+        self.assertIsNone(tracker.get_roi())
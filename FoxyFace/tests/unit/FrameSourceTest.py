@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2
+import numpy
+
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+from src.stream.camera.source.ImageSequenceFrameSource import ImageSequenceFrameSource
+from src.stream.camera.source.SyntheticFrameSource import SyntheticFrameSource
+
+
+class FrameSourceTest(unittest.TestCase):
+    def test_image_sequence_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for value in (20, 0, 10):
+                cv2.imwrite(str(Path(directory) / f"{value:03}.png"), numpy.full((4, 4, 3), value, numpy.uint8))
+
+            source = ImageSequenceFrameSource(directory, 30.0, FramePacingEnum.AsFastAsPossible, loop=False)
+
+            self.assertEqual([source.read()[0, 0, 0] for _ in range(3)], [0, 10, 20])
+            self.assertFalse(source.is_opened())
+            self.assertIsNone(source.read())
+
+    def test_synthetic_reuses_buffer(self):
+        source = SyntheticFrameSource(320, 240, 30.0, FramePacingEnum.AsFastAsPossible)
+
+        first = source.read()
+        self.assertEqual(first.shape, (240, 320, 3))
+
+        first_copy = first.copy()
+        second = source.read(first)
+
+        self.assertIs(second, first)
+        self.assertFalse(numpy.array_equal(second, first_copy))
+
+
+if __name__ == '__main__':
+    unittest.main()
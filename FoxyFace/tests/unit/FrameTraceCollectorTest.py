@@ -0,0 +1,32 @@
+import unittest
+
+from src.stream.trace.FrameTrace import FrameTrace
+from src.stream.trace.FrameTraceCollector import FrameTraceCollector
+
+
+class FrameTraceCollectorTest(unittest.TestCase):
+    def test_spans(self):
+        trace = FrameTrace("send", 7_000_000, FrameTrace("encode", 4_000_000, FrameTrace("capture", 1_000_000)))
+
+        self.assertEqual(trace.spans(), [("encode", 3_000_000), ("send", 3_000_000)])
+        self.assertEqual(trace.total_ns(), 6_000_000)
+        self.assertIsNone(FrameTrace.extend(None, "encode"))
+
+    def test_stage_order_of_branches(self):
+        collector = FrameTraceCollector(report_interval=0.0)
+
+        root = FrameTrace("capture", 0)
+        mediapipe = FrameTrace("mediapipe", 2_000_000, root)
+        collector.submit(FrameTrace("send", 3_000_000, mediapipe))
+        collector.submit(FrameTrace("send", 9_000_000, FrameTrace("babble", 8_000_000, mediapipe)))
+
+        report = collector.get_report()
+
+        self.assertEqual(list(report), ["mediapipe", "babble", "send", FrameTraceCollector.TOTAL_STAGE])
+        self.assertEqual(report["mediapipe"].count, 2)
+        self.assertEqual(report["babble"].count, 1)
+        self.assertAlmostEqual(report["babble"].p50_ms, 6.0, delta=0.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+import cv2
+import numpy
+
+from src.stream.camera.CameraFrame import CameraFrame
+from src.stream.camera.CameraProcessing import CameraProcessing
+from src.stream.camera.CameraProcessingOption import CameraProcessingOption
+from src.stream.camera.JpegDecoder import JpegDecoder
+from src.stream.core.components.BufferStream import BufferStream
+
+
+class JpegDecoderTest(unittest.TestCase):
+    @staticmethod
+    def __encode(width: int, height: int) -> numpy.ndarray:
+        image = numpy.zeros((height, width, 3), dtype=numpy.uint8)
+        cv2.circle(image, (width // 2, height // 2), height // 4, (40, 120, 200), -1)
+
+        success, encoded = cv2.imencode(".jpg", image)
+        assert success
+
+        return encoded.reshape(-1)
+
+    def test_read_size(self):
+        self.assertEqual(JpegDecoder.read_size(self.__encode(1280, 720)), (1280, 720))
+        self.assertIsNone(JpegDecoder.read_size(numpy.zeros(100, dtype=numpy.uint8)))
+
+    def test_reduced_decode(self):
+        encoded = self.__encode(1280, 720)
+
+        self.assertEqual(JpegDecoder.decode(encoded).shape, (720, 1280, 3))
+        self.assertEqual(JpegDecoder.decode(encoded, 320).shape, (180, 320, 3))
+        self.assertEqual(JpegDecoder.decode(encoded, 400).shape, (360, 640, 3))
+
+    def test_lazy_frame(self):
+        packet = CameraFrame(None, 1, encoded=self.__encode(1280, 720))
+
+        buffer = BufferStream[CameraFrame]()
+        buffer.put(packet)
+
+        result = CameraProcessing(buffer, CameraProcessingOption(max_size=320)).poll(1.0)
+
+        self.assertEqual(result.frame.shape, (180, 320, 3))
+        self.assertIs(result.source, packet)
+
+        # The full frame is decoded only when a consumer asks for it, once
+        self.assertEqual(packet.frame.shape, (720, 1280, 3))
+        self.assertIs(packet.frame, packet.frame)
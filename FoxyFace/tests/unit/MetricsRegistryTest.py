@@ -0,0 +1,74 @@
+import unittest
+
+from src.metrics.CounterMetric import CounterMetric
+from src.metrics.CsvMetricsExporter import CsvMetricsExporter
+from src.metrics.FrameRateMetric import FrameRateMetric
+from src.metrics.LatencyMetric import LatencyMetric
+from src.metrics.MetricsRegistry import MetricsRegistry
+from src.metrics.PrometheusMetricsExporter import PrometheusMetricsExporter
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_frame_rate_and_jitter(self):
+        metric = FrameRateMetric(window=1.0)
+
+        time_ns = 0
+        for index in range(61):
+            metric.mark(time_ns)
+            # Alternating 30 ms and 36 ms intervals
+            time_ns += 30_000_000 if index % 2 == 0 else 36_000_000
+
+        snapshot = metric.snapshot(time_ns - 30_000_000)
+
+        self.assertEqual(snapshot.total_count, 61)
+        self.assertAlmostEqual(snapshot.rate, 1_000 / 33, delta=1.0)
+        self.assertAlmostEqual(snapshot.jitter_ms, 6.0, delta=0.5)
+        self.assertGreater(snapshot.interval.count, 0)
+
+        # The rate decays when the frames stop
+        self.assertAlmostEqual(metric.snapshot(time_ns + 1_000_000_000).rate, 1.0, delta=0.1)
+
+    def test_latency_window(self):
+        metric = LatencyMetric(window=1.0)
+
+        for index in range(100):
+            metric.record(10_000_000 if index < 90 else 50_000_000, index * 10_000_000)
+        metric.record(10_000_000, 1_000_000_000)
+
+        snapshot = metric.snapshot(1_100_000_000)
+
+        self.assertEqual(snapshot.total_count, 101)
+        self.assertAlmostEqual(snapshot.window.p50_ms, 10.0, delta=0.5)
+        self.assertAlmostEqual(snapshot.window.p99_ms, 50.0, delta=2.5)
+        self.assertEqual(metric.snapshot(10_000_000_000).window.count, 0)
+
+    def test_export(self):
+        registry = MetricsRegistry()
+        frames = FrameRateMetric()
+        latency = LatencyMetric()
+        registry.register("camera_frames", "Camera frames", frames)
+        registry.register("babble_latency", "Babble latency", latency)
+        dropped = CounterMetric()
+        registry.register("camera_dropped_frames", "Dropped camera frames", dropped)
+
+        frames.mark()
+        latency.record(1_000_000)
+        dropped.increment(3)
+
+        text = PrometheusMetricsExporter.format(registry)
+
+        self.assertIn("foxyface_camera_frames_total 1\n", text)
+        self.assertIn("# TYPE foxyface_babble_latency_seconds summary\n", text)
+        self.assertIn("foxyface_babble_latency_seconds_count 0\n", text)
+        self.assertIn("# TYPE foxyface_camera_dropped_frames_total counter\n"
+                      "foxyface_camera_dropped_frames_total 3\n", text)
+
+        rows = CsvMetricsExporter.create_rows(registry, 0.0)
+
+        self.assertEqual([row[1] for row in rows], ["camera_frames", "babble_latency", "camera_dropped_frames"])
+        self.assertEqual(rows[2][2], 3)
+        self.assertTrue(all(len(row) == len(CsvMetricsExporter.HEADER) for row in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,9 @@ import unittest
 from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
 from src.stream.core.components.BufferStream import BufferStream
 from src.stream.mediapipe.MediaPipeBlendShapeEnum import MediaPipeBlendShapeEnum
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
 from src.stream.postprocessing.BlendShapesFrame import BlendShapesFrame
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
 from src.stream.postprocessing.GeneralBlendShapeEnum import GeneralBlendShapeEnum
 from src.stream.postprocessing.mixer.MixSelectEnum import MixSelectEnum
 from src.stream.postprocessing.mixer.MixerProcessing import MixerProcessing
@@ -78,6 +80,38 @@ class MixerProcessingTest(unittest.TestCase):
             GeneralBlendShapeEnum.CheekPuffRight) is not None))
         self.assertTrue(result.timestamp_ns == 0)
 
+    def test_dense(self):
+        media_pipe_frame = DenseBlendShapesFrame.from_blend_shapes(BlendShapeSlots.of(MediaPipeBlendShapeEnum), {
+            MediaPipeBlendShapeEnum.MouthUpperUpLeft: 0.5, MediaPipeBlendShapeEnum.JawOpen: 0.3}, 1)
+        babble_frame = DenseBlendShapesFrame.from_blend_shapes(BlendShapeSlots.of(BabbleBlendShapeEnum), {
+            BabbleBlendShapeEnum.MouthUpperUpLeft: 0.1, BabbleBlendShapeEnum.JawOpen: 0.2}, 2)
+        options = MixerProcessingOptions({GeneralBlendShapeEnum.MouthUpperUpLeft: MixSelectEnum.MediaPipe,
+                                          GeneralBlendShapeEnum.JawOpen: MixSelectEnum.Babble})
+
+        single_buffer = BufferStream[DenseBlendShapesFrame[MediaPipeBlendShapeEnum | BabbleBlendShapeEnum]]()
+        single_buffer.put(media_pipe_frame)
+        single_buffer.put(babble_frame)
+        result = MixerProcessing(single_buffer, options).poll(1)
+
+        self.assertEqual(result.blend_shapes,
+                         {GeneralBlendShapeEnum.MouthUpperUpLeft: 0.5, GeneralBlendShapeEnum.JawOpen: 0.2})
+        self.assertEqual(result.timestamps_ns[result.slots.index(GeneralBlendShapeEnum.MouthUpperUpLeft)], 1)
+        self.assertEqual(result.timestamps_ns[result.slots.index(GeneralBlendShapeEnum.JawOpen)], 2)
+        self.assertTrue(result.timestamp_ns == 2)
+
+    def test_routing_table_recompiled_on_change(self):
+        options = MixerProcessingOptions({GeneralBlendShapeEnum.JawOpen: MixSelectEnum.Babble})
+        routing_table = options.get_routing_table()
+
+        self.assertIs(options.get_routing_table(), routing_table)
+        self.assertIn(BabbleBlendShapeEnum.JawOpen, routing_table.member_routes)
+
+        options.enable = {GeneralBlendShapeEnum.JawOpen: MixSelectEnum.MediaPipe}
+
+        self.assertIsNot(options.get_routing_table(), routing_table)
+        self.assertNotIn(BabbleBlendShapeEnum.JawOpen, options.get_routing_table().member_routes)
+        self.assertIn(MediaPipeBlendShapeEnum.JawOpen, options.get_routing_table().member_routes)
+
 
 if __name__ == '__main__':
     unittest.main()
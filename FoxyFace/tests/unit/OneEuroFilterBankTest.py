@@ -0,0 +1,49 @@
+import unittest
+
+import numpy
+from OneEuroFilter import OneEuroFilter
+
+from src.stream.postprocessing.filter.BlendShapesOneEuroFilterOptions import BlendShapesOneEuroFilterOptions
+from src.stream.postprocessing.filter.OneEuroFilterBank import OneEuroFilterBank
+
+
+class OneEuroFilterBankTest(unittest.TestCase):
+    def test_same_as_one_euro_filter(self):
+        random = numpy.random.default_rng(0)
+        options = BlendShapesOneEuroFilterOptions(mincutoff=0.9, beta=0.9, dcutoff=1.0)
+
+        bank = OneEuroFilterBank(4, options)
+        filters = [OneEuroFilter(30, options.mincutoff, options.beta, options.dcutoff) for _ in range(4)]
+
+        for step in range(100):
+            if step == 50:
+                options.mincutoff = 2.0
+                options.beta = 0.1
+                for one_euro_filter in filters:
+                    one_euro_filter.setMinCutoff(options.mincutoff)
+                    one_euro_filter.setBeta(options.beta)
+
+            values = random.random(4)
+            mask = random.random(4) > 0.3
+            timestamp = 1.0 + step / 30.0 + random.random() * 0.01
+
+            result = bank.filter(values, mask, numpy.full(4, timestamp))
+
+            for index in range(4):
+                if mask[index]:
+                    self.assertAlmostEqual(result[index], filters[index].filter(values[index], timestamp))
+                else:
+                    self.assertEqual(result[index], values[index])
+
+    def test_reset(self):
+        bank = OneEuroFilterBank(1, BlendShapesOneEuroFilterOptions())
+        mask = numpy.ones(1, dtype=numpy.bool_)
+
+        bank.filter(numpy.zeros(1), mask, numpy.full(1, 1.0))
+        bank.reset()
+
+        self.assertEqual(bank.filter(numpy.ones(1), mask, numpy.full(1, 2.0))[0], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
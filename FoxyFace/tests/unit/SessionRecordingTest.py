@@ -0,0 +1,141 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy
+
+from src.stream.babble.BabbleBlendShapeEnum import BabbleBlendShapeEnum
+from src.stream.camera.source.FramePacingEnum import FramePacingEnum
+from src.stream.core.components.EventBufferStream import EventBufferStream
+from src.stream.mediapipe.MediaPipeBlendShapeEnum import MediaPipeBlendShapeEnum
+from src.stream.postprocessing.BlendShapeSlots import BlendShapeSlots
+from src.stream.postprocessing.DenseBlendShapesFrame import DenseBlendShapesFrame
+from src.stream.recording.BlendShapesRecorderStream import BlendShapesRecorderStream
+from src.stream.recording.SessionReader import SessionReader
+from src.stream.recording.SessionReplay import SessionReplay
+from src.stream.recording.SessionWriter import SessionWriter
+
+_babble_slots = BlendShapeSlots.of(BabbleBlendShapeEnum)
+_media_pipe_slots = BlendShapeSlots.of(MediaPipeBlendShapeEnum)
+
+
+class SessionRecordingTest(unittest.TestCase):
+    def setUp(self):
+        self.__directory = tempfile.TemporaryDirectory()
+        self.__path = Path(self.__directory.name) / "session"
+
+    def tearDown(self):
+        self.__directory.cleanup()
+
+    def __record(self) -> list[DenseBlendShapesFrame]:
+        rng = numpy.random.default_rng(1)
+        frames = []
+
+        with SessionWriter(self.__path) as writer:
+            babble = BlendShapesRecorderStream(writer, "babble", _babble_slots)
+            media_pipe = BlendShapesRecorderStream(writer, "mediapipe", _media_pipe_slots)
+
+            for index in range(20):
+                mask = rng.random(len(_babble_slots)) > 0.2
+                frame = DenseBlendShapesFrame.from_values(_babble_slots, rng.random(len(_babble_slots)), mask,
+                                                          1_000_000 + index * 16_000_000)
+                self.assertTrue(babble.put(frame))
+                frames.append(frame)
+
+                media_pipe.put(DenseBlendShapesFrame.from_values(_media_pipe_slots, rng.random(len(_media_pipe_slots)),
+                                                                 None, 9_000_000 + index * 16_000_000))
+
+        return frames
+
+    def test_read(self):
+        frames = self.__record()
+
+        track = SessionReader(self.__path).get_track("babble")
+
+        self.assertEqual(track.enum_name, BabbleBlendShapeEnum.__name__)
+        self.assertEqual(len(track), len(frames))
+
+        timestamps, values = track.read_range()
+        self.assertEqual(timestamps.tolist(), [frame.timestamp_ns for frame in frames])
+
+        for row, frame in zip(values, frames):
+            self.assertTrue(numpy.array_equal(~numpy.isnan(row), frame.mask))
+            self.assertTrue(numpy.allclose(row[frame.mask], frame.values[frame.mask]))
+
+    def test_read_while_recording(self):
+        with SessionWriter(self.__path) as writer:
+            BlendShapesRecorderStream(writer, "babble", _babble_slots)
+            media_pipe = BlendShapesRecorderStream(writer, "mediapipe", _media_pipe_slots)
+
+            media_pipe.put(DenseBlendShapesFrame.from_values(_media_pipe_slots, numpy.zeros(len(_media_pipe_slots)),
+                                                             None, 1_000_000))
+            writer.flush()
+
+            # A track that didn't get any frame yet
+            reader = SessionReader(self.__path)
+            self.assertEqual(len(reader.get_track("babble")), 0)
+            self.assertEqual(len(reader.get_track("mediapipe")), 1)
+
+    def test_drop_on_full_queue(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def create_slow_row():
+            started.set()
+            release.wait(5.0)
+
+            return numpy.zeros(1)
+
+        with SessionWriter(self.__path, queue_size=2) as writer:
+            writer.add_track("track", ["a"])
+
+            # The first row blocks the writer thread like a slow disk, the queue fills up behind it
+            writer.append("track", 0, create_slow_row)
+            self.assertTrue(started.wait(5.0))
+
+            for index in range(1, 6):
+                writer.append("track", index, numpy.full(1, index))
+
+            self.assertEqual(writer.dropped_rows, 3)
+
+            release.set()
+
+        timestamps, values = SessionReader(self.__path).get_track("track").read_range()
+        self.assertEqual(timestamps.tolist(), [0, 1, 2])
+        self.assertEqual(values[:, 0].tolist(), [0.0, 1.0, 2.0])
+
+    def test_skip_damaged_track(self):
+        self.__record()
+
+        (self.__path / "babble.fxts").write_bytes(b"")
+
+        with self.assertLogs("src.stream.recording.SessionReader", "WARNING"):
+            reader = SessionReader(self.__path)
+
+        self.assertIsNone(reader.get_track("babble"))
+        self.assertEqual(len(reader.get_track("mediapipe")), 20)
+
+    def test_replay(self):
+        frames = self.__record()
+
+        babble_stream = EventBufferStream[DenseBlendShapesFrame](64)
+        media_pipe_stream = EventBufferStream[DenseBlendShapesFrame](64)
+
+        with SessionReplay(SessionReader(self.__path), {"babble": (_babble_slots, babble_stream),
+                                                        "mediapipe": (_media_pipe_slots, media_pipe_stream)},
+                           FramePacingEnum.AsFastAsPossible) as replay:
+            self.assertTrue(replay.wait(5.0))
+            self.assertEqual(replay.frame_count, 2 * len(frames))
+
+        replayed = babble_stream.flush(1.0)
+        self.assertEqual(len(replayed), len(frames))
+
+        for result, frame in zip(replayed, frames):
+            self.assertTrue(numpy.array_equal(result.mask, frame.mask))
+            self.assertTrue(numpy.allclose(result.values[frame.mask], frame.values[frame.mask]))
+
+        # Moved to the time of the replay, the intervals and the order between the tracks are kept
+        self.assertEqual(numpy.diff([result.timestamp_ns for result in replayed]).tolist(),
+                         numpy.diff([frame.timestamp_ns for frame in frames]).tolist())
+        self.assertEqual(media_pipe_stream.flush(1.0)[0].timestamp_ns - replayed[0].timestamp_ns, 8_000_000)
@@ -0,0 +1,117 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy
+
+from src.timeseries.TimeSeriesFormat import TimeSeriesFormat
+from src.timeseries.TimeSeriesReader import TimeSeriesReader
+from src.timeseries.TimeSeriesWriter import TimeSeriesWriter
+
+
+class TimeSeriesTest(unittest.TestCase):
+    def setUp(self):
+        self.__directory = tempfile.TemporaryDirectory()
+        self.__path = Path(self.__directory.name) / "series.fxts"
+
+    def tearDown(self):
+        self.__directory.cleanup()
+
+    def __write(self, writer: TimeSeriesWriter, start: int, stop: int) -> None:
+        for index in range(start, stop):
+            writer.append(index * 10, [index, -index, numpy.nan])
+
+    def test_chunks(self):
+        with TimeSeriesWriter(self.__path, ["a", "b", "c"], "TestEnum", {"fps": 60}, chunk_rows=4) as writer:
+            self.__write(writer, 0, 10)
+
+        reader = TimeSeriesReader(self.__path)
+
+        self.assertEqual(reader.columns, ("a", "b", "c"))
+        self.assertEqual(reader.enum_name, "TestEnum")
+        self.assertEqual(reader.metadata, {"fps": 60})
+        self.assertEqual(len(reader), 10)
+
+        index = reader.chunk_index
+        self.assertEqual(index["row_count"].tolist(), [4, 4, 2])
+        self.assertEqual(index["min_timestamp"].tolist(), [0, 40, 80])
+        self.assertEqual(index["max_timestamp"].tolist(), [30, 70, 90])
+
+        timestamp, values = reader.read_row(5)
+        self.assertEqual(timestamp, 50)
+        self.assertEqual(values[:2].tolist(), [5.0, -5.0])
+        self.assertTrue(numpy.isnan(values[2]))
+
+        timestamps, values = reader.read_range(3, 9)
+        self.assertEqual(timestamps.tolist(), [30, 40, 50, 60, 70, 80])
+        self.assertEqual(values[:, 0].tolist(), [3, 4, 5, 6, 7, 8])
+
+        timestamps, _ = reader.read_time_range(25, 75)
+        self.assertEqual(timestamps.tolist(), [30, 40, 50, 60, 70])
+
+        self.assertEqual(reader.read_column("b").tolist(), [-index for index in range(10)])
+
+    def test_open_file(self):
+        with TimeSeriesWriter(self.__path, ["a", "b", "c"], chunk_rows=4) as writer:
+            self.__write(writer, 0, 6)
+            writer.flush()
+            self.__write(writer, 6, 7)
+
+            # Only the flushed rows are visible, the unflushed row is in memory
+            reader = TimeSeriesReader(self.__path)
+            self.assertEqual(len(reader), 6)
+            self.assertEqual(reader.read_timestamps().tolist(), [0, 10, 20, 30, 40, 50])
+
+        self.assertEqual(len(reader), 6)
+        self.assertEqual(len(TimeSeriesReader(self.__path)), 7)
+
+    def test_open_file_without_rows(self):
+        with TimeSeriesWriter(self.__path, ["a", "b", "c"], "TestEnum", chunk_rows=4):
+            reader = TimeSeriesReader(self.__path)
+
+            self.assertEqual(reader.columns, ("a", "b", "c"))
+            self.assertEqual(reader.enum_name, "TestEnum")
+            self.assertEqual(len(reader), 0)
+            self.assertEqual(reader.read_timestamps().tolist(), [])
+
+    def test_partial_rows(self):
+        with TimeSeriesWriter(self.__path, ["a", "b", "c"], chunk_rows=4) as writer:
+            self.__write(writer, 0, 6)
+
+        header_size = int.from_bytes(self.__path.read_bytes()[8:12], "little")
+        chunk_dtype = TimeSeriesFormat.get_chunk_dtype(4, 3)
+
+        # Rows written after the last row count, as if the writer was killed before it wrote the chunk header
+        chunks = numpy.memmap(self.__path, dtype=chunk_dtype, mode="r+", offset=header_size, shape=(2,))
+        chunks[1]["timestamps"][2:] = [-1, -1]
+        chunks[1]["values"][2:] = 1e9
+        chunks.flush()
+        del chunks
+
+        reader = TimeSeriesReader(self.__path)
+        self.assertEqual(len(reader), 6)
+        self.assertEqual(reader.read_timestamps().tolist(), [0, 10, 20, 30, 40, 50])
+        self.assertEqual(reader.read_time_range(-10, 100)[0].tolist(), [0, 10, 20, 30, 40, 50])
+        del reader
+
+        # A damaged row count can't expose the rows after the chunk
+        chunks = numpy.memmap(self.__path, dtype=chunk_dtype, mode="r+", offset=header_size, shape=(2,))
+        chunks[1]["row_count"] = 1000
+        chunks.flush()
+        del chunks
+
+        self.assertEqual(len(TimeSeriesReader(self.__path)), 8)
+
+        # A chunk cut off by the end of the file is ignored
+        with open(self.__path, "r+b") as file:
+            file.truncate(header_size + chunk_dtype.itemsize + TimeSeriesFormat.CHUNK_HEADER_SIZE + 8)
+
+        reader = TimeSeriesReader(self.__path)
+        self.assertEqual(len(reader), 4)
+        self.assertEqual(reader.read_timestamps().tolist(), [0, 10, 20, 30])
+
+    def test_invalid_file(self):
+        self.__path.write_bytes(b"\0" * 128)
+
+        with self.assertRaises(ValueError):
+            TimeSeriesReader(self.__path)
@@ -0,0 +1,48 @@
+import struct
+import unittest
+
+import numpy
+
+from src.stream.vrcft.VrcftBinaryPacket import VrcftBinaryPacket
+from src.stream.vrcft.VrcftInterfaceOptions import VrcftInterfaceOptions
+
+
+class VrcftBinaryPacketTest(unittest.TestCase):
+    def test_layout(self):
+        values = numpy.array([0.25, 0.5, -0.75, 1.0, 0.0, 0.125, 0.0, 0.0, 0.0, 0.375])
+        present = numpy.array([True, False, True, False, False, True, False, False, False, True])
+        options = VrcftInterfaceOptions(udp_read_timeout_ms=1234, bypass_other_modules_block=True,
+                                        binary_protocol_version=VrcftBinaryPacket.VERSION)
+
+        packet = VrcftBinaryPacket.encode(987654321, options, values, present)
+
+        magic, version, flags, _, timeout, timestamp, count = struct.unpack_from("<3sBBBHqH", packet)
+        self.assertEqual(magic, VrcftBinaryPacket.MAGIC)
+        self.assertEqual(version, VrcftBinaryPacket.VERSION)
+        self.assertEqual(flags, VrcftBinaryPacket.FLAG_BYPASS_OTHER_MODULES_BLOCK)
+        self.assertEqual(timeout, 1234)
+        self.assertEqual(timestamp, 987654321)
+        self.assertEqual(count, 10)
+
+        bitmap = numpy.frombuffer(packet, dtype=numpy.uint8, count=2, offset=18)
+        decoded_present = numpy.unpackbits(bitmap, count=count, bitorder="little").astype(numpy.bool_)
+        numpy.testing.assert_array_equal(decoded_present, present)
+
+        decoded_values = numpy.frombuffer(packet, dtype="<f4", offset=20)
+        numpy.testing.assert_array_equal(decoded_values, values[present])
+
+    def test_quantized(self):
+        values = numpy.linspace(-1.0, 1.0, 101)
+        present = numpy.ones(len(values), dtype=numpy.bool_)
+        options = VrcftInterfaceOptions(binary_protocol_version=VrcftBinaryPacket.VERSION, quantize_values=True)
+
+        packet = VrcftBinaryPacket.encode(0, options, values, present)
+
+        self.assertEqual(packet[4], VrcftBinaryPacket.FLAG_QUANTIZED)
+
+        decoded_values = VrcftBinaryPacket.dequantize(numpy.frombuffer(packet, dtype="<u2", offset=18 + 13))
+        numpy.testing.assert_allclose(decoded_values, values, atol=1.0 / 32767.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy
+
+from src.stream.vrcft.VrcftDeltaCompressor import VrcftDeltaCompressor
+from src.stream.vrcft.VrcftInterfaceOptions import VrcftInterfaceOptions
+
+
+class VrcftDeltaCompressorTest(unittest.TestCase):
+    def test_delta_against_keyframe(self):
+        options = VrcftInterfaceOptions(delta_encoding=True, delta_epsilon=0.01, keyframe_interval_ms=1_000,
+                                        static_packet_interval_ms=100)
+        compressor = VrcftDeltaCompressor(8)
+        present = numpy.ones(8, dtype=numpy.bool_)
+        values = numpy.linspace(0.0, 0.7, 8)
+
+        mask, delta = compressor.compress(values, present, options, 0)
+        self.assertFalse(delta)
+        numpy.testing.assert_array_equal(mask, present)
+        keyframe_id = compressor.keyframe_id
+
+        # Static values are skipped until the static packet interval
+        self.assertIsNone(compressor.compress(values + 0.005, present, options, 10_000_000))
+        mask, delta = compressor.compress(values + 0.005, present, options, 100_000_000)
+        self.assertTrue(delta)
+        self.assertFalse(mask.any())
+
+        changed = values.copy()
+        changed[2] += 0.5
+        mask, delta = compressor.compress(changed, present, options, 120_000_000)
+        self.assertTrue(delta)
+        numpy.testing.assert_array_equal(numpy.flatnonzero(mask), [2])
+
+        # Deltas are relative to the keyframe, not to the previous delta
+        changed[5] += 0.5
+        mask, delta = compressor.compress(changed, present, options, 140_000_000)
+        self.assertTrue(delta)
+        numpy.testing.assert_array_equal(numpy.flatnonzero(mask), [2, 5])
+        self.assertEqual(compressor.keyframe_id, keyframe_id)
+
+        mask, delta = compressor.compress(changed, present, options, 1_000_000_000)
+        self.assertFalse(delta)
+        self.assertNotEqual(compressor.keyframe_id, keyframe_id)
+
+    def test_large_delta_is_keyframe(self):
+        options = VrcftInterfaceOptions(delta_encoding=True)
+        compressor = VrcftDeltaCompressor(4)
+        present = numpy.ones(4, dtype=numpy.bool_)
+
+        compressor.compress(numpy.zeros(4), present, options, 0)
+        mask, delta = compressor.compress(numpy.full(4, 0.5), present, options, 1_000_000)
+
+        self.assertFalse(delta)
+        numpy.testing.assert_array_equal(mask, present)
+
+
+if __name__ == '__main__':
+    unittest.main()
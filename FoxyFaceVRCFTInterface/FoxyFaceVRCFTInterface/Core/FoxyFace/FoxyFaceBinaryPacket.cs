@@ -0,0 +1,98 @@
+﻿using System.Buffers.Binary;
+
+namespace FoxyFaceVRCFTInterface.Core.FoxyFace;
+
+/// <summary>
+/// Parser of the compact binary packet, the layout is described in VrcftBinaryPacket.py of the FoxyFace app.
+/// JSON packets start with '{', so the magic can't be confused with them.
+/// </summary>
+public static class FoxyFaceBinaryPacket
+{
+    public const byte Version = 2;
+
+    private const int HeaderSize = 18;
+    private const byte FlagQuantized = 1;
+    private const byte FlagBypassOtherModulesBlock = 2;
+    private const byte FlagDelta = 4;
+
+    // UnifiedExpressionEnum order of the FoxyFace app, new names are added only to the end
+    private static readonly string[] ExpressionNames =
+    {
+        "EyeSquintRight", "EyeSquintLeft", "EyeWideRight", "EyeWideLeft", "BrowPinchRight", "BrowPinchLeft",
+        "BrowLowererRight", "BrowLowererLeft", "BrowInnerUpRight", "BrowInnerUpLeft", "BrowOuterUpRight",
+        "BrowOuterUpLeft", "NasalDilationRight", "NasalDilationLeft", "NasalConstrictRight", "NasalConstrictLeft",
+        "CheekSquintRight", "CheekSquintLeft", "CheekPuffRight", "CheekPuffLeft", "CheekSuckRight", "CheekSuckLeft",
+        "JawOpen", "JawRight", "JawLeft", "JawForward", "JawBackward", "JawClench", "JawMandibleRaise", "MouthClosed",
+        "LipSuckUpperRight", "LipSuckUpperLeft", "LipSuckLowerRight", "LipSuckLowerLeft", "LipSuckCornerRight",
+        "LipSuckCornerLeft", "LipFunnelUpperRight", "LipFunnelUpperLeft", "LipFunnelLowerRight", "LipFunnelLowerLeft",
+        "LipPuckerUpperRight", "LipPuckerUpperLeft", "LipPuckerLowerRight", "LipPuckerLowerLeft", "MouthUpperUpRight",
+        "MouthUpperUpLeft", "MouthUpperDeepenRight", "MouthUpperDeepenLeft", "NoseSneerRight", "NoseSneerLeft",
+        "MouthLowerDownRight", "MouthLowerDownLeft", "MouthUpperRight", "MouthUpperLeft", "MouthLowerRight",
+        "MouthLowerLeft", "MouthCornerPullRight", "MouthCornerPullLeft", "MouthCornerSlantRight",
+        "MouthCornerSlantLeft", "MouthFrownRight", "MouthFrownLeft", "MouthStretchRight", "MouthStretchLeft",
+        "MouthDimpleRight", "MouthDimpleLeft", "MouthRaiserUpper", "MouthRaiserLower", "MouthPressRight",
+        "MouthPressLeft", "MouthTightenerRight", "MouthTightenerLeft", "TongueOut", "TongueUp", "TongueDown",
+        "TongueRight", "TongueLeft", "TongueRoll", "TongueBendDown", "TongueCurlUp", "TongueSquish", "TongueFlat",
+        "TongueTwistRight", "TongueTwistLeft", "SoftPalateClose", "ThroatSwallow", "NeckFlexRight", "NeckFlexLeft",
+        "EyeXRight", "EyeYRight", "EyeOpennessRight", "EyePupilDiameterMMRight", "EyeXLeft", "EyeYLeft",
+        "EyeOpennessLeft", "EyePupilDiameterMMLeft", "HeadX", "HeadY", "HeadZ", "HeadPitch", "HeadYaw", "HeadRoll"
+    };
+
+    public static bool IsBinaryPacket(byte[] data)
+    {
+        return data.Length >= 4 && data[0] == 'F' && data[1] == 'X' && data[2] == 'F';
+    }
+
+    /// <exception cref="FormatException">If the packet is malformed or its version is not supported</exception>
+    public static FoxyFaceDto Parse(byte[] data)
+    {
+        if (data.Length < HeaderSize || !IsBinaryPacket(data))
+            throw new FormatException("Not a FoxyFace binary packet");
+
+        byte version = data[3];
+        if (version == 0 || version > Version) throw new FormatException("Unsupported binary packet version " + version);
+
+        byte flags = data[4];
+        bool quantized = (flags & FlagQuantized) != 0;
+
+        ushort udpReadTimeoutMs = BinaryPrimitives.ReadUInt16LittleEndian(data.AsSpan(6));
+        long timestamp = BinaryPrimitives.ReadInt64LittleEndian(data.AsSpan(8));
+        int count = BinaryPrimitives.ReadUInt16LittleEndian(data.AsSpan(16));
+
+        int offset = HeaderSize + (count + 7) / 8;
+        if (offset > data.Length) throw new FormatException("Truncated binary packet");
+
+        int valueSize = quantized ? sizeof(ushort) : sizeof(float);
+        var values = new Dictionary<string, float>(Math.Min(count, ExpressionNames.Length));
+
+        for (int i = 0; i < count; i++)
+        {
+            if ((data[HeaderSize + (i >> 3)] & (1 << (i & 7))) == 0) continue;
+
+            if (offset + valueSize > data.Length) throw new FormatException("Truncated binary packet");
+
+            float value = quantized
+                ? BinaryPrimitives.ReadUInt16LittleEndian(data.AsSpan(offset)) / 32767.5f - 1.0f
+                : BinaryPrimitives.ReadSingleLittleEndian(data.AsSpan(offset));
+
+            offset += valueSize;
+
+            // Expressions of a newer app version are skipped
+            if (i < ExpressionNames.Length) values[ExpressionNames[i]] = value;
+        }
+
+        return new FoxyFaceDto
+        {
+            Timestamp = timestamp,
+            Values = values,
+            DeltaPacket = (flags & FlagDelta) != 0,
+            KeyframeId = data[5],
+            Config = new FoxyFaceDto.ConfigDto
+            {
+                UdpReadTimeoutMs = udpReadTimeoutMs,
+                BypassOtherModulesBlock = (flags & FlagBypassOtherModulesBlock) != 0,
+                BinaryProtocolVersion = version
+            }
+        };
+    }
+}
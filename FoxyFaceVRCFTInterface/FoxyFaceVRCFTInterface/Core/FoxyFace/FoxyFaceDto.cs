@@ -7,9 +7,16 @@ public class FoxyFaceDto
     public Dictionary<string, float>? Values { get; init; } = new();
     public ConfigDto? Config { get; init; } = new();
 
+    // Binary packets only, a delta packet contains only the values changed since the keyframe with the same id
+    public bool DeltaPacket { get; init; }
+    public byte KeyframeId { get; init; }
+
     public class ConfigDto
     {
         public ushort UdpReadTimeoutMs { get; init; } = 5_000;
         public bool BypassOtherModulesBlock { get; init; } = false;
+
+        // Version of the binary packets the app sends, 0 if it sends JSON
+        public byte BinaryProtocolVersion { get; init; } = 0;
     }
 }
\ No newline at end of file
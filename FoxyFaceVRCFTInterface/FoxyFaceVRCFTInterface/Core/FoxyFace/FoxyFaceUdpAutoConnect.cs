@@ -18,9 +18,11 @@ public class FoxyFaceUdpAutoConnect : IDisposable
     {
         _udpClient = new UdpClient();
 
-        string packetText = "{\"Port\":" + port + (ModuleVersion.FileVersion == null
-            ? "}"
-            : ",\"InterfaceVersion\":\"" + ModuleVersion.FileVersion + "\"}");
+        string packetText = "{\"Port\":" + port +
+                            ",\"BinaryProtocolVersion\":" + FoxyFaceBinaryPacket.Version +
+                            (ModuleVersion.FileVersion == null
+                                ? "}"
+                                : ",\"InterfaceVersion\":\"" + ModuleVersion.FileVersion + "\"}");
 
         byte[] packet = Encoding.UTF8.GetBytes(packetText);
 
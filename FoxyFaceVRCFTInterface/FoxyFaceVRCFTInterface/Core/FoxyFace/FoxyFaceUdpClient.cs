@@ -15,6 +15,8 @@ public class FoxyFaceUdpClient : IDisposable
     private readonly FoxyFaceUdpAutoConnect? _foxyFaceUdpAutoConnect;
     public ushort SocketPort { get; private set; }
     private long _lastTimestamp;
+    private Dictionary<string, float>? _keyframeValues;
+    private byte _keyframeId;
 
     public int ReceiveTimeoutMillis
     {
@@ -71,8 +73,9 @@ public class FoxyFaceUdpClient : IDisposable
             try
             {
                 byte[] data = _udpClient.Receive(ref _remoteIpEndPoint);
-                string dataStr = System.Text.Encoding.UTF8.GetString(data);
-                FoxyFaceDto? currentPacket = JsonConvert.DeserializeObject<FoxyFaceDto>(dataStr);
+                FoxyFaceDto? currentPacket = FoxyFaceBinaryPacket.IsBinaryPacket(data)
+                    ? FoxyFaceBinaryPacket.Parse(data)
+                    : JsonConvert.DeserializeObject<FoxyFaceDto>(System.Text.Encoding.UTF8.GetString(data));
 
                 if (currentPacket != null && currentPacket.PingPacket)
                 {
@@ -88,7 +91,7 @@ public class FoxyFaceUdpClient : IDisposable
                 {
                     _lastTimestamp = currentPacket.Timestamp;
 
-                    lastPacket = currentPacket;
+                    lastPacket = MergeWithKeyframe(currentPacket) ?? lastPacket;
                 }
             }
             catch (ThreadInterruptedException)
@@ -143,6 +146,39 @@ public class FoxyFaceUdpClient : IDisposable
         _udpClient.Dispose();
     }
 
+    /// <returns>Packet with all values, or null if the keyframe of the delta packet was lost</returns>
+    private FoxyFaceDto? MergeWithKeyframe(FoxyFaceDto packet)
+    {
+        if (!packet.DeltaPacket)
+        {
+            _keyframeValues = packet.Values;
+            _keyframeId = packet.KeyframeId;
+
+            return packet;
+        }
+
+        // Wait for the next keyframe
+        if (_keyframeValues == null || _keyframeId != packet.KeyframeId) return null;
+
+        var values = new Dictionary<string, float>(_keyframeValues);
+        if (packet.Values != null)
+        {
+            foreach (KeyValuePair<string, float> pair in packet.Values)
+            {
+                values[pair.Key] = pair.Value;
+            }
+        }
+
+        return new FoxyFaceDto
+        {
+            Timestamp = packet.Timestamp,
+            Values = values,
+            Config = packet.Config,
+            DeltaPacket = true,
+            KeyframeId = packet.KeyframeId
+        };
+    }
+
     /// <exception cref="Exception">If it can't create UDP Socket</exception>
     private UdpClient TryCreateUdpSocket()
     {